@@ -0,0 +1,261 @@
+# Headless benchmarks of the labeling loop on a synthetic dataset:
+#   python benchmarks/run_benchmarks.py --images 200 --output run.json
+#   python benchmarks/run_benchmarks.py --images 200 --output new.json --compare run.json
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import resource
+import tempfile
+import subprocess
+import tracemalloc
+from os.path import join, dirname, abspath, exists
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+ROOT = dirname(dirname(abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, dirname(abspath(__file__)))
+
+import numpy as np
+from synthetic import generate
+
+
+def percentiles(latencies):
+    values = np.array(latencies) * 1000
+    return {'p50_ms': float(np.percentile(values, 50)),
+            'p95_ms': float(np.percentile(values, 95)),
+            'p99_ms': float(np.percentile(values, 99)),
+            'mean_ms': float(values.mean()),
+            'max_ms': float(values.max())}
+
+
+class Benchmark:
+
+    def __init__(self, memory_samples=5):
+        self.memory_samples = memory_samples
+        self.operations = {}
+
+    def run(self, name, items, func, setup=None):
+        items = list(items)
+        latencies = []
+        start = time.perf_counter()
+        for item in items:
+            if setup is not None:
+                setup(item)
+            t = time.perf_counter()
+            func(item)
+            latencies.append(time.perf_counter() - t)
+        wall = time.perf_counter() - start
+        # a second, shorter pass under tracemalloc so its overhead stays out of the latencies
+        tracemalloc.start()
+        for item in items[:self.memory_samples]:
+            if setup is not None:
+                setup(item)
+            func(item)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        result = {'count': len(latencies)}
+        if latencies:
+            result.update(percentiles(latencies))
+            result['throughput_per_s'] = len(latencies) / sum(latencies)
+        result['wall_s'] = wall
+        result['peak_bytes'] = peak
+        self.operations[name] = result
+        print('{:<24}{:6d}  p50 {:9.2f} ms  p95 {:9.2f} ms  peak {:8.1f} MB'.format(
+            name, len(latencies), result.get('p50_ms', 0), result.get('p95_ms', 0), peak / 1024 ** 2))
+        return result
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=ROOT, stderr=subprocess.DEVNULL,
+                                       text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_settings(data_folder, project_folder):
+    from settings import Settings
+    settings = Settings()
+    settings.project_name = 'benchmark'
+    settings.project_folder = project_folder
+    settings.data_folder = data_folder
+    settings.object_detection_mode = 3
+    settings.object_names = ['lesion']
+    # mammo only, so the view filter is active and volumes are skipped
+    settings.eval_tomo = False
+    settings.save()
+    return settings
+
+
+def polygon(rng, shape, vertices=24):
+    rows, columns = shape
+    center_x, center_y = rng.uniform(0.3, 0.7) * columns, rng.uniform(0.3, 0.7) * rows
+    radius = rng.uniform(0.05, 0.2) * min(rows, columns)
+    angles = np.sort(rng.uniform(0, 2 * np.pi, vertices))
+    radii = radius * rng.uniform(0.7, 1.0, vertices)
+    # vertices are whole pixels, as clicked on the screen
+    xs = np.clip(center_x + radii * np.cos(angles), 0, columns - 1).astype(int)
+    ys = np.clip(center_y + radii * np.sin(angles), 0, rows - 1).astype(int)
+    return [int(x) for x in xs], [int(y) for y in ys]
+
+
+def run(args):
+    from PyQt5.QtWidgets import QApplication, QFileDialog
+    from header_index import HeaderIndex
+    from rasterize import rasterize
+    from error_log import errors
+
+    work = tempfile.mkdtemp(prefix='labeling_bench_')
+    data_folder = args.data or join(work, 'data')
+    project_folder = join(work, 'project')
+    os.makedirs(project_folder)
+    if not args.data:
+        t = time.perf_counter()
+        generate(data_folder, args.images, args.rows, args.columns, args.compressed, args.tomo, args.frames,
+                 args.seed)
+        print('generated {} images in {:.1f} s'.format(args.images, time.perf_counter() - t))
+    rng = np.random.default_rng(args.seed)
+    bench = Benchmark(args.memory_samples)
+
+    # imported after the dataset is generated, startup is timed from this import
+    import main_window
+    from timing import startup
+    app = QApplication.instance() or QApplication(sys.argv)
+    # no start dialog, the project is started below
+    QFileDialog.getExistingDirectory = lambda *a, **k: ''
+    window = main_window.MainWindow()
+    settings = make_settings(data_folder, project_folder)
+    window.start_project(settings)
+    error_count = errors.total()
+    # the application does not print its startup timings, the benchmark does
+    print(startup.report())
+    window.index.update(window.image_list)
+    window.writer.flush()
+    n = len(window.image_list)
+
+    def scan_cold(_):
+        os.remove(join(project_folder, 'manifest.txt'))
+        window.load_data()
+
+    bench.run('load_data_cold', range(args.repeat), scan_cold)
+    bench.run('load_data', range(args.repeat), lambda _: window.load_data())
+
+    def index_path(i):
+        return join(work, 'index_{}.sqlite'.format(i))
+
+    def index_update(i):
+        index = HeaderIndex(index_path(i))
+        index.update(window.image_list, args.workers)
+        index.close()
+
+    bench.run('header_index_update', range(args.repeat), index_update,
+              setup=lambda i: exists(index_path(i)) and os.remove(index_path(i)))
+
+    def filter_forward(i):
+        window.settings.img_idx = i
+        window.filter_forward()
+
+    bench.run('filter_forward', range(n), filter_forward)
+
+    def display(i):
+        window.settings.img_idx = i
+        window.display()
+
+    mammo = [i for i in range(n) if window.passes_filter(i)]
+    sample = mammo[:args.display_samples]
+    bench.run('display_cold', sample, display, setup=lambda i: window.cache.clear())
+
+    def display_next(i):
+        # the annotator's dwell time lets the prefetcher work ahead
+        time.sleep(args.dwell)
+        window.settings.img_idx = i - 1
+        window.display_next()
+
+    bench.run('display_sequential', sample, display_next)
+
+    shape = window.screen.data_array.shape[:2]
+    polygons = [polygon(rng, shape) for _ in range(args.polygons)]
+    bench.run('polygon_mask', polygons, lambda p: rasterize([list(zip(*p))], shape)[0].full_mask(shape))
+    bench.run('rasterize', polygons, lambda p: rasterize([list(zip(*p))], shape))
+
+    def prepare_result(i):
+        window.settings.img_idx = i
+        window.reset_state()
+        window.objects = [{'class': '', 'vertices': [[x, y] for x, y in zip(*polygons[i % len(polygons)])]}]
+
+    bench.run('save_result', sample, lambda i: window.save_result(), setup=prepare_result)
+    bench.run('writer_flush', [None], lambda _: window.writer.flush())
+    bench.run('get_back', sample, lambda i: window.get_back(), setup=lambda i: window.writer.flush())
+
+    window.close()
+    app.processEvents()
+    report = {
+        'meta': {'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                 'commit': git_commit(),
+                 'python': platform.python_version(),
+                 'platform': platform.platform(),
+                 'cpus': os.cpu_count(),
+                 'numpy': np.__version__,
+                 'arguments': vars(args),
+                 'images': n,
+                 'mammo_images': len(mammo)},
+        'startup': dict(startup.marks),
+        'operations': bench.operations,
+        'max_rss_bytes': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        # failures are swallowed by handle_exceptions, so a fast run may just be a broken one
+        'errors': errors.total() - error_count,
+    }
+    if not args.keep:
+        shutil.rmtree(work, ignore_errors=True)
+    return report
+
+
+def compare(report, baseline):
+    print('\n{:<24}{:>12}{:>12}{:>9}'.format('operation', 'base p50', 'p50', 'ratio'))
+    for name, result in report['operations'].items():
+        base = baseline['operations'].get(name)
+        if base is None or 'p50_ms' not in base or 'p50_ms' not in result:
+            continue
+        ratio = result['p50_ms'] / base['p50_ms'] if base['p50_ms'] else float('inf')
+        print('{:<24}{:12.2f}{:12.2f}{:9.2f}'.format(name, base['p50_ms'], result['p50_ms'], ratio))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the labeling loop on a synthetic dataset.')
+    parser.add_argument('--data', default=None, help='existing DICOM folder instead of a synthetic one')
+    parser.add_argument('--images', type=int, default=100)
+    parser.add_argument('--rows', type=int, default=1024)
+    parser.add_argument('--columns', type=int, default=832)
+    parser.add_argument('--compressed', type=float, default=0.25, help='fraction of RLE compressed images')
+    parser.add_argument('--tomo', type=float, default=0.1, help='fraction of multi-frame tomo volumes')
+    parser.add_argument('--frames', type=int, default=16, help='frames per tomo volume')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5, help='runs of the whole-dataset operations')
+    parser.add_argument('--workers', type=int, default=None, help='header index processes')
+    parser.add_argument('--display-samples', type=int, default=50)
+    parser.add_argument('--polygons', type=int, default=200)
+    parser.add_argument('--dwell', type=float, default=0.2, help='seconds spent on each image')
+    parser.add_argument('--memory-samples', type=int, default=5, help='calls traced for peak memory')
+    parser.add_argument('--output', default=None, help='JSON report')
+    parser.add_argument('--compare', default=None, help='earlier JSON report to compare with')
+    parser.add_argument('--keep', action='store_true', help='keep the generated dataset and project')
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    if report['errors']:
+        print('{} errors logged to the project folder during the run'.format(report['errors']))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            compare(report, json.load(f))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
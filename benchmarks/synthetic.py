@@ -0,0 +1,96 @@
+# Generates a synthetic mammography dataset for the benchmarks:
+#   python benchmarks/synthetic.py OUTPUT_FOLDER --images 200 --rows 2294 --columns 1914
+import os
+import argparse
+import numpy as np
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian, RLELossless, generate_uid
+
+MAMMOGRAPHY_STORAGE = '1.2.840.10008.5.1.4.1.1.1.2'
+BREAST_TOMOSYNTHESIS_STORAGE = '1.2.840.10008.5.1.4.1.1.13.1.3'
+
+VIEWS = ['CC', 'MLO']
+LATERALITIES = ['R', 'L']
+MANUFACTURERS = ['HOLOGIC, Inc.', 'GE MEDICAL SYSTEMS', 'SIEMENS']
+
+
+def phantom(rng, rows, columns, frames=1):
+    # smooth breast-like blob on a dark background plus noise, 12 bit
+    y, x = np.mgrid[0:rows, 0:columns]
+    blob = np.exp(-((x / columns) ** 2 * 2 + ((y - rows / 2) / rows) ** 2 * 4))
+    image = blob * 3000 + 200
+    volume = np.empty((frames, rows, columns), dtype=np.uint16)
+    for frame in range(frames):
+        volume[frame] = np.clip(image + rng.normal(0, 40, (rows, columns)), 0, 4095)
+    return volume[0] if frames == 1 else volume
+
+
+def make_dataset(rng, study_uid, view, laterality, rows, columns, frames=1):
+    tomo = frames > 1
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.file_meta.MediaStorageSOPClassUID = BREAST_TOMOSYNTHESIS_STORAGE if tomo else MAMMOGRAPHY_STORAGE
+    ds.file_meta.MediaStorageSOPInstanceUID = generate_uid()
+    ds.SOPClassUID = ds.file_meta.MediaStorageSOPClassUID
+    ds.SOPInstanceUID = ds.file_meta.MediaStorageSOPInstanceUID
+    ds.StudyInstanceUID = study_uid
+    ds.SeriesInstanceUID = generate_uid()
+    ds.Modality = 'MG'
+    ds.ViewPosition = view
+    ds.ImageLaterality = laterality
+    ds.StudyDescription = 'Tomo recon' if tomo else 'Mammo screening'
+    ds.Manufacturer = MANUFACTURERS[rng.integers(len(MANUFACTURERS))]
+    ds.BodyPartExamined = 'BREAST'
+    ds.StudyDate = '2020{:02d}{:02d}'.format(rng.integers(1, 13), rng.integers(1, 29))
+    ds.Rows = rows
+    ds.Columns = columns
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = 'MONOCHROME2'
+    ds.BitsAllocated = 16
+    ds.BitsStored = 12
+    ds.HighBit = 11
+    ds.PixelRepresentation = 0
+    ds.WindowCenter = 2000
+    ds.WindowWidth = 3000
+    if tomo:
+        ds.NumberOfFrames = frames
+    ds.PixelData = phantom(rng, rows, columns, frames).tobytes()
+    return ds
+
+
+def generate(folder, images=100, rows=1024, columns=832, compressed=0.25, tomo=0.1, frames=16, seed=0):
+    rng = np.random.default_rng(seed)
+    paths = []
+    study_uid = None
+    for i in range(images):
+        # four views per study: R/L CC, R/L MLO
+        if i % 4 == 0:
+            study_uid = generate_uid()
+        study_folder = os.path.join(folder, 'study_{:05d}'.format(i // 4))
+        os.makedirs(study_folder, exist_ok=True)
+        is_tomo = rng.random() < tomo
+        ds = make_dataset(rng, study_uid, VIEWS[(i // 2) % 2], LATERALITIES[i % 2], rows, columns,
+                          frames if is_tomo else 1)
+        if not is_tomo and rng.random() < compressed:
+            ds.compress(RLELossless)
+        path = os.path.join(study_folder, 'image_{:06d}.dcm'.format(i))
+        ds.save_as(path, enforce_file_format=True)
+        paths.append(path)
+    return paths
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a synthetic DICOM mammography dataset.')
+    parser.add_argument('folder')
+    parser.add_argument('--images', type=int, default=100)
+    parser.add_argument('--rows', type=int, default=1024)
+    parser.add_argument('--columns', type=int, default=832)
+    parser.add_argument('--compressed', type=float, default=0.25, help='fraction of RLE compressed images')
+    parser.add_argument('--tomo', type=float, default=0.1, help='fraction of multi-frame tomo volumes')
+    parser.add_argument('--frames', type=int, default=16, help='frames per tomo volume')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    paths = generate(args.folder, args.images, args.rows, args.columns, args.compressed, args.tomo,
+                     args.frames, args.seed)
+    print('{} images written to {}'.format(len(paths), args.folder))
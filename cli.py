@@ -0,0 +1,101 @@
+import sys
+import json
+import argparse
+import multiprocessing
+from project import Project
+from timing import format_summary
+from error_log import errors
+from export import FORMATS
+
+
+def scan(project, args):
+    images = project.images(rescan=True)
+    print('{} images'.format(len(images)))
+
+
+def index(project, args):
+    project.images(rescan=args.rescan)
+    updated = project.update_index(args.workers)
+    print('{} headers read, {} images indexed'.format(updated, len(project.images())))
+
+
+def info(project, args):
+    print('project:  {}'.format(project.settings.project_name))
+    print('data:     {}'.format(project.settings.data_folder))
+    print('images:   {}'.format(len(project.images())))
+    print('filtered: {}'.format(len(project.filtered())))
+    print('labeled:  {}'.format(len(project.entries())))
+    leases = project.leases()
+    if leases is not None:
+        print('leases:   {free} free, {leased} leased, {done} done'.format(**leases))
+
+
+def validate(project, args):
+    problems = project.validate(args.workers)
+    for result_id, problem in problems:
+        print('result {}: {}'.format(result_id, problem) if result_id is not None else problem)
+    print('{} problems'.format(len(problems)))
+    return 1 if problems else 0
+
+
+def export(project, args):
+    if args.format == 'csv':
+        print(project.export_csv(args.output))
+        return
+    output, written = project.export(args.format, args.output, args.workers)
+    print('{} images written to {}'.format(written, output))
+
+
+def report(project, args):
+    summary = project.report()
+    if summary is None:
+        print('no timings recorded yet')
+        return 1
+    print(json.dumps(summary, indent=2) if args.json else format_summary(summary))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Labeling tool project operations without the GUI.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    parser_scan = subparsers.add_parser('scan', help='rescan the data folder and extend the image list')
+    parser_scan.set_defaults(func=scan)
+
+    parser_index = subparsers.add_parser('index', help='build or refresh the DICOM header index')
+    parser_index.add_argument('--workers', type=int, default=None, help='processes, all cores by default')
+    parser_index.add_argument('--rescan', action='store_true', help='rescan the data folder first')
+    parser_index.set_defaults(func=index)
+
+    parser_info = subparsers.add_parser('info', help='image, filter and result counts')
+    parser_info.set_defaults(func=info)
+
+    parser_validate = subparsers.add_parser('validate', help='check results against images and region files')
+    parser_validate.add_argument('--workers', type=int, default=None, help='processes, all cores by default')
+    parser_validate.set_defaults(func=validate)
+
+    parser_export = subparsers.add_parser('export', help='write the results as CSV, COCO, YOLO or Pascal VOC')
+    parser_export.add_argument('--format', choices=('csv',) + FORMATS, default='csv')
+    parser_export.add_argument('--output', default=None,
+                               help='defaults to <project>/<project name>.csv or <project>/export/<format>')
+    parser_export.add_argument('--workers', type=int, default=None, help='processes, all cores by default')
+    parser_export.set_defaults(func=export)
+
+    parser_report = subparsers.add_parser('report', help='stage latencies and images per hour of the sessions')
+    parser_report.add_argument('--json', action='store_true', help='print the summary as JSON')
+    parser_report.set_defaults(func=report)
+
+    for subparser in subparsers.choices.values():
+        subparser.add_argument('project', help='project folder containing settings.json')
+
+    args = parser.parse_args(argv)
+    project = Project(args.project)
+    errors.set_folder(args.project)
+    try:
+        return args.func(project, args) or 0
+    finally:
+        project.close()
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,25 @@
+# Regenerates the ui_<name>.py form classes from the Qt Designer files, run after editing a .ui file:
+#   python compile_ui.py
+import os
+from glob import glob
+from os.path import dirname, abspath, splitext
+from PyQt5.uic import compileUi
+
+
+def compile_forms(folder):
+    # compiled from the folder itself, the generated headers name the .ui file without the build path
+    cwd = os.getcwd()
+    os.chdir(folder)
+    try:
+        for ui_path in sorted(glob('*.ui')):
+            name = splitext(ui_path)[0]
+            py_path = 'ui_' + name + '.py'
+            with open(py_path, 'w') as py_file:
+                compileUi(ui_path, py_file)
+            print('{} -> {}'.format(ui_path, py_path))
+    finally:
+        os.chdir(cwd)
+
+
+if __name__ == '__main__':
+    compile_forms(dirname(abspath(__file__)))
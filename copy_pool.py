@@ -0,0 +1,92 @@
+import os
+import threading
+from shutil import copyfile
+from os.path import abspath, lexists
+from concurrent.futures import ThreadPoolExecutor, wait
+
+FICLONE = 0x40049409
+
+COPY_MODES = ('copy', 'hardlink', 'reflink', 'symlink')
+
+
+def reflink(src_path, target_path):
+    import fcntl
+    with open(src_path, 'rb') as src, open(target_path, 'wb') as target:
+        fcntl.ioctl(target.fileno(), FICLONE, src.fileno())
+
+
+def transfer(src_path, target_path, mode='copy'):
+    # files only appear under their final name once complete
+    tmp_path = target_path + '.part'
+    if lexists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        if mode == 'symlink':
+            os.symlink(abspath(src_path), tmp_path)
+        elif mode == 'hardlink':
+            try:
+                os.link(src_path, tmp_path)
+            except OSError:
+                copyfile(src_path, tmp_path)
+        elif mode == 'reflink':
+            try:
+                reflink(src_path, tmp_path)
+            except (OSError, ImportError):
+                copyfile(src_path, tmp_path)
+        else:
+            copyfile(src_path, tmp_path)
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        if lexists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# Copies images into the class folders on a fixed number of threads. Copies are tracked by
+# target so an undo can cancel or wait for them before removing the file.
+class CopyPool:
+
+    def __init__(self, mode='copy', workers=4):
+        self.mode = mode if mode in COPY_MODES else 'copy'
+        self.futures = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def copy(self, src_path, target_path):
+        self.cancel(target_path)
+        # registered before the copy can finish, forget waits for the lock
+        with self.lock:
+            future = self.executor.submit(transfer, src_path, target_path, self.mode)
+            self.futures[target_path] = future
+        future.add_done_callback(lambda f: self.forget(target_path, f))
+
+    def forget(self, target_path, future):
+        with self.lock:
+            if self.futures.get(target_path) is future:
+                del self.futures[target_path]
+
+    def cancel(self, target_path):
+        with self.lock:
+            future = self.futures.pop(target_path, None)
+        if future is not None and not future.cancel():
+            wait([future])
+
+    def remove(self, target_path):
+        self.cancel(target_path)
+        if lexists(target_path):
+            os.remove(target_path)
+            return True
+        return False
+
+    def pending(self):
+        with self.lock:
+            return len(self.futures)
+
+    def flush(self):
+        with self.lock:
+            futures = list(self.futures.values())
+        wait(futures)
+
+    def close(self):
+        self.flush()
+        self.executor.shutdown(wait=True)
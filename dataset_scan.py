@@ -0,0 +1,159 @@
+import os
+import threading
+from glob import glob
+from os.path import join, exists
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from settings import handle_exceptions
+
+
+def scan_dir(path, suffix):
+    # subdirectories come with their (device, inode), linked folders are followed but each
+    # folder is only scanned once so symlink cycles end
+    files = []
+    dirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir():
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    dirs.append((entry.is_symlink(), entry.path, (stat.st_dev, stat.st_ino)))
+                elif entry.name.endswith(suffix):
+                    files.append(entry.path)
+    except OSError:
+        pass
+    # real folders before links to them, a file is listed under its real path where possible
+    return files, [(path, key) for _, path, key in sorted(dirs)]
+
+
+def folder_key(folder):
+    try:
+        stat = os.stat(folder)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+# all files with the extension below the folder, None when the scan was stopped with stop_event
+def scan_folder(folder, extension, workers=8, stop_event=None):
+    suffix = '.' + extension
+    files = []
+    visited = {folder_key(folder)}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(scan_dir, folder, suffix)}
+        while pending:
+            if stop_event is not None and stop_event.is_set():
+                executor.shutdown(wait=False, cancel_futures=True)
+                return None
+            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                found, dirs = future.result()
+                files.extend(found)
+                for path, key in dirs:
+                    if key not in visited:
+                        visited.add(key)
+                        pending.add(executor.submit(scan_dir, path, suffix))
+    return sorted(files)
+
+
+def has_files(folder, extension):
+    suffix = '.' + extension
+    dirs = [folder]
+    visited = {folder_key(folder)}
+    while dirs:
+        files, subdirs = scan_dir(dirs.pop(), suffix)
+        if files:
+            return True
+        for path, key in subdirs:
+            if key not in visited:
+                visited.add(key)
+                dirs.append(path)
+    return False
+
+
+# The image order of a project is persisted in manifest.txt, new files are only ever appended
+# so img_idx keeps pointing at the same image.
+class DatasetScanner:
+
+    def __init__(self, data_folder, extension, project_folder, on_new_files=None):
+        self.data_folder = data_folder
+        self.extension = extension
+        self.path = join(project_folder, 'manifest.txt')
+        self.on_new_files = on_new_files
+        self.files = []
+        self.known = set()
+        self.stop_event = threading.Event()
+        self.thread = None
+        # the first start scans for files added while the project was closed, unless load just
+        # scanned the folder
+        self.scan_due = False
+
+    def load(self, legacy_order=False):
+        self.scan_due = True
+        if exists(self.path):
+            with open(self.path, 'r') as f:
+                self.files = f.read().splitlines()
+        else:
+            if legacy_order:
+                # projects started before the manifest existed were indexed in glob order
+                pattern = join('**', '*.' + self.extension)
+                self.files = glob(join(self.data_folder, pattern), recursive=True)
+            else:
+                self.files = scan_folder(self.data_folder, self.extension)
+                self.scan_due = False
+            self.save()
+        self.known = set(self.files)
+        return list(self.files)
+
+    def save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(''.join(path + '\n' for path in self.files))
+        os.replace(tmp_path, self.path)
+
+    @handle_exceptions
+    def rescan(self, stop_event=None):
+        files = scan_folder(self.data_folder, self.extension, stop_event=stop_event)
+        if files is None:
+            return None
+        new_files = [path for path in files if path not in self.known]
+        if not new_files:
+            return []
+        with open(self.path, 'a') as f:
+            f.write(''.join(path + '\n' for path in new_files))
+        self.files.extend(new_files)
+        self.known.update(new_files)
+        if self.on_new_files is not None:
+            self.on_new_files(new_files)
+        return new_files
+
+    def start(self, watch=False, interval=10):
+        # switching watching off only stops the thread, the folder was scanned when the project started
+        self.stop()
+        scan_now, self.scan_due = self.scan_due, False
+        if not watch and not scan_now:
+            return
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, args=(watch, interval, self.stop_event, scan_now))
+        self.thread.daemon = True
+        self.thread.start()
+
+    def run(self, watch, interval, stop_event, scan_now=True):
+        if scan_now and self.rescan(stop_event) is None:
+            # stopped before the end, the next start scans again
+            self.scan_due = True
+            return
+        while watch and not stop_event.wait(interval):
+            self.rescan(stop_event)
+
+    def stop(self):
+        # stops a running scan and waits for it, so no manifest line is appended after a close or
+        # reopen. The scan ends after the folders being listed, not the whole walk.
+        self.stop_event.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
@@ -0,0 +1,93 @@
+import os
+import hashlib
+import threading
+import subprocess
+from os.path import join, exists
+
+
+def is_compressed(dcm_file):
+    return 'TransferSyntaxUID' in dcm_file.file_meta and dcm_file.file_meta.TransferSyntaxUID.is_compressed
+
+
+# Decompressed copies of compressed DICOM files, stored in the project folder and evicted by
+# last use once they exceed max_bytes. Source files are only ever read.
+class DecodedFileCache:
+
+    def __init__(self, folder, max_bytes=10240 * 1024 ** 2):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        # cache paths being decoded, each file is decoded and counted once however many threads ask
+        self.decoding = {}
+        os.makedirs(folder, exist_ok=True)
+        self.size = sum(entry.stat().st_size for entry in os.scandir(folder) if entry.name.endswith('.dcm'))
+
+    def cache_path(self, path):
+        stat = os.stat(path)
+        key = '{}|{}|{}'.format(path, stat.st_mtime, stat.st_size)
+        return join(self.folder, hashlib.sha1(key.encode()).hexdigest() + '.dcm')
+
+    def read(self, path):
+        import pydicom
+        cached = self.cache_path(path)
+        while True:
+            with self.lock:
+                decoding = self.decoding.get(cached)
+                if decoding is None:
+                    hit = exists(cached)
+                    if not hit:
+                        self.decoding[cached] = threading.Event()
+                    break
+            # decoded on another thread, its copy is read once it is written
+            decoding.wait()
+        if hit:
+            os.utime(cached)
+            return pydicom.dcmread(cached)
+        try:
+            return self.decode(path, cached)
+        finally:
+            with self.lock:
+                self.decoding.pop(cached).set()
+
+    def decode(self, path, cached):
+        import pydicom
+        dcm_file = pydicom.dcmread(path)
+        if not is_compressed(dcm_file):
+            return dcm_file
+        tmp_path = '{}.{}.tmp'.format(cached, threading.get_ident())
+        try:
+            try:
+                dcm_file.decompress()
+                dcm_file.save_as(tmp_path)
+            except Exception as error:
+                # no pixel data handler for this transfer syntax, fall back to DCMTK
+                try:
+                    status = subprocess.call(("dcmdjpeg", path, tmp_path))
+                except OSError:
+                    # DCMTK is not installed, the decode error is the one to report
+                    status = None
+                if status != 0:
+                    raise error
+                dcm_file = pydicom.dcmread(tmp_path)
+            os.replace(tmp_path, cached)
+        finally:
+            if exists(tmp_path):
+                os.remove(tmp_path)
+        with self.lock:
+            self.size += os.path.getsize(cached)
+            if self.size > self.max_bytes:
+                self.evict()
+        return dcm_file
+
+    def evict(self):
+        entries = sorted((entry for entry in os.scandir(self.folder) if entry.name.endswith('.dcm')),
+                         key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:-1]:
+            if self.size <= self.max_bytes:
+                break
+            size = entry.stat().st_size
+            try:
+                os.remove(entry.path)
+            except OSError:
+                continue
+            self.size -= size
@@ -0,0 +1,115 @@
+import os
+import json
+import time
+import atexit
+import threading
+import traceback
+from os.path import join
+
+
+def call_site(func, e):
+    tb = e.__traceback__
+    while tb is not None and tb.tb_next is not None:
+        tb = tb.tb_next
+    line = '{}:{}'.format(os.path.basename(tb.tb_frame.f_code.co_filename), tb.tb_lineno) if tb else ''
+    return '{} {} {}'.format(func.__qualname__, type(e).__name__, line)
+
+
+# Sink of the exceptions caught by handle_exceptions. Repeats are counted per call site, stack
+# traces are kept for the first few per site and interval only, and everything is written to
+# errors.log and errors.json by a background thread so the UI thread never touches the disk.
+# Traces are formatted there too, formatting reads the source files.
+class ErrorLog:
+
+    def __init__(self, folder='.', flush_interval=2.0, traces_per_interval=5, interval=60.0):
+        self.folder = folder
+        self.flush_interval = flush_interval
+        self.traces_per_interval = traces_per_interval
+        self.interval = interval
+        self.sites = {}
+        self.traces = []
+        # set by report, the files are only written when something new came in
+        self.dirty = False
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def report(self, func, e):
+        now = time.time()
+        site = call_site(func, e)
+        with self.lock:
+            stats = self.sites.get(site)
+            if stats is None:
+                stats = self.sites[site] = {'count': 0, 'first': now, 'last': now, 'message': '',
+                                            'window': now, 'traced': 0}
+            stats['count'] += 1
+            stats['last'] = now
+            self.dirty = True
+            stats['message'] = str(e)
+            if now - stats['window'] > self.interval:
+                stats['window'] = now
+                stats['traced'] = 0
+            if stats['traced'] < self.traces_per_interval:
+                stats['traced'] += 1
+                self.traces.append((now, site, e))
+        if self.thread is None:
+            self.start()
+
+    def start(self):
+        with self.lock:
+            if self.thread is not None:
+                return
+            self.thread = threading.Thread(target=self.run)
+            self.thread.daemon = True
+            self.thread.start()
+        atexit.register(self.flush)
+
+    def run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def set_folder(self, folder):
+        self.flush()
+        if folder == self.folder:
+            return
+        try:
+            with open(join(folder, 'errors.json'), 'r') as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            previous = {}
+        with self.lock:
+            self.folder = folder
+            # counts carry over between sessions of a project, earlier ones are in the old folder
+            self.sites = {site: dict(stats, window=0, traced=0) for site, stats in previous.items()}
+
+    def total(self):
+        with self.lock:
+            return sum(stats['count'] for stats in self.sites.values())
+
+    def flush(self):
+        from settings import atomic_open
+        with self.lock:
+            if not self.dirty:
+                return
+            self.dirty = False
+            traces, self.traces = self.traces, []
+            sites = {site: {key: stats[key] for key in ('count', 'first', 'last', 'message')}
+                     for site, stats in self.sites.items()}
+            folder = self.folder
+        try:
+            if traces:
+                text = ''.join('{} {}\n{}'.format(time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)), site,
+                                                  ''.join(traceback.format_exception(type(e), e, e.__traceback__)))
+                               for now, site, e in traces)
+                with open(join(folder, 'errors.log'), 'a') as f:
+                    f.write(text)
+            with atomic_open(join(folder, 'errors.json')) as f:
+                json.dump(sites, f, indent=1)
+        except OSError:
+            # tried again on the next flush
+            with self.lock:
+                self.traces = traces + self.traces
+                self.dirty = True
+
+
+errors = ErrorLog()
@@ -0,0 +1,266 @@
+import os
+import json
+import tempfile
+from os.path import join, basename, splitext
+from xml.sax.saxutils import escape
+from concurrent.futures import ProcessPoolExecutor
+from settings import atomic_open
+from regions import path_key
+
+FORMATS = ('coco', 'yolo', 'voc')
+
+
+def categories(settings):
+    # class labels first, then object names for objects without a class
+    names = []
+    for name in list(settings.class_labels or []) + list(settings.object_names or []) + ['object']:
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def object_category(obj, image_class, class_labels):
+    value = obj.get('class')
+    if isinstance(value, int) and 0 <= value < len(class_labels):
+        return class_labels[value]
+    if obj.get('name'):
+        return obj['name']
+    if isinstance(image_class, int) and 0 <= image_class < len(class_labels):
+        return class_labels[image_class]
+    return 'object'
+
+
+def image_size(path):
+    # (rows, columns) from the file header when the index does not have it, pixels are not decoded
+    try:
+        import pydicom
+        dcm = pydicom.dcmread(path, stop_before_pixels=True)
+        return int(dcm.Rows), int(dcm.Columns)
+    except Exception:
+        pass
+    try:
+        from PIL import Image
+        with Image.open(path) as img:
+            return img.height, img.width
+    except Exception:
+        return None
+
+
+def shapes(entry, size, class_labels):
+    # every object of an entry as (category, kind, pixel coordinates): point [x, y],
+    # box [x0, y0, x1, y1] or polygon [[x, y], ...]
+    rows, columns = size
+    data = entry['data']
+    for obj in data.get('objects', []):
+        category = object_category(obj, data.get('image_class'), class_labels)
+        if obj.get('vertices'):
+            yield category, 'polygon', [[float(x), float(y)] for x, y in obj['vertices']]
+            continue
+        location = obj.get('location')
+        if not location or None in location:
+            continue
+        if len(location) == 2:
+            yield category, 'point', [location[0] * columns, location[1] * rows]
+        elif len(location) == 4:
+            xmin, xmax, ymin, ymax = location
+            yield category, 'box', [xmin * columns, ymin * rows, xmax * columns, ymax * rows]
+
+
+def bounds(kind, coordinates):
+    if kind == 'point':
+        x, y = coordinates
+        return [x, y, x, y]
+    if kind == 'box':
+        return coordinates
+    xs = [x for x, y in coordinates]
+    ys = [y for x, y in coordinates]
+    return [min(xs), min(ys), max(xs), max(ys)]
+
+
+def polygon_area(vertices):
+    area = 0.0
+    for (x0, y0), (x1, y1) in zip(vertices, vertices[1:] + vertices[:1]):
+        area += x0 * y1 - x1 * y0
+    return abs(area) / 2
+
+
+def label_name(entry):
+    # unique per image, data folders often repeat file names across studies. Keyed by path, the
+    # image indices of the workstations of a shared project differ.
+    return '{}_{}'.format(path_key(entry['path']), splitext(basename(entry['path']))[0])
+
+
+def coco_annotations(entry, size, names, image_id):
+    annotations = []
+    for category, kind, coordinates in shapes(entry, size, names):
+        x0, y0, x1, y1 = bounds(kind, coordinates)
+        annotation = {'image_id': image_id,
+                      'category_id': names.index(category) + 1,
+                      'bbox': [x0, y0, x1 - x0, y1 - y0],
+                      'iscrowd': 0}
+        if kind == 'point':
+            annotation.update(keypoints=[x0, y0, 2], num_keypoints=1, area=0)
+        elif kind == 'polygon':
+            annotation.update(segmentation=[[v for vertex in coordinates for v in vertex]],
+                              area=polygon_area(coordinates))
+        else:
+            annotation['area'] = (x1 - x0) * (y1 - y0)
+        annotations.append(annotation)
+    return annotations
+
+
+def yolo_lines(entry, size, names):
+    rows, columns = size
+    lines = []
+    for category, kind, coordinates in shapes(entry, size, names):
+        class_id = names.index(category)
+        if kind == 'polygon':
+            points = ' '.join('{:.6f} {:.6f}'.format(x / columns, y / rows) for x, y in coordinates)
+            lines.append('{} {}'.format(class_id, points))
+        else:
+            # points become boxes without extent
+            x0, y0, x1, y1 = bounds(kind, coordinates)
+            lines.append('{} {:.6f} {:.6f} {:.6f} {:.6f}'.format(class_id, (x0 + x1) / 2 / columns,
+                                                                 (y0 + y1) / 2 / rows, (x1 - x0) / columns,
+                                                                 (y1 - y0) / rows))
+    return lines
+
+
+def voc_xml(entry, size, names):
+    rows, columns = size
+    objects = []
+    for category, kind, coordinates in shapes(entry, size, names):
+        x0, y0, x1, y1 = (int(round(v)) for v in bounds(kind, coordinates))
+        objects.append('  <object>\n'
+                       '    <name>{}</name>\n'
+                       '    <pose>Unspecified</pose>\n'
+                       '    <truncated>0</truncated>\n'
+                       '    <difficult>0</difficult>\n'
+                       '    <bndbox><xmin>{}</xmin><ymin>{}</ymin><xmax>{}</xmax><ymax>{}</ymax></bndbox>\n'
+                       '  </object>\n'.format(escape(category), x0, y0, x1, y1))
+    return ('<annotation>\n'
+            '  <filename>{}</filename>\n'
+            '  <path>{}</path>\n'
+            '  <size><width>{}</width><height>{}</height><depth>1</depth></size>\n'
+            '{}'
+            '</annotation>\n').format(escape(basename(entry['path'])), escape(entry['path']), columns, rows,
+                                      ''.join(objects))
+
+
+def convert_batch(args):
+    # runs in the export processes: COCO parts are returned, YOLO and VOC files are written here
+    fmt, output, names, batch = args
+    images = []
+    annotations = []
+    written = 0
+    for entry, size, image_id in batch:
+        if size is None:
+            size = image_size(entry['path'])
+            if size is None:
+                continue
+        if fmt == 'coco':
+            images.append({'id': image_id, 'file_name': entry['path'], 'height': size[0], 'width': size[1]})
+            annotations.extend(coco_annotations(entry, size, names, image_id))
+        elif fmt == 'yolo':
+            with atomic_open(join(output, 'labels', label_name(entry) + '.txt')) as f:
+                f.write(''.join(line + '\n' for line in yolo_lines(entry, size, names)))
+        elif fmt == 'voc':
+            with atomic_open(join(output, 'Annotations', label_name(entry) + '.xml')) as f:
+                f.write(voc_xml(entry, size, names))
+        written += 1
+    return written, images, annotations
+
+
+def batches(entries, sizes, batch_size):
+    # COCO image ids are numbered by path, the image indices of shared projects differ by workstation.
+    # Every image is exported once, with its first entry, entries should hold one result per image.
+    image_ids = {}
+    batch = []
+    for entry in entries:
+        if not entry['path'] or entry['img_idx'] is None or not entry['data']:
+            # results imported from a CSV have no objects to export
+            continue
+        if entry['path'] in image_ids:
+            continue
+        image_id = image_ids[entry['path']] = len(image_ids) + 1
+        batch.append((entry, sizes(entry), image_id))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# Writes the results streamed from entries as COCO JSON, YOLO txt or Pascal VOC XML. Entries are
+# converted in batches on a process pool with a bounded number of batches in flight, so memory
+# does not grow with the project. sizes(entry) gives the (rows, columns) of an entry's image.
+def export(entries, fmt, output, settings, sizes, workers=None, batch_size=256):
+    names = categories(settings)
+    os.makedirs(output, exist_ok=True)
+    if fmt == 'yolo':
+        os.makedirs(join(output, 'labels'), exist_ok=True)
+        with atomic_open(join(output, 'classes.txt')) as f:
+            f.write(''.join(name + '\n' for name in names))
+    elif fmt == 'voc':
+        os.makedirs(join(output, 'Annotations'), exist_ok=True)
+    coco = CocoWriter(join(output, 'annotations.json'), names) if fmt == 'coco' else None
+    written = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = []
+        limit = 2 * (workers or os.cpu_count() or 1)
+        for batch in batches(entries, sizes, batch_size):
+            in_flight.append(executor.submit(convert_batch, (fmt, output, names, batch)))
+            if len(in_flight) >= limit:
+                written += collect(in_flight.pop(0).result(), coco)
+        for future in in_flight:
+            written += collect(future.result(), coco)
+    if coco is not None:
+        coco.close()
+    return written
+
+
+def collect(result, coco):
+    written, images, annotations = result
+    if coco is not None:
+        coco.add(images, annotations)
+    return written
+
+
+# COCO JSON written incrementally: images go straight to the file, annotations to a temporary
+# file appended at the end, so neither list is ever held in memory.
+class CocoWriter:
+
+    def __init__(self, path, names):
+        self.path = path
+        self.file = open(path + '.part', 'w')
+        self.annotations = tempfile.TemporaryFile('w+', dir=os.path.dirname(path) or '.')
+        self.images = 0
+        self.annotation_id = 0
+        self.file.write('{"info": {"description": "labeling tool export"}, ')
+        self.file.write('"categories": {}, '.format(json.dumps([{'id': i + 1, 'name': name}
+                                                                for i, name in enumerate(names)])))
+        self.file.write('"images": [')
+
+    def add(self, images, annotations):
+        for image in images:
+            self.file.write((', ' if self.images else '') + json.dumps(image))
+            self.images += 1
+        for annotation in annotations:
+            self.annotation_id += 1
+            annotation['id'] = self.annotation_id
+            self.annotations.write((', ' if self.annotation_id > 1 else '') + json.dumps(annotation))
+
+    def close(self):
+        self.file.write('], "annotations": [')
+        self.annotations.seek(0)
+        while True:
+            chunk = self.annotations.read(1 << 20)
+            if not chunk:
+                break
+            self.file.write(chunk)
+        self.annotations.close()
+        self.file.write(']}\n')
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        os.replace(self.path + '.part', self.path)
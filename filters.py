@@ -0,0 +1,173 @@
+import ast
+import functools
+import operator
+import numpy as np
+from header_index import COLUMNS
+
+# Images are filtered with predicates over the header index columns, for example
+#   manufacturer == 'SIEMENS' and study_date >= '20200101'
+#   'recon' in lower(study_description) or frames > 1
+#   laterality in ['L', 'R'] and not body_part == 'BREAST'
+# evaluated for all images at once, one numpy array per column. Missing values are '' in text
+# columns and NaN in numeric ones, so they never match a comparison with a number. projection is
+# view_position, or 'cc mlo' for an image without one, as the CC/MLO choice of a project sees it.
+
+DERIVED = {'projection': lambda header: 'cc mlo' if header.get('view_position') is None else header['view_position']}
+
+NUMERIC = {'mtime', 'size', 'version', 'pixel_offset', 'rows', 'columns', 'frames', 'window_center',
+           'window_width', 'samples_per_pixel', 'bits_allocated', 'bits_stored', 'pixel_representation'}
+
+FUNCTIONS = {'lower': np.char.lower, 'upper': np.char.upper, 'strip': np.char.strip}
+
+COMPARISONS = {ast.Eq: operator.eq, ast.NotEq: operator.ne, ast.Lt: operator.lt, ast.LtE: operator.le,
+               ast.Gt: operator.gt, ast.GtE: operator.ge}
+
+NODES = (ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub, ast.Compare, ast.In,
+         ast.NotIn, ast.Name, ast.Load, ast.Constant, ast.Call, ast.List, ast.Tuple) + tuple(COMPARISONS)
+
+
+def filters_all(settings):
+    return settings.eval_cc and settings.eval_mlo and settings.eval_mammo and settings.eval_tomo
+
+
+def legacy_predicate(settings):
+    # the CC/MLO and mammo/tomo choice of the project. Unless nothing is filtered an image needs a
+    # chosen view, one without a view position is both and one with an empty view position neither.
+    if filters_all(settings):
+        return None
+    views = ["'{}' in lower(projection)".format(view) for view, chosen in
+             (('mlo', settings.eval_mlo), ('cc', settings.eval_cc)) if chosen]
+    tomo = "(frames > 1 or 'recon' in lower(study_description))"
+    kinds = [kind for kind, chosen in (('not ' + tomo, settings.eval_mammo), (tomo, settings.eval_tomo)) if chosen]
+    parts = ['(' + ' or '.join(views) + ')' if views else 'False']
+    if len(kinds) < 2:
+        parts.append(kinds[0] if kinds else 'False')
+    return ' and '.join(parts)
+
+
+# The predicate every image of the project has to match, None when nothing is filtered.
+# Raises ValueError for an expression that is not a valid filter.
+def project_predicate(settings):
+    expressions = [expression for expression in [legacy_predicate(settings)] + list(settings.filters or [])
+                   if expression and expression.strip()]
+    if not expressions:
+        return None
+    return compile_predicate(' and '.join('({})'.format(expression.strip()) for expression in expressions))
+
+
+def compile_predicate(expression):
+    try:
+        tree = ast.parse(expression, mode='eval')
+    except SyntaxError as e:
+        raise ValueError('invalid filter {!r}: {}'.format(expression, e.msg))
+    for node in ast.walk(tree):
+        if not isinstance(node, NODES):
+            raise ValueError('{} not allowed in filter {!r}'.format(type(node).__name__, expression))
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS \
+                    or len(node.args) != 1 or node.keywords:
+                raise ValueError('unknown function in filter {!r}, use one of {}'.format(expression,
+                                                                                         ', '.join(FUNCTIONS)))
+        elif isinstance(node, ast.Name) and node.id not in COLUMNS and node.id not in DERIVED \
+                and node.id not in FUNCTIONS:
+            raise ValueError('unknown column {!r} in filter {!r}'.format(node.id, expression))
+        elif isinstance(node, ast.Constant) and not isinstance(node.value, (str, int, float)):
+            raise ValueError('unsupported value {!r} in filter {!r}'.format(node.value, expression))
+    # the types are checked by evaluating it without any image
+    try:
+        matches(tree, [])
+    except ValueError as e:
+        raise ValueError('invalid filter {!r}: {}'.format(expression, e))
+    return tree
+
+
+def predicate_columns(tree):
+    calls = {id(node.func) for node in ast.walk(tree) if isinstance(node, ast.Call)}
+    return {node.id for node in ast.walk(tree) if isinstance(node, ast.Name) and id(node) not in calls}
+
+
+def number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def header_table(headers, columns):
+    # header index rows as column arrays, rows that are None have every value missing
+    table = {}
+    for column in columns:
+        if column in DERIVED:
+            values = [DERIVED[column](header if header is not None else {}) for header in headers]
+        else:
+            values = [header.get(column) if header is not None else None for header in headers]
+        if column in NUMERIC:
+            table[column] = np.array([number(value) for value in values], dtype=np.float64)
+        else:
+            table[column] = np.array(['' if value is None else str(value) for value in values], dtype=str)
+    return table
+
+
+def is_text(value):
+    return isinstance(value, str) or (isinstance(value, np.ndarray) and value.dtype.kind == 'U')
+
+
+def compare(op, left, right):
+    if isinstance(op, (ast.In, ast.NotIn)):
+        if isinstance(right, list):
+            result = np.isin(left, right)
+        elif is_text(left) and is_text(right):
+            # substring test
+            result = np.char.find(right, left) >= 0
+        else:
+            raise ValueError('"in" needs a list or text on the right')
+        return ~result if isinstance(op, ast.NotIn) else result
+    if isinstance(left, list) or isinstance(right, list) or (is_text(left) != is_text(right)):
+        raise ValueError('cannot compare text with a number or a list')
+    return COMPARISONS[type(op)](left, right)
+
+
+def value(node, table):
+    if isinstance(node, ast.Expression):
+        return value(node.body, table)
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name):
+        return table[node.id]
+    if isinstance(node, (ast.List, ast.Tuple)):
+        items = [value(item, table) for item in node.elts]
+        if any(isinstance(item, np.ndarray) for item in items):
+            raise ValueError('lists may only hold values, not columns')
+        return items
+    if isinstance(node, ast.Call):
+        argument = value(node.args[0], table)
+        if not is_text(argument):
+            raise ValueError('{}() needs a text column'.format(node.func.id))
+        return FUNCTIONS[node.func.id](argument)
+    if isinstance(node, ast.UnaryOp):
+        operand = value(node.operand, table)
+        if isinstance(node.op, ast.USub):
+            return -operand
+        return np.logical_not(operand)
+    if isinstance(node, ast.BoolOp):
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        return functools.reduce(combine, [value(item, table) for item in node.values])
+    if isinstance(node, ast.Compare):
+        result = True
+        left = value(node.left, table)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = value(comparator, table)
+            result = np.logical_and(result, compare(op, left, right))
+            left = right
+        return result
+    raise ValueError('{} not allowed in a filter'.format(type(node).__name__))
+
+
+# Boolean array telling which of the header index rows match a compiled predicate
+def matches(predicate, headers):
+    table = header_table(headers, predicate_columns(predicate))
+    try:
+        result = value(predicate, table)
+    except TypeError as e:
+        raise ValueError('filter cannot be evaluated: {}'.format(e))
+    return np.broadcast_to(np.asarray(result, dtype=bool), (len(headers),)).copy()
@@ -0,0 +1,24 @@
+import sys
+import importlib
+from os.path import join, abspath
+from PyQt5.QtWidgets import QDialog
+
+
+# Sets up a form on widget from its compiled ui_<name>.py module (see compile_ui.py) and falls
+# back to parsing <name>.ui at runtime when the module is missing. Like loadUi, every child
+# widget becomes an attribute of widget.
+def load_form(name, widget=None):
+    if widget is None:
+        widget = QDialog()
+    try:
+        module = importlib.import_module('ui_' + name)
+    except ImportError:
+        from PyQt5.uic import loadUi
+        folder = getattr(sys, '_MEIPASS', abspath('.'))
+        return loadUi(join(folder, name + '.ui'), widget)
+    form_class = next(getattr(module, attr) for attr in dir(module) if attr.startswith('Ui_'))
+    form = form_class()
+    form.setupUi(widget)
+    for attr, value in vars(form).items():
+        setattr(widget, attr, value)
+    return widget
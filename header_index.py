@@ -0,0 +1,153 @@
+import os
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pixel_map import pixel_offset
+
+INDEX_VERSION = 2
+
+# index column: DICOM keyword
+TAGS = {'view_position': 'ViewPosition',
+        'study_description': 'StudyDescription',
+        'laterality': 'ImageLaterality',
+        'study_uid': 'StudyInstanceUID',
+        'manufacturer': 'Manufacturer',
+        'body_part': 'BodyPartExamined',
+        'study_date': 'StudyDate',
+        'rows': 'Rows',
+        'columns': 'Columns',
+        'frames': 'NumberOfFrames',
+        'window_center': 'WindowCenter',
+        'window_width': 'WindowWidth',
+        'samples_per_pixel': 'SamplesPerPixel',
+        'bits_allocated': 'BitsAllocated',
+        'bits_stored': 'BitsStored',
+        'pixel_representation': 'PixelRepresentation'}
+
+COLUMNS = ['path', 'mtime', 'size', 'version', 'transfer_syntax', 'pixel_offset'] + list(TAGS)
+
+
+def tag_value(dcm, keyword):
+    import pydicom
+    if keyword not in dcm:
+        return None
+    value = dcm.data_element(keyword).value
+    if isinstance(value, pydicom.multival.MultiValue):
+        value = value[0] if len(value) else None
+    if isinstance(value, (int, float)) or value is None:
+        return value
+    return str(value)
+
+
+def read_header(path):
+    # a file that is gone or unreadable gives a row without values, read again once it changes
+    header = dict.fromkeys(COLUMNS)
+    header.update(path=path, version=INDEX_VERSION)
+    import pydicom
+    try:
+        stat = os.stat(path)
+        header.update(mtime=stat.st_mtime, size=stat.st_size)
+        with open(path, 'rb') as fp:
+            dcm = pydicom.dcmread(fp, stop_before_pixels=True)
+            if 'TransferSyntaxUID' in dcm.file_meta:
+                header['transfer_syntax'] = str(dcm.file_meta.TransferSyntaxUID)
+                header['pixel_offset'] = pixel_offset(fp, header['transfer_syntax'])
+    except Exception:
+        return header
+    for column, keyword in TAGS.items():
+        header[column] = tag_value(dcm, keyword)
+    if header['laterality'] is None:
+        header['laterality'] = tag_value(dcm, 'Laterality')
+    return header
+
+
+def read_headers(paths):
+    return [read_header(path) for path in paths]
+
+
+# Sidecar SQLite table with the DICOM header of every image, keyed by path and refreshed
+# when the file mtime or size changes. Pixel data is never read.
+class HeaderIndex:
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.closed = False
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.conn:
+            self.conn.execute('CREATE TABLE IF NOT EXISTS headers (path TEXT PRIMARY KEY)')
+            existing = [row[1] for row in self.conn.execute('PRAGMA table_info(headers)')]
+            for column in COLUMNS:
+                if column not in existing:
+                    self.conn.execute('ALTER TABLE headers ADD COLUMN {}'.format(column))
+
+    def get(self, path):
+        # None once the index is closed, prefetch threads may still ask
+        with self.lock:
+            if self.closed:
+                return None
+            row = self.conn.execute('SELECT * FROM headers WHERE path = ?', (path,)).fetchone()
+        if row is not None:
+            return dict(row)
+        header = read_header(path)
+        self.insert([header])
+        return header
+
+    def get_many(self, paths, batch_size=500):
+        # rows of the given paths, None for paths not indexed yet. A few paths are looked up by
+        # path, many in one scan of the table.
+        with self.lock:
+            if self.closed:
+                return [None] * len(paths)
+            if len(paths) > 20 * batch_size:
+                rows = {row['path']: dict(row) for row in self.conn.execute('SELECT * FROM headers')}
+            else:
+                rows = {}
+                for i in range(0, len(paths), batch_size):
+                    batch = paths[i:i + batch_size]
+                    query = 'SELECT * FROM headers WHERE path IN ({})'.format(','.join('?' * len(batch)))
+                    rows.update((row['path'], dict(row)) for row in self.conn.execute(query, batch))
+        return [rows.get(path) for path in paths]
+
+    def insert(self, headers):
+        query = 'INSERT OR REPLACE INTO headers ({}) VALUES ({})'.format(','.join(COLUMNS),
+                                                                       ','.join('?' * len(COLUMNS)))
+        with self.lock:
+            if self.closed:
+                return
+            with self.conn:
+                self.conn.executemany(query, [[h[c] for c in COLUMNS] for h in headers])
+
+    def stale(self, paths):
+        with self.lock:
+            if self.closed:
+                return []
+            known = {row[0]: row[1:] for row in
+                     self.conn.execute('SELECT path, mtime, size, version FROM headers')}
+        stale = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if known.get(path) != (stat.st_mtime, stat.st_size, INDEX_VERSION):
+                stale.append(path)
+        return stale
+
+    def update(self, paths, workers=None, batch_size=256, checked=False):
+        # checked when the paths come from stale() already, so every file is statted only once
+        stale = list(paths) if checked else self.stale(paths)
+        batches = [stale[i:i + batch_size] for i in range(0, len(stale), batch_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for headers in executor.map(read_headers, batches):
+                if self.closed:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+                self.insert(headers)
+        return len(stale)
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self.conn.close()
@@ -0,0 +1,218 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from settings import handle_exceptions
+from windowing import intensity_range
+from pyramid import build_pyramid
+from tomo import read_frame, first_frame
+from pixel_map import map_pixels
+
+
+class DecodedImage:
+
+    def __init__(self, path, data_array, val_min=None, val_max=None):
+        self.path = path
+        self.data_array = data_array
+        self.val_min = val_min
+        self.val_max = val_max
+        self.data_min, self.data_max = intensity_range(data_array)
+        self.levels = build_pyramid(data_array)
+        self.nbytes = self.levels.nbytes
+
+
+def get_windowing(dcm_file):
+    import pydicom
+    if "WindowCenter" in dcm_file and "WindowWidth" in dcm_file:
+        center = dcm_file.WindowCenter
+        width = dcm_file.WindowWidth
+        if isinstance(center, pydicom.multival.MultiValue):
+            center = center[0]
+            width = width[0]
+        val_min = center - 0.5 * width
+        val_max = center + 0.5 * width
+    else:
+        val_min = None
+        val_max = None
+    return val_min, val_max
+
+
+def header_windowing(header):
+    if header.get('window_center') is None or header.get('window_width') is None:
+        return None, None
+    center = float(header['window_center'])
+    width = float(header['window_width'])
+    return center - 0.5 * width, center + 0.5 * width
+
+
+def map_image(key, headers):
+    # uncompressed files are mapped read-only from the page cache instead of read and copied
+    path, frame = key if isinstance(key, tuple) else (key, None)
+    header = headers(path)
+    data_array = map_pixels(header, frame)
+    if data_array is None:
+        return None
+    if data_array.ndim == 3:
+        data_array = data_array[first_frame(len(data_array))]
+    return DecodedImage(key, data_array, *header_windowing(header))
+
+
+def load_image(path, file_extension='dcm', decoder=None, headers=None):
+    # pydicom and PIL are imported on the decode threads, not at startup
+    import pydicom
+    from PIL import Image
+    if headers is not None and file_extension == 'dcm':
+        image = map_image(path, headers)
+        if image is not None:
+            return image
+    if isinstance(path, tuple):
+        # one frame of a volume
+        data_array, header = read_frame(*path, decoder=decoder)
+        return DecodedImage(path, data_array, *get_windowing(header))
+    if file_extension == 'dcm':
+        if decoder is not None:
+            dcm_file = decoder.read(path)
+        else:
+            dcm_file = pydicom.dcmread(path)
+        val_min, val_max = get_windowing(dcm_file)
+        frames = int(dcm_file.get('NumberOfFrames', 1) or 1)
+        if frames > 1:
+            data_array, _ = read_frame(path, first_frame(frames), decoder)
+            return DecodedImage(path, data_array, val_min, val_max)
+        return DecodedImage(path, dcm_file.pixel_array, val_min, val_max)
+    img = Image.open(path)
+    return DecodedImage(path, np.array(img))
+
+
+# LRU of decoded images bounded by their total size in bytes. Images are decoded by a pool
+# of worker threads, get() only blocks on an image that was never prefetched.
+class ImageCache:
+
+    def __init__(self, loader, max_bytes=2048 * 1024 ** 2, workers=4):
+        self.loader = loader
+        self.max_bytes = max_bytes
+        self.images = OrderedDict()
+        self.pending = {}
+        self.pinned = {}
+        self.size = 0
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def get(self, path):
+        with self.lock:
+            if path in self.images:
+                self.images.move_to_end(path)
+                return self.images[path]
+            future = self.pending.get(path)
+            if future is None:
+                future = self.submit(path)
+        return future.result()
+
+    def prefetch(self, path):
+        with self.lock:
+            if path not in self.images and path not in self.pending:
+                self.submit(path)
+
+    def peek(self, path):
+        # the image if it is decoded already, never loads
+        with self.lock:
+            return self.images.get(path)
+
+    def loading(self, path):
+        return path in self.pending
+
+    def pin(self, paths, group='images'):
+        with self.lock:
+            self.pinned[group] = set(paths)
+
+    def is_pinned(self, path):
+        return any(path in paths for paths in self.pinned.values())
+
+    def submit(self, path):
+        future = self.executor.submit(self.load, path)
+        self.pending[path] = future
+        return future
+
+    def load(self, path):
+        try:
+            image = self.loader(path)
+        except Exception:
+            with self.lock:
+                self.pending.pop(path, None)
+            raise
+        with self.lock:
+            self.pending.pop(path, None)
+            if path not in self.images:
+                self.images[path] = image
+                self.size += image.nbytes
+                self.evict()
+        return image
+
+    def evict(self):
+        for path in list(self.images):
+            if self.size <= self.max_bytes:
+                break
+            if self.is_pinned(path):
+                continue
+            self.size -= self.images.pop(path).nbytes
+
+    def clear(self):
+        with self.lock:
+            self.images.clear()
+            self.size = 0
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Walks the navigation order in the navigation direction on a background thread and queues the
+# next images accepted by the view filter. The last visited ones stay pinned in the cache. order
+# lists the image indices in the order they are labeled, key(i) gives the cache key of image i,
+# the path or the (path, frame) a volume opens at.
+class Prefetcher:
+
+    def __init__(self, cache, ahead=4, behind=2, key=None):
+        self.cache = cache
+        self.ahead = ahead
+        self.behind = behind
+        self.key = key
+        self.generation = 0
+        self.walker = ThreadPoolExecutor(max_workers=1)
+
+    def update(self, position, step, order, accept):
+        self.generation += 1
+        self.walker.submit(self.walk, self.generation, position, step, order, accept)
+
+    @handle_exceptions
+    def walk(self, generation, position, step, order, accept):
+        key = self.key or (lambda idx: idx)
+        keep = [key(order[position])]
+        for direction, count in ((step, self.ahead), (-step, self.behind)):
+            i = position
+            found = 0
+            while found < count:
+                if generation != self.generation:
+                    return
+                i += direction
+                if not 0 <= i < len(order):
+                    break
+                if accept(order[i]):
+                    keep.append(key(order[i]))
+                    self.cache.prefetch(key(order[i]))
+                    found += 1
+        self.cache.pin(keep)
+
+    def frames(self, path, frame, frames, step=1):
+        # neighbouring slices of a volume, more of them in the scroll direction
+        keep = [(path, frame)]
+        for direction, count in ((step, self.ahead), (-step, self.behind)):
+            for distance in range(1, count + 1):
+                neighbour = frame + direction * distance
+                if 0 <= neighbour < frames:
+                    keep.append((path, neighbour))
+                    self.cache.prefetch((path, neighbour))
+        self.cache.pin(keep, 'frames')
+
+    def close(self):
+        self.generation += 1
+        self.walker.shutdown(wait=False, cancel_futures=True)
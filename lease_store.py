@@ -0,0 +1,106 @@
+import re
+import time
+import socket
+import getpass
+import sqlite3
+import threading
+
+FREE, LEASED, DONE = 0, 1, 2
+
+
+def worker_id():
+    return '{}@{}'.format(getpass.getuser(), socket.gethostname())
+
+
+def worker_suffix(worker):
+    # usable in file names on every platform
+    return re.sub(r'[^\w.-]', '_', worker)
+
+
+# Images of a shared project handed out to workstations in batches. A lease runs out after
+# timeout seconds without renewal and its images go back to the pool. Every change runs in an
+# IMMEDIATE transaction, so two workstations never lease the same image. Images are keyed by
+# path, the manifest of each workstation may list them in another order, and a workstation only
+# leases the images it has added itself.
+class LeaseStore:
+
+    def __init__(self, path, worker, timeout=1800):
+        self.path = path
+        self.worker = worker
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        # rollback journal, WAL needs shared memory and so does not work on network file systems
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=DELETE')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS leases ('
+                          'path TEXT PRIMARY KEY, '
+                          'state INTEGER DEFAULT 0, '
+                          'owner TEXT, '
+                          'lease_until REAL)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS leases_state ON leases (state, lease_until)')
+        # the images known to this workstation
+        self.conn.execute('CREATE TEMP TABLE IF NOT EXISTS known (path TEXT PRIMARY KEY)')
+
+    def transaction(self, statements):
+        with self.lock:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = statements(self.conn)
+                self.conn.execute('COMMIT')
+            except BaseException:
+                self.conn.execute('ROLLBACK')
+                raise
+        return result
+
+    def add(self, paths):
+        def statements(conn):
+            conn.executemany('INSERT OR IGNORE INTO leases (path) VALUES (?)', ((path,) for path in paths))
+            conn.executemany('INSERT OR IGNORE INTO known (path) VALUES (?)', ((path,) for path in paths))
+        self.transaction(statements)
+
+    def lease(self, size, after=None):
+        # renews the leases of this workstation and adds up to size free or expired images, the
+        # first ones at or after the given path. Returns the paths leased to this workstation, an
+        # image that another workstation took over after the lease ran out is no longer among them.
+        def statements(conn):
+            now = time.time()
+            conn.execute('UPDATE leases SET lease_until = ? WHERE state = ? AND owner = ?',
+                         (now + self.timeout, LEASED, self.worker))
+            if size > 0:
+                free = conn.execute('SELECT leases.path FROM leases JOIN known ON known.path = leases.path '
+                                    'WHERE state = ? OR (state = ? AND lease_until < ?) '
+                                    'ORDER BY leases.rowid < COALESCE((SELECT rowid FROM leases WHERE path = ?), 0), '
+                                    'leases.rowid LIMIT ?', (FREE, LEASED, now, after, size)).fetchall()
+                conn.executemany('UPDATE leases SET state = ?, owner = ?, lease_until = ? WHERE path = ?',
+                                 ((LEASED, self.worker, now + self.timeout, row[0]) for row in free))
+            rows = conn.execute('SELECT path FROM leases WHERE state = ? AND owner = ? ORDER BY rowid',
+                                (LEASED, self.worker))
+            return [row[0] for row in rows]
+        return self.transaction(statements)
+
+    def done(self, path):
+        # a saved result also shows that the workstation is still at work
+        def statements(conn):
+            conn.execute('UPDATE leases SET state = ?, owner = ? WHERE path = ?', (DONE, self.worker, path))
+            conn.execute('UPDATE leases SET lease_until = ? WHERE state = ? AND owner = ?',
+                         (time.time() + self.timeout, LEASED, self.worker))
+        self.transaction(statements)
+
+    def reopen(self, path):
+        # an undone result, leased again to the workstation that undid it
+        self.transaction(lambda conn: conn.execute('UPDATE leases SET state = ?, owner = ?, lease_until = ? '
+                                                   'WHERE path = ?',
+                                                   (LEASED, self.worker, time.time() + self.timeout, path)))
+
+    def release(self):
+        self.transaction(lambda conn: conn.execute('UPDATE leases SET state = ?, owner = NULL, lease_until = NULL '
+                                                   'WHERE state = ? AND owner = ?', (FREE, LEASED, self.worker)))
+
+    def counts(self):
+        with self.lock:
+            counts = dict(self.conn.execute('SELECT state, COUNT(*) FROM leases GROUP BY state').fetchall())
+        return {name: counts.get(state, 0) for name, state in (('free', FREE), ('leased', LEASED), ('done', DONE))}
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
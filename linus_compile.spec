@@ -12,7 +12,8 @@ a = Analysis(['main_window.py'],
 		('/home/mrv6/labeling_tool/*.ui', '.'),
 		('/home/mrv6/labeling_tool/logo_b_rayZ.png', '.')
 	],
-	hiddenimports=["matplotlib", "pkg_resources.py2_warn"],
+	hiddenimports=["matplotlib", "pkg_resources.py2_warn",
+		"ui_main_window", "ui_msg", "ui_start_dialog", "ui_step_1", "ui_step_2", "ui_step_3_4"],
 	hookspath=[],
 	runtime_hooks=[],
 	excludes=[],
@@ -1,31 +1,49 @@
+from timing import startup, SpanLog, summarize, format_summary
 from PyQt5.QtWidgets import QApplication, QMainWindow, QFileDialog, QTableWidgetItem, QHeaderView, QActionGroup, \
-    QPushButton
-from PyQt5.QtGui import QPixmap, QIntValidator
-from PyQt5.uic import loadUi
-from glob import glob
+    QPushButton, QMessageBox
+from PyQt5.QtGui import QPixmap, QIntValidator, QKeySequence
 from os.path import join, isdir, basename, isfile, abspath, exists
 from os import mkdir, remove
 import sys
-from PyQt5.QtCore import pyqtSlot, Qt
-import pydicom
-from shutil import copyfile
+import time
+import getpass
+import multiprocessing
+from PyQt5.QtCore import pyqtSlot, pyqtSignal, Qt, QTimer
 import threading
-from PIL import Image
+import numpy as np
 from tutorial import Tutorial
 from settings import Settings, handle_exceptions
-import subprocess
-import json
-import numpy as np
+from error_log import errors
+from image_cache import ImageCache, Prefetcher, load_image
+from decoder import DecodedFileCache
+from header_index import HeaderIndex
+from filters import project_predicate, matches
+from forms import load_form
+from dataset_scan import DatasetScanner
+from result_store import ResultStore, result_paths, merged_entries, write_csv
+from lease_store import LeaseStore, worker_id, worker_suffix
+from regions import save_regions, save_label_mask, region_path
+from writer import BackgroundWriter
+from copy_pool import CopyPool
+from functools import partial
+from tomo import frame_count, first_frame
+from studies import group_studies
+from study_panel import StudyPanel
+
+startup.mark('imports')
 
 
 class MainWindow(QMainWindow):
+    images_added = pyqtSignal(list)
+    index_updated = pyqtSignal(list)
 
     @handle_exceptions
     def __init__(self):
         super().__init__()
 
         self.folder = getattr(sys, '_MEIPASS', abspath('.'))
-        loadUi(join(self.folder, 'main_window.ui'), self)
+        load_form('main_window', self)
+        startup.mark('main_window_form')
 
         self.settings = None
         self.image_list = []
@@ -34,19 +52,46 @@ class MainWindow(QMainWindow):
         self.one_object_localized = False
         self.all_objects_localized = False
         self.object_idx = 0
-        self.polygons = [] 
+        self.objects = []
+        self.image_class = None
+        self.copies = []
+        self.results = None
+        self.writer = None
+        self.copy_pool = None
+        self.cache = None
+        self.prefetcher = None
+        self.index = None
+        self.scanner = None
+        self.spans = None
+        self.leases = None
+        self.leased = None
+        self.lease_index = None
+        self.direction = 1
+        self.frame = 0
+        self.frame_path = None
+        self.predicate = None
+        self.playlist = np.arange(0)
+        self.positions = {}
+        self.ranks = self.playlist_ranks = np.arange(0)
+        self.unindexed = set()
+        self.studies = []
+        self.study_of = {}
+        self.headers = []
+        self.panel_study = None
 
         self.init_gui()
         self.connect_signals()
 
         self.start_dialog = None
         self.show_start_dialog()
+        startup.mark('first_window')
 
         self.expected_action = None
+        self.first_image_shown = False
 
     @handle_exceptions
     def show_start_dialog(self):
-        self.start_dialog = loadUi(join(self.folder, 'start_dialog.ui'))
+        self.start_dialog = load_form('start_dialog')
         # self.start_dialog.setWindowFlags(self.start_dialog.windowFlags() | Qt.FramelessWindowHint
         #                                  | Qt.WindowStaysOnTopHint | Qt.X11BypassWindowManagerHint)
         self.start_dialog.button_new.clicked.connect(self.new_project)
@@ -65,6 +110,26 @@ class MainWindow(QMainWindow):
         extension_group.addAction(self.actionPNG)
         self.actionDICOM.setChecked(True)
 
+        self.action_watch = self.menuTools.addAction('Watch data folder')
+        self.action_watch.setCheckable(True)
+        self.action_undo = self.menuTools.addAction('Undo')
+        self.action_undo.setShortcut('Ctrl+Z')
+        self.action_redo = self.menuTools.addAction('Redo')
+        self.action_redo.setShortcuts([QKeySequence('Ctrl+Y'), QKeySequence('Ctrl+Shift+Z')])
+        self.action_export = self.menuTools.addAction('Export results')
+        self.action_report = self.menuTools.addAction('Throughput report')
+        self.action_next_study = self.menuTools.addAction('Next study')
+        self.action_next_study.setShortcut('PgDown')
+        self.action_previous_study = self.menuTools.addAction('Previous study')
+        self.action_previous_study.setShortcut('PgUp')
+
+        self.study_panel = StudyPanel(self)
+        self.study_panel.hide()
+        self.horizontalLayout_3.insertWidget(0, self.study_panel)
+        self.thumbnail_timer = QTimer(self)
+        self.thumbnail_timer.setSingleShot(True)
+        self.thumbnail_timer.setInterval(250)
+
         logo = QPixmap(join(self.folder, "logo_b_rayZ.png"))
         self.label_logo.setPixmap(logo)
 
@@ -73,6 +138,18 @@ class MainWindow(QMainWindow):
         self.action_copy.triggered.connect(self.create_folders)
 
         self.action_threshold.triggered.connect(self.display)
+        self.action_watch.toggled.connect(self.set_watch)
+        self.images_added.connect(self.add_images)
+        self.index_updated.connect(self.headers_updated)
+        self.screen.frame_scrolled.connect(self.scroll_frame)
+        self.action_undo.triggered.connect(self.undo)
+        self.action_redo.triggered.connect(self.redo)
+        self.action_export.triggered.connect(self.export_results)
+        self.action_report.triggered.connect(self.show_report)
+        self.action_next_study.triggered.connect(self.next_study)
+        self.action_previous_study.triggered.connect(self.previous_study)
+        self.study_panel.view_selected.connect(self.show_view)
+        self.thumbnail_timer.timeout.connect(self.refresh_thumbnails)
 
         self.button_save_roi.clicked.connect(self.add_location)
         self.button_skip.clicked.connect(self.display_next)
@@ -102,84 +179,330 @@ class MainWindow(QMainWindow):
 
     @handle_exceptions
     def load_data(self):
-        pattern = join('**', '*.' + self.settings.file_extension)
-        path = join(self.settings.data_folder, pattern)
-        self.image_list = glob(path, recursive=True)
+        if self.scanner is not None:
+            self.scanner.stop()
+        self.scanner = DatasetScanner(self.settings.data_folder, self.settings.file_extension,
+                                      self.settings.project_folder, self.images_added.emit)
+        self.image_list = self.scanner.load(legacy_order=self.settings.img_idx > 0)
+        self.scanner.start(self.settings.watch_data, self.settings.scan_interval)
+
+    @pyqtSlot(list)
+    @handle_exceptions
+    def add_images(self, new_files):
+        finished = self.settings.img_idx >= len(self.image_list)
+        last_position = len(self.playlist) - 1
+        self.image_list.extend(new_files)
+        if self.leases is not None:
+            self.leases.add(new_files)
+            for idx in range(len(self.image_list) - len(new_files), len(self.image_list)):
+                self.lease_index.setdefault(self.image_list[idx], idx)
+        self.build_playlist()
+        self.label_total_images.setText(' / ' + str(len(self.playlist)))
+        if self.index is not None:
+            index_thread = threading.Thread(target=self.update_index, args=(new_files,))
+            index_thread.daemon = True
+            index_thread.start()
+        if finished:
+            self.table.setEnabled(True)
+            self.button_save_roi.setEnabled(self.settings.object_detection_mode)
+            # the new images are not indexed yet and follow the ones already in the playlist
+            self.settings.img_idx = self.index_at(last_position)
+            self.reset_state()
+            self.next_step(first_run=True)
+
+    @pyqtSlot(bool)
+    @handle_exceptions
+    def set_watch(self, state):
+        if self.settings is None or self.scanner is None:
+            return
+        self.settings.watch_data = state
+        self.scanner.start(state, self.settings.scan_interval)
+
+    @handle_exceptions
+    def passes_filter(self, idx):
+        if self.leased is not None and idx not in self.leased:
+            return False
+        if idx in self.unindexed:
+            # not in the header index when the playlist was built, read its header now
+            header = self.index.get(self.image_list[idx])
+            return header is None or bool(matches(self.predicate, [header])[0])
+        return idx in self.positions
 
     @handle_exceptions
     def filter_forward(self):
-        if self.settings.eval_cc and self.settings.eval_mlo and self.settings.eval_mammo and self.settings.eval_tomo:
+        if self.leases is not None:
+            self.lease_forward()
             return
-
-        to_skip = True
-        self.settings.img_idx -= 1
-        while (to_skip):
-            self.settings.img_idx += 1
-            filename = self.image_list[self.settings.img_idx]
-            dcm = pydicom.read_file(filename)
-            try:
-                projection = dcm.ViewPosition
-            except:
-                projection = "cc mlo"
-            try:
-                study_description = dcm.StudyDescription
-            except:
-                study_description = "mammo"
-            is_tomo = True if "recon" in study_description.lower() else False
-            mlo = 'mlo' in projection.lower()
-            cc = 'cc' in projection.lower()
-            if ((self.settings.eval_mlo and mlo) or (self.settings.eval_cc and cc)) and \
-                    ((self.settings.eval_mammo and not is_tomo) or (self.settings.eval_tomo and is_tomo)):
-                to_skip = False
+        while self.settings.img_idx < len(self.image_list) and not self.passes_filter(self.settings.img_idx):
+            self.settings.img_idx = self.step_index(self.settings.img_idx, 1)
 
     @handle_exceptions
     def filter_backward(self):
-        if self.settings.eval_cc and self.settings.eval_mlo and self.settings.eval_mammo and self.settings.eval_tomo:
+        while self.position(self.settings.img_idx) > 0 and not self.passes_filter(self.settings.img_idx):
+            self.settings.img_idx = self.step_index(self.settings.img_idx, -1)
+
+    @handle_exceptions
+    def position(self, idx):
+        # place of an image in the playlist; a filtered out image is placed at the next image of the
+        # playlist, positions before the first and after the last image are kept as they are
+        if idx < 0:
+            return idx
+        if idx >= len(self.image_list):
+            return len(self.playlist) + idx - len(self.image_list)
+        if idx in self.positions:
+            return self.positions[idx]
+        return int(np.searchsorted(self.playlist_ranks, self.ranks[idx]))
+
+    @handle_exceptions
+    def index_at(self, position):
+        if position < 0:
+            return position
+        if position >= len(self.playlist):
+            return len(self.image_list) + position - len(self.playlist)
+        return int(self.playlist[position])
+
+    @handle_exceptions
+    def step_index(self, idx, step):
+        position = self.position(idx)
+        if step > 0 and 0 <= idx < len(self.image_list) and idx not in self.positions:
+            # the next image of the playlist is already at the position of a filtered out one
+            position -= 1
+        return self.index_at(position + step)
+
+    @pyqtSlot()
+    @handle_exceptions
+    def build_playlist(self):
+        # image indices in the order they are labeled, without the filtered out images. In study
+        # mode the images of a study follow each other, right before left and CC before MLO.
+        self.panel_study = None
+        self.studies = []
+        self.study_of = {}
+        self.unindexed = set()
+        headers = None
+        if self.index is not None and not self.index.closed and \
+                (self.settings.study_mode or self.predicate is not None):
+            headers = self.indexed_headers()
+        if self.settings.study_mode and headers is not None:
+            self.studies = group_studies(headers)
+            self.study_of = {idx: number for number, study in enumerate(self.studies) for idx in study}
+            order = np.array([idx for study in self.studies for idx in study], dtype=np.int64)
+        else:
+            order = np.arange(len(self.image_list))
+        self.ranks = np.empty(len(order), dtype=np.int64)
+        self.ranks[order] = np.arange(len(order))
+        if self.predicate is not None and headers is not None:
+            missing = np.array([header is None for header in headers], dtype=bool)
+            selected = matches(self.predicate, headers) | missing
+            self.unindexed = set(np.flatnonzero(missing).tolist())
+            order = order[selected[order]]
+        self.playlist = order
+        self.playlist_ranks = self.ranks[order]
+        self.positions = {idx: position for position, idx in enumerate(order.tolist())}
+        if self.first_image_shown and 0 <= self.settings.img_idx < len(self.image_list):
+            self.label_total_images.setText(' / ' + str(len(self.playlist)))
+            self.line_image_idx.setText(str(self.position(self.settings.img_idx) + 1))
+            if self.studies:
+                self.update_study_panel()
+
+    def indexed_headers(self):
+        # header index rows of the image list, only the rows missing at the last build are queried
+        headers = self.headers[:len(self.image_list)]
+        headers += [None] * (len(self.image_list) - len(headers))
+        missing = [idx for idx, header in enumerate(headers) if header is None]
+        for idx, header in zip(missing, self.index.get_many([self.image_list[idx] for idx in missing])):
+            headers[idx] = header
+        self.headers = headers
+        return headers
+
+    @pyqtSlot(list)
+    @handle_exceptions
+    def headers_updated(self, paths):
+        # rows read again by the index are queried again
+        paths = set(paths)
+        for idx, path in enumerate(self.image_list[:len(self.headers)]):
+            if path in paths:
+                self.headers[idx] = None
+        self.build_playlist()
+
+    @handle_exceptions
+    def init_predicate(self):
+        self.predicate = None
+        if self.index is None:
             return
+        try:
+            self.predicate = project_predicate(self.settings)
+        except ValueError as e:
+            QMessageBox.warning(self, 'Filters', 'The filters are ignored: {}'.format(e))
+
+    @handle_exceptions
+    def update_index(self, paths):
+        stale = self.index.stale(paths)
+        self.index.update(stale, checked=True)
+        if not self.index.closed:
+            self.index_updated.emit(stale)
 
-        to_skip = True
-        self.settings.img_idx += 1
-        while (to_skip):
-            self.settings.img_idx -= 1
-            filename = self.image_list[self.settings.img_idx]
-            dcm = pydicom.read_file(filename)
-            try:
-                projection = dcm.ViewPosition
-            except:
-                projection = "cc mlo"
-            try:
-                study_description = dcm.StudyDescription
-            except:
-                study_description = "mammo"
-            is_tomo = True if "recon" in study_description.lower() else False
-            mlo = 'mlo' in projection.lower()
-            cc = 'cc' in projection.lower()
-            if ((self.settings.eval_mlo and mlo) or (self.settings.eval_cc and cc)) and \
-                    ((self.settings.eval_mammo and not is_tomo) or (self.settings.eval_tomo and is_tomo)):
-                to_skip = False
+    def leased_indices(self, paths):
+        return {self.lease_index[path] for path in paths if path in self.lease_index}
+
+    @handle_exceptions
+    def lease_forward(self):
+        # next image leased to this workstation, a new batch is leased once the current one is used up.
+        # The leases are checked on every step, one that ran out may belong to another workstation now.
+        wrapped = False
+        self.leased &= self.leased_indices(self.leases.lease(0))
+        while True:
+            current = self.position(self.settings.img_idx)
+            ahead = [idx for idx in self.leased if self.position(idx) >= current]
+            if not ahead:
+                after = self.image_list[self.settings.img_idx] \
+                    if 0 <= self.settings.img_idx < len(self.image_list) else None
+                # saved results are marked done before the new batch is leased
+                self.writer.flush()
+                self.leased = self.leased_indices(self.leases.lease(self.settings.lease_size, after))
+                ahead = [idx for idx in self.leased if self.position(idx) >= current]
+            if not ahead:
+                if not self.leased or wrapped:
+                    self.settings.img_idx = len(self.image_list)
+                    return
+                # only skipped images left, show them again
+                wrapped = True
+                ahead = list(self.leased)
+            self.settings.img_idx = min(ahead, key=self.position)
+            if self.passes_filter(self.settings.img_idx):
+                return
+            # its header shows it is filtered out on every workstation
+            self.leased.discard(self.settings.img_idx)
+            self.leases.done(self.image_list[self.settings.img_idx])
+
+    @handle_exceptions
+    def init_leases(self):
+        if self.leases is not None:
+            self.leases.release()
+            self.leases.close()
+            self.leases = None
+            self.leased = None
+            self.lease_index = None
+        if not self.settings.shared:
+            return
+        self.leases = LeaseStore(join(self.settings.project_folder, 'leases.sqlite'), worker_id(),
+                                 self.settings.lease_timeout)
+        self.leases.add(self.image_list)
+        self.leased = set()
+        # the manifest may list an image twice after two workstations found it at once
+        self.lease_index = {}
+        for idx, path in enumerate(self.image_list):
+            self.lease_index.setdefault(path, idx)
+        # the position comes from the leases, not from settings.json
+        self.settings.img_idx = 0
 
     @handle_exceptions
     def start_project(self, settings):
+        startup.project_started()
         del self.start_dialog
         self.start_dialog = None
         self.settings = settings
+        errors.set_folder(self.settings.project_folder)
+        self.action_watch.setChecked(self.settings.watch_data)
         self.load_data()
+        self.init_leases()
+        self.init_results()
+        self.init_index()
+        self.init_predicate()
+        self.build_playlist()
+        self.init_cache()
+        self.spans = SpanLog(join(self.settings.project_folder, 'spans.jsonl'), getpass.getuser())
+        startup.mark('project_loaded')
         self.show()
         self.screen.set_mode(self.settings.object_detection_mode)
         self.reset_state()
+        if self.copy_pool is not None:
+            self.copy_pool.close()
+        self.copy_pool = CopyPool(self.settings.copy_mode, self.settings.copy_workers)
         if self.settings.copy_files:
             self.create_folders()
-        # self.create_result_file()
         self.create_buttons()
         if self.settings.class_labels:
             self.fill_class_table()
         self.button_save_roi.setEnabled(self.settings.object_detection_mode)
         self.button_finish_location.setEnabled(self.settings.object_detection_mode)
         self.set_buttons_enabled(False)
+        study_mode = self.settings.study_mode and self.index is not None
+        self.study_panel.setVisible(study_mode)
+        self.action_next_study.setEnabled(study_mode)
+        self.action_previous_study.setEnabled(study_mode)
 
-        self.settings.img_idx -= 1
+        self.settings.img_idx = self.step_index(self.settings.img_idx, -1)
         self.next_step(first_run=True)
 
+    @handle_exceptions
+    def init_results(self):
+        if self.writer is not None:
+            self.writer.close()
+        if self.results is not None:
+            self.results.close()
+        # every workstation of a shared project writes its own store, they are merged on export
+        suffix = '_' + worker_suffix(worker_id()) if self.settings.shared else ''
+        path = join(self.settings.project_folder, 'results{}.sqlite'.format(suffix))
+        is_new = not exists(path)
+        self.results = ResultStore(path)
+        csv_path = join(self.settings.project_folder, self.settings.project_name + '.csv')
+        if is_new and isfile(csv_path) and not self.settings.shared:
+            self.results.import_csv(csv_path, self.image_list)
+        journal_path = join(self.settings.project_folder, 'journal{}.jsonl'.format(suffix))
+        self.results.replay(journal_path)
+        self.writer = BackgroundWriter(self.results, journal_path, self.settings.fsync_interval)
+
+    @pyqtSlot()
+    @handle_exceptions
+    def export_results(self):
+        self.writer.flush()
+        write_csv(join(self.settings.project_folder, self.settings.project_name + '.csv'),
+                  merged_entries(result_paths(self.settings.project_folder)))
+
+    @pyqtSlot()
+    @handle_exceptions
+    def show_report(self):
+        if self.spans is None:
+            return
+        self.spans.flush()
+        if not isfile(self.spans.path):
+            return
+        QMessageBox.information(self, 'Throughput report', format_summary(summarize(self.spans.path)))
+
+    @handle_exceptions
+    def init_index(self):
+        if self.index is not None:
+            self.index.close()
+            self.index = None
+        if self.settings.file_extension != 'dcm':
+            return
+        self.index = HeaderIndex(join(self.settings.project_folder, 'header_index.sqlite'))
+        self.headers = []
+        index_thread = threading.Thread(target=self.update_index, args=(list(self.image_list),))
+        index_thread.daemon = True
+        index_thread.start()
+
+    @handle_exceptions
+    def init_cache(self):
+        if self.cache is not None:
+            self.close_cache()
+        decoder = None
+        if self.settings.decode:
+            decoder = DecodedFileCache(join(self.settings.project_folder, 'decoded'),
+                                       self.settings.decode_cache_size * 1024 ** 2)
+        headers = self.index.get if self.index is not None else None
+        loader = partial(load_image, file_extension=self.settings.file_extension, decoder=decoder, headers=headers)
+        self.cache = ImageCache(loader, max_bytes=self.settings.cache_size * 1024 ** 2)
+        self.prefetcher = Prefetcher(self.cache, self.settings.prefetch_ahead, self.settings.prefetch_behind,
+                                     self.image_key)
+
+    @handle_exceptions
+    def close_cache(self):
+        self.prefetcher.close()
+        self.cache.close()
+        self.cache = None
+        self.prefetcher = None
+
     @pyqtSlot()
     @handle_exceptions
     def create_folders(self):
@@ -222,6 +545,7 @@ class MainWindow(QMainWindow):
 
     @handle_exceptions
     def next_step(self, first_run=False):
+        start = time.perf_counter()
         # First run
         if first_run:
             self.display_next()
@@ -277,6 +601,7 @@ class MainWindow(QMainWindow):
                         self.hint_label.setText('Choose the object class')
                 else:
                     self.display_object_localization_hint()
+        self.spans.add('next_step', None, time.perf_counter() - start)
 
     @handle_exceptions
     def save_result_and_proceed(self):
@@ -295,28 +620,148 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     @handle_exceptions
     def display(self):
-        self.filter_forward()
-        if self.settings.file_extension == 'dcm':
-            dcm_file_name = self.image_list[self.settings.img_idx]
-            self.label_filename.setText(basename(dcm_file_name))
-            if self.settings.decode:
-                try:
-                    subprocess.call(("dcmdjpeg", dcm_file_name, dcm_file_name))
-                except:
-                    print('Decoding not possible. Please install DCMTK.')
-            dcm_file = pydicom.dcmread(dcm_file_name)
-            self.screen.val_min, self.screen.val_max = self.get_windowing(dcm_file)
-            pixel_data = dcm_file.pixel_array
-            if self.action_threshold.isChecked():
-                pixel_data[pixel_data > self.screen.val_min] = self.screen.val_max
-            self.screen.data_array = pixel_data
+        start = time.perf_counter()
+        with self.spans.span('filter'):
+            self.filter_forward()
+        if self.settings.img_idx >= len(self.image_list):
+            self.finito()
+            return
+        file_name = self.image_list[self.settings.img_idx]
+        frames = self.frame_count(file_name)
+        if file_name != self.frame_path:
+            self.frame_path = file_name
+            self.frame = first_frame(frames)
+        self.screen.frames = frames
+        self.show_file_name()
+        with self.spans.span('decode', file_name):
+            image = self.cache.get((file_name, self.frame) if frames > 1 else file_name)
+        self.screen.val_min, self.screen.val_max = image.val_min, image.val_max
+        self.screen.data_min, self.screen.data_max = image.data_min, image.data_max
+        self.screen.data_array = image.data_array
+        self.screen.levels = image.levels
+        # applied by the screen on the displayed part only, cached arrays are never modified
+        if self.action_threshold.isChecked():
+            self.screen.threshold = (self.screen.val_min, self.screen.val_max)
         else:
-            img = Image.open(self.image_list[self.settings.img_idx])
-            self.screen.data_array = np.array(img)
-        self.screen.display()
+            self.screen.threshold = None
+        with self.spans.span('render', file_name):
+            self.screen.display()
+        if not self.first_image_shown:
+            self.first_image_shown = True
+            startup.mark('first_image')
+        with self.spans.span('prefetch'):
+            self.prefetcher.update(self.position(self.settings.img_idx), self.direction, self.playlist,
+                                   self.passes_filter)
+            if frames > 1:
+                self.prefetcher.frames(file_name, self.frame, frames)
+            if self.studies:
+                self.prefetch_studies()
+        if self.studies:
+            self.update_study_panel()
+
+        self.line_image_idx.setText(str(self.position(self.settings.img_idx) + 1))
+        self.label_total_images.setText(' / ' + str(len(self.playlist)))
+        self.spans.add('display', file_name, time.perf_counter() - start)
+        self.spans.image_shown(file_name)
+
+    @handle_exceptions
+    def prefetch_studies(self):
+        # the current study and the next one in the navigation direction are decoded as a whole
+        number = self.study_of.get(self.settings.img_idx)
+        if number is None:
+            return
+        keys = [self.image_key(idx) for idx in self.studies[number]]
+        if 0 <= number + self.direction < len(self.studies):
+            keys.extend(self.image_key(idx) for idx in self.studies[number + self.direction])
+        for key in keys:
+            self.cache.prefetch(key)
+        self.cache.pin(keys, 'study')
 
-        self.line_image_idx.setText(str(self.settings.img_idx + 1))
-        self.label_total_images.setText(' / ' + str(len(self.image_list)))
+    @handle_exceptions
+    def update_study_panel(self):
+        study = self.studies[self.study_of[self.settings.img_idx]]
+        if study is not self.panel_study:
+            self.panel_study = study
+            self.study_panel.show_study([(idx, self.headers[idx], self.cache.peek(self.image_key(idx)))
+                                         for idx in study], self.settings.img_idx)
+        for idx, button in self.study_panel.buttons.items():
+            button.setChecked(idx == self.settings.img_idx)
+        self.refresh_thumbnails()
+
+    @pyqtSlot()
+    @handle_exceptions
+    def refresh_thumbnails(self):
+        # views still being decoded get their thumbnail once they are in the cache
+        if self.cache is None:
+            return
+        missing = self.study_panel.missing()
+        for idx in missing:
+            self.study_panel.set_thumbnail(idx, self.cache.peek(self.image_key(idx)))
+        if any(self.cache.loading(self.image_key(idx)) for idx in self.study_panel.missing()):
+            self.thumbnail_timer.start()
+
+    @pyqtSlot(int)
+    @handle_exceptions
+    def show_view(self, idx):
+        if idx == self.settings.img_idx:
+            return
+        self.direction = 1 if self.position(idx) > self.position(self.settings.img_idx) else -1
+        self.reset_state()
+        self.settings.img_idx = idx
+        self.display()
+
+    @pyqtSlot()
+    @handle_exceptions
+    def next_study(self):
+        number = self.study_of.get(self.settings.img_idx)
+        if number is None or number + 1 >= len(self.studies):
+            return
+        self.show_view(self.studies[number + 1][0])
+
+    @pyqtSlot()
+    @handle_exceptions
+    def previous_study(self):
+        number = self.study_of.get(self.settings.img_idx)
+        if number is None or number == 0:
+            return
+        self.show_view(self.studies[number - 1][0])
+
+    @handle_exceptions
+    def frame_count(self, path):
+        return frame_count(self.index.get(path)) if self.index is not None else 1
+
+    @handle_exceptions
+    def image_key(self, idx):
+        path = self.image_list[idx]
+        frames = self.frame_count(path)
+        return (path, first_frame(frames)) if frames > 1 else path
+
+    @handle_exceptions
+    def show_file_name(self):
+        text = basename(self.frame_path)
+        if self.screen.frames > 1:
+            text += '  [slice {} / {}]'.format(self.frame + 1, self.screen.frames)
+        if self.results.is_labeled(self.frame_path):
+            text += '  [labeled]'
+        self.label_filename.setText(text)
+
+    @pyqtSlot(int)
+    @handle_exceptions
+    def scroll_frame(self, step):
+        frame = min(max(self.frame + step, 0), self.screen.frames - 1)
+        if frame == self.frame or self.frame_path is None:
+            return
+        self.frame = frame
+        with self.spans.span('decode', self.frame_path):
+            image = self.cache.get((self.frame_path, frame))
+        # the window set by the annotator stays, only the data changes
+        self.screen.data_min, self.screen.data_max = image.data_min, image.data_max
+        self.screen.data_array = image.data_array
+        self.screen.levels = image.levels
+        with self.spans.span('render', self.frame_path):
+            self.screen.show_frame()
+        self.prefetcher.frames(self.frame_path, frame, self.screen.frames, step)
+        self.show_file_name()
 
     @handle_exceptions
     def reset_state(self):
@@ -324,7 +769,9 @@ class MainWindow(QMainWindow):
         self.classified = False
         self.one_object_localized = False
         self.all_objects_localized = False
-        self.polygons = []
+        self.objects = []
+        self.image_class = None
+        self.copies = []
         if self.settings.object_detection_mode:
             self.set_buttons_enabled(False)
             self.object_idx = 0
@@ -337,7 +784,8 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     @handle_exceptions
     def display_next(self):
-        self.settings.img_idx += 1
+        self.direction = 1
+        self.settings.img_idx = self.step_index(self.settings.img_idx, 1)
         if self.settings.img_idx < len(self.image_list):
             self.display()
         else:
@@ -347,41 +795,74 @@ class MainWindow(QMainWindow):
     @handle_exceptions
     def jump_to_img(self):
         self.reset_state()
-        self.settings.img_idx = int(self.line_image_idx.text()) - 1
+        self.settings.img_idx = self.index_at(int(self.line_image_idx.text()) - 1)
         self.display()
 
     @pyqtSlot()
     @handle_exceptions
     def get_back(self):
-        if self.settings.img_idx < 1:
+        # the previous image of the playlist, its result is undone when it is the latest one
+        if self.position(self.settings.img_idx) < 1:
+            return
+        previous = self.step_index(self.settings.img_idx, -1)
+        self.writer.flush()
+        entry = self.results.last()
+        if entry is not None and entry['path'] == self.image_list[previous]:
+            self.undo()
             return
+        self.direction = -1
+        self.reset_state()
+        self.settings.img_idx = previous
+        self.display()
 
-        self.settings.img_idx -= 1;
-        self.filter_backward()
-        file_name = basename(self.image_list[self.settings.img_idx])
+    @pyqtSlot()
+    @handle_exceptions
+    def undo(self):
+        # the latest result wherever it is, Back only undoes the result of the previous image
+        self.writer.flush()
+        entry = self.results.undo()
+        if entry is None:
+            return
 
-        # remove file
-        if self.settings.copy_files:
-            n = len(self.settings.class_labels)
-            for i in range(n):
-                file_path = join(self.project_folder, self.settings.class_labels[i], file_name)
-                if isfile(file_path):
-                    remove(file_path)
-                    print('Removed {}'.format(file_path))
-
-        # remove location row
-        path = join(self.settings.project_folder, self.settings.project_name + '.csv')
-        if isfile(path):
-            with open(path, "r") as f:
-                lines = f.readlines()
-            with open(path, "w") as f:
-                for line in lines:
-                    if file_name not in line:
-                        f.write(line)
-
-        # display previous image
+        # remove copies and region files made for the undone result
+        for file_path in entry['data'].get('copies', []):
+            if self.copy_pool.remove(file_path):
+                print('Removed {}'.format(file_path))
+        if self.settings.object_detection_mode >= 3:
+            file_path = self.region_path(entry['img_idx'], entry['path'])
+            if isfile(file_path):
+                remove(file_path)
+
+        if self.leases is not None:
+            self.leases.reopen(entry['path'])
+            self.leased.add(entry['img_idx'])
+
+        # display the image of the undone result
+        self.direction = -1
+        self.reset_state()
+        self.settings.img_idx = entry['img_idx']
         self.display()
 
+    @pyqtSlot()
+    @handle_exceptions
+    def redo(self):
+        self.writer.flush()
+        entry = self.results.redo()
+        if entry is None:
+            return
+
+        for file_path in entry['data'].get('copies', []):
+            self.copy(entry['path'], file_path)
+        if self.settings.object_detection_mode >= 3 and 'size' in entry['data']:
+            self.write_regions(entry['img_idx'], entry['path'], entry['data']['objects'], entry['data']['size'])
+        if self.leases is not None:
+            self.leased.discard(entry['img_idx'])
+            self.writer.submit(self.leases.done, entry['path'])
+
+        self.reset_state()
+        self.settings.img_idx = entry['img_idx']
+        self.display_next()
+
     @pyqtSlot()
     @handle_exceptions
     def skip_step(self):
@@ -400,21 +881,6 @@ class MainWindow(QMainWindow):
             b = self.buttons_layout.itemAt(i).widget()
             b.setEnabled(state)
 
-    @handle_exceptions
-    def get_windowing(self, dcm_file):
-        if "WindowCenter" in dcm_file and "WindowWidth" in dcm_file:
-            center = dcm_file.WindowCenter
-            width = dcm_file.WindowWidth
-            if isinstance(center, pydicom.multival.MultiValue):
-                center = center[0]
-                width = width[0]
-            val_min = center - 0.5 * width
-            val_max = center + 0.5 * width
-        else:
-            val_min = None
-            val_max = None
-        return val_min, val_max
-
     @pyqtSlot()
     @handle_exceptions
     def classify(self, class_nr):
@@ -423,12 +889,17 @@ class MainWindow(QMainWindow):
 
         if self.settings.img_idx <= len(self.image_list):
             print('you classified as:', class_nr)
-            if self.settings.object_detection_mode >= 3:
-                self.polygons[-1]['class'] = class_nr
+            if self.settings.object_detection_mode >= 3 or \
+                    (self.settings.classification_mode == 2 and self.objects):
+                self.objects[-1]['class'] = class_nr
+            else:
+                self.image_class = class_nr
             self.result_string += ',' + str(class_nr)
-            if self.settings.copy_files:
+            if self.settings.copy_files and class_nr is not None:
                 src_path = self.image_list[self.settings.img_idx]
-                target_path = join(self.project_folder, self.settings.class_labels[class_nr], basename(src_path))
+                target_path = join(self.settings.project_folder, self.settings.class_labels[class_nr],
+                                   basename(src_path))
+                self.copies.append(target_path)
                 self.copy(src_path, target_path)
             self.classified = True
             self.next_step()
@@ -445,18 +916,22 @@ class MainWindow(QMainWindow):
                 self.all_objects_localized = True
 
         if self.settings.object_detection_mode == 1:
-            self.screen.draw_point('lawngreen')
+            self.screen.draw_point()
         elif self.settings.object_detection_mode == 2:
             self.screen.draw_rect()
         elif self.settings.object_detection_mode >= 3:
-            region = self.screen.draw_polygon()
-            self.polygons.append( { 
+            vertices = self.screen.draw_polygon()
+            self.objects.append({
                     'class': '',
-                    'points': region
+                    'vertices': vertices
                 })
 
         if self.settings.object_detection_mode < 3:
             self.result_string += ',' + str(self.screen.location).strip('()')
+            location = self.screen.location if isinstance(self.screen.location, tuple) else None
+            self.objects.append({'location': location})
+        if self.screen.frames > 1:
+            self.objects[-1]['frame'] = self.frame
         self.one_object_localized = True
         self.classified = False
 
@@ -468,36 +943,10 @@ class MainWindow(QMainWindow):
         self.all_objects_localized = True
         self.next_step()
 
-    @handle_exceptions
-    def create_result_file(self):
-        path = join(self.settings.project_folder, self.settings.project_name + '.csv')
-        if isfile(path):
-            return
-        with open(path, 'w') as file:
-            headers = 'file'
-            if self.settings.object_detection_mode == 1:
-                for obj in self.settings.object_names:
-                    headers += ',' + obj + ' x'
-                    headers += ',' + obj + ' y'
-            elif self.settings.object_detection_mode == 2:
-                for obj in self.settings.object_names:
-                    headers += ',' + obj + ' x1'
-                    headers += ',' + obj + ' x2'
-                    headers += ',' + obj + ' y2'
-                    headers += ',' + obj + ' y2'
-            if self.settings.class_labels and \
-                    (self.settings.object_detection_mode == 0 or
-                     self.settings.object_names):
-                headers += ',class'
-                headers += ',comments'
-
-            file.write(headers + '\n')
-
     @handle_exceptions
     def save_result(self):
         if self.settings.img_idx > len(self.image_list):
             return
-        path = join(self.settings.project_folder, self.settings.project_name + '.csv')
         if self.checkbox_implants.isChecked():
             self.result_string += ',implant'
         if self.checkbox_reduction.isChecked():
@@ -507,34 +956,48 @@ class MainWindow(QMainWindow):
         if self.checkbox_other.isChecked():
             self.result_string += ',other'
 
-        with open(path, 'a+') as file:
-            filename = basename(self.image_list[self.settings.img_idx])
-            file.write(filename + self.result_string + '\n')
+        start = time.perf_counter()
+        image_path = self.image_list[self.settings.img_idx]
+        self.spans.image_done(image_path)
+        objects = [dict(obj) for obj in self.objects]
+        for obj, name in zip(objects, self.settings.object_names):
+            obj['name'] = name
+        shape = self.screen.data_array.shape[:2]
+        data = {'objects': objects,
+                'image_class': self.image_class,
+                'copies': self.copies,
+                'size': list(shape)}
+        result = ResultStore.new_result(self.settings.img_idx, image_path,
+                                        basename(image_path) + self.result_string, data)
+        self.writer.add_result(result)
+        self.write_regions(self.settings.img_idx, image_path, self.objects, shape)
+        if self.leases is not None:
+            self.leased.discard(self.settings.img_idx)
+            self.writer.submit(self.leases.done, image_path)
+        # keep the resume position as safe as the results, a restart opens the image after this one
+        settings_dict = self.settings.to_dict()
+        settings_dict['last_image'] = self.step_index(self.settings.img_idx, 1)
+        self.writer.submit(self.settings.save, settings_dict)
+        self.spans.add('save', image_path, time.perf_counter() - start)
+        self.writer.submit(self.spans.flush)
 
+    @handle_exceptions
+    def region_path(self, img_idx, image_path):
+        return region_path(self.settings.project_folder, self.settings.object_detection_mode, img_idx, image_path,
+                           self.settings.shared)
+
+    @handle_exceptions
+    def write_regions(self, img_idx, image_path, objects, shape):
+        path = self.region_path(img_idx, image_path)
         if self.settings.object_detection_mode == 3:
-            polygon_dict = {
-                'file': basename(self.image_list[self.settings.img_idx]),
-                'regions': self.polygons
-            }
-            path = join(self.settings.project_folder, f'region_{self.settings.img_idx}.json')
-            with open(path, 'w') as f:
-                json.dump(polygon_dict, f)
+            self.writer.submit(save_regions, path, basename(image_path), list(objects), shape,
+                               self.settings.mask_encoding)
         elif self.settings.object_detection_mode == 4:
-            im = Image.new(mode="RGB", size=(self.screen.data_array.shape[1], 
-                                             self.screen.data_array.shape[0]))
-            for polygon in self.polygons:
-                for point in polygon['points']:
-                    im.putpixel(point, (255, 0, 0))
-            filename = basename(self.image_list[self.settings.img_idx])
-            filename = '.'.join(filename.split('.')[0:-1])
-            path = join(self.settings.project_folder, filename) + '.png'
-            im.save(path)
+            self.writer.submit(save_label_mask, path, list(objects), shape)
 
     @handle_exceptions
     def copy(self, src_path, target_path):
-        process_thread = threading.Thread(target=copyfile, args=(src_path, target_path))
-        process_thread.daemon = True
-        process_thread.start()
+        self.copy_pool.copy(src_path, target_path)
 
     @handle_exceptions
     def keyPressEvent(self, event):
@@ -562,8 +1025,9 @@ class MainWindow(QMainWindow):
 
     @handle_exceptions
     def finito(self):
-        self.screen.canvas.axes.clear()
-        self.screen.canvas.draw()
+        self.screen.clear()
+        self.study_panel.clear()
+        self.panel_study = None
         self.set_buttons_enabled(False)
         self.table.setEnabled(False)
         self.button_save_roi.setEnabled(False)
@@ -572,6 +1036,24 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         if self.settings.data_folder:
             self.settings.save()
+        if self.cache is not None:
+            self.close_cache()
+        if self.index is not None:
+            self.index.close()
+        if self.copy_pool is not None:
+            self.copy_pool.close()
+        if self.spans is not None:
+            self.spans.flush()
+        if self.results is not None:
+            self.export_results()
+            self.writer.close()
+            self.results.close()
+        if self.leases is not None:
+            # unlabeled images go back to the other workstations
+            self.leases.release()
+            self.leases.close()
+        if self.scanner is not None:
+            self.scanner.stop()
         self.close()
 
 
@@ -579,6 +1061,7 @@ class MainWindow(QMainWindow):
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = MainWindow()
     app.exec_()
@@ -1,12 +1,14 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QApplication
+from PyQt5.QtCore import QTimer, pyqtSignal
 from matplotlib.backends.backend_qt5agg import FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.widgets import RectangleSelector
-from main_window import handle_exceptions
+from settings import handle_exceptions
 from enum import Enum
 import numpy as np
-import mahotas
-import matplotlib.pyplot as plt
+from windowing import WindowLUT, intensity_range, supports_lut
+from pyramid import build_pyramid, select_level, crop_level, zoom_limits
+from overlay import Overlay
 
 
 
@@ -19,6 +21,7 @@ class Mode(Enum):
 
 
 class MplWidget(QWidget):
+    frame_scrolled = pyqtSignal(int)
 
     @handle_exceptions
     def __init__(self, parent=None):
@@ -35,31 +38,164 @@ class MplWidget(QWidget):
 
         self.canvas.mpl_connect('motion_notify_event', self.mouse_move)
         self.canvas.mpl_connect('button_press_event', self.mouse_press)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+        self.canvas.mpl_connect('scroll_event', self.mouse_scroll)
+        self.canvas.mpl_connect('resize_event', self.on_resize)
         self.canvas.setMouseTracking(False)
 
+        # window/level drags are applied at most once per screen refresh
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(int(1000 / QApplication.primaryScreen().refreshRate()))
+        self.refresh_timer.timeout.connect(self.refresh)
+        # and so is the outline following the cursor
+        self.overlay_timer = QTimer(self)
+        self.overlay_timer.setSingleShot(True)
+        self.overlay_timer.setInterval(self.refresh_timer.interval())
+        self.overlay_timer.timeout.connect(self.blit_overlay)
+
         self.x = None
         self.y = None
         self.val_min = None
         self.val_max = None
+        self.data_min = None
+        self.data_max = None
         self.data_array = None
+        self.levels = None
+        self.frames = 1
+        self.view = None
+        self.threshold = None
+        self.lut = WindowLUT()
 
         self.rs = None
         self.location = None
         self.polygon_x = None
         self.polygon_y = None
-        self.polygon = []
         self.mode = Mode.nothing
 
-        self.red_point = None
+        self.image = None
+        self.background = None
+        self.overlay = Overlay(self.canvas.axes)
 
     @handle_exceptions
     def display(self):
-        self.canvas.axes.clear()
-        self.canvas.axes.imshow(self.data_array, cmap='gray',
-                                vmin=self.val_min, vmax=self.val_max)
+        self.clear_annotations()
+        if self.levels is None:
+            self.levels = build_pyramid(self.data_array)
+        if self.data_min is None:
+            self.data_min, self.data_max = intensity_range(self.data_array)
+        if self.val_min is None or self.val_max is None:
+            self.val_min, self.val_max = self.data_min, self.data_max
+        height, width = self.data_array.shape[:2]
+        if self.image is None:
+            self.image = self.canvas.axes.imshow(np.zeros((1, 1), dtype=np.uint8), cmap='gray')
+        self.canvas.axes.set_xlim(-0.5, width - 0.5)
+        self.canvas.axes.set_ylim(height - 0.5, -0.5)
+        self.render()
         self.canvas.axes.axis('off')
         self.canvas.draw()
 
+    # another slice of the volume on screen, keeping zoom, window and annotations
+    @handle_exceptions
+    def show_frame(self):
+        self.render()
+        self.canvas.draw_idle()
+
+    # Shows the pyramid level closest to the canvas resolution, cropped to the visible region.
+    # Full resolution data is only touched when zoomed in far enough.
+    def render(self):
+        x0, x1 = sorted(self.canvas.axes.get_xlim())
+        y0, y1 = sorted(self.canvas.axes.get_ylim())
+        bbox = self.canvas.axes.bbox
+        scale = max((x1 - x0) / max(bbox.width, 1), (y1 - y0) / max(bbox.height, 1))
+        level = select_level(len(self.levels), scale)
+        self.view, extent = crop_level(self.levels, level, x0, x1, y0, y1)
+        self.image.set_data(self.windowed(self.view))
+        self.image.set_extent(extent)
+        self.set_clim()
+
+    def windowed(self, view):
+        if self.threshold is not None:
+            view = view.copy()
+            view[view > self.threshold[0]] = self.threshold[1]
+        if supports_lut(view):
+            return self.lut.apply(view, self.val_min, self.val_max)
+        return view
+
+    def set_clim(self):
+        if supports_lut(self.view):
+            self.image.set_clim(0, 255)
+        else:
+            self.image.set_clim(self.val_min, self.val_max)
+
+    @handle_exceptions
+    def on_draw(self, event):
+        # the background is the image alone, the overlay is drawn over it
+        self.background = self.canvas.copy_from_bbox(self.canvas.axes.bbox)
+        self.overlay.draw()
+
+    @handle_exceptions
+    def on_resize(self, event):
+        if self.image is not None:
+            self.render()
+
+    @handle_exceptions
+    def refresh(self):
+        if self.image is None or self.background is None:
+            return
+        self.image.set_data(self.windowed(self.view))
+        self.set_clim()
+        self.canvas.restore_region(self.background)
+        self.canvas.axes.draw_artist(self.image)
+        self.background = self.canvas.copy_from_bbox(self.canvas.axes.bbox)
+        self.overlay.draw()
+        self.canvas.blit(self.canvas.axes.bbox)
+
+    @handle_exceptions
+    def blit_overlay(self):
+        if self.background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        self.overlay.draw()
+        self.canvas.blit(self.canvas.axes.bbox)
+
+    @handle_exceptions
+    def mouse_scroll(self, event):
+        if self.image is None:
+            return
+        # the wheel scrolls through the slices of a volume, ctrl + wheel zooms
+        if self.frames > 1 and 'ctrl' not in event.modifiers:
+            self.frame_scrolled.emit(1 if event.button == 'up' else -1)
+            return
+        if event.xdata is None or event.ydata is None:
+            return
+        factor = 1 / 1.25 if event.button == 'up' else 1.25
+        height, width = self.data_array.shape[:2]
+        x0, x1 = self.canvas.axes.get_xlim()
+        y1, y0 = self.canvas.axes.get_ylim()
+        x0, x1 = zoom_limits(x0, x1, event.xdata, factor, -0.5, width - 0.5)
+        y0, y1 = zoom_limits(y0, y1, event.ydata, factor, -0.5, height - 0.5)
+        self.canvas.axes.set_xlim(x0, x1)
+        self.canvas.axes.set_ylim(y1, y0)
+        self.render()
+        self.canvas.draw_idle()
+
+    @handle_exceptions
+    def clear_annotations(self):
+        self.overlay.clear()
+        if self.polygon_x is not None:
+            self.polygon_x = []
+            self.polygon_y = []
+
+    @handle_exceptions
+    def clear(self):
+        self.clear_annotations()
+        if self.image is not None:
+            self.image.remove()
+            self.image = None
+        self.canvas.draw()
+
     @handle_exceptions
     def set_mode(self, n):
         new_mode = Mode(n)
@@ -67,12 +203,13 @@ class MplWidget(QWidget):
             self.rs = None
             self.location = None
         elif new_mode == Mode.roi:
-            self.rs = RectangleSelector(self.canvas.axes, self.roi_select,
-                                        drawtype='box', useblit=True, button=[1],
+            self.rs = RectangleSelector(self.canvas.axes, self.roi_select, useblit=True, button=[1],
                                         minspanx=5, minspany=5, spancoords='pixels', interactive=True)
         elif new_mode == Mode.polygon_json or new_mode == Mode.polygon_img:
             self.polygon_x = []
             self.polygon_y = []
+        # motion without a pressed button is only needed for the polygon outline
+        self.canvas.setMouseTracking(new_mode in (Mode.polygon_json, Mode.polygon_img))
 
         self.mode = new_mode
 
@@ -92,6 +229,12 @@ class MplWidget(QWidget):
 
     @handle_exceptions
     def mouse_move(self, event):
+        if event.button is None:
+            if self.polygon_x:
+                self.overlay.move_cursor(event.xdata, event.ydata)
+                if not self.overlay_timer.isActive():
+                    self.overlay_timer.start()
+            return
         button_number = event.button if type(event.button) is int else event.button.value
         if (button_number == 2 and
                 event.xdata is not None and
@@ -104,11 +247,12 @@ class MplWidget(QWidget):
             new_min = self.val_min + sensitivity * dx
             new_max = self.val_max + sensitivity * dy
             if new_min < new_max:
-                if new_min >= self.data_array.min():
+                if new_min >= self.data_min:
                     self.val_min = new_min
-                if new_max <= self.data_array.max():
+                if new_max <= self.data_max:
                     self.val_max = new_max
-                self.display()
+                if not self.refresh_timer.isActive():
+                    self.refresh_timer.start()
             self.x = x
             self.y = y
 
@@ -123,59 +267,43 @@ class MplWidget(QWidget):
                     x = self.x / self.data_array.shape[1]
                     y = self.y / self.data_array.shape[0]
                     self.location = (x, y)
-                    self.draw_point('red') 
+                    self.overlay.set_pending(self.x, self.y)
+                    self.blit_overlay()
                 elif self.mode == Mode.polygon_json or self.mode == Mode.polygon_img:
                     self.polygon_x.append(int(self.x))
                     self.polygon_y.append(int(self.y))
-                    self.draw_point('cyan', size=5)
+                    self.overlay.add_vertex(int(self.x), int(self.y))
+                    self.blit_overlay()
 
-    def draw_point(self, color, size=8):
-        if self.location is None and self.polygon_x is None:
-            return
-        point = self.canvas.axes.scatter(self.x, self.y, c=color, s=size)
-        if self.red_point is not None:
-            self.red_point.remove()
-            self.red_point = None
-        if color == 'red':
-            self.red_point = point
-        if color == 'cyan':
-            self.polygon.append(point)
-        self.canvas.draw()
+    # the clicked point becomes a saved one
+    def draw_point(self):
+        if not isinstance(self.location, tuple):
+            self.overlay.set_pending(None, None)
+        else:
+            height, width = self.data_array.shape[:2]
+            self.overlay.add_point(self.location[0] * width, self.location[1] * height)
+        self.blit_overlay()
 
     def draw_rect(self):
-        if len(self.location) < 4:
+        if not isinstance(self.location, tuple) or len(self.location) < 4:
             return
-        self.canvas.axes.axvspan(xmin=self.location[0] * self.data_array.shape[1],
-                                 xmax=self.location[1] * self.data_array.shape[1],
-                                 ymin=1-self.location[2],
-                                 ymax=1-self.location[3],
-                                 facecolor='g', alpha=0.5)
-        self.canvas.draw()
+        xmin, xmax, ymin, ymax = self.location
+        height, width = self.data_array.shape[:2]
+        self.overlay.add_box(xmin * width, ymin * height, xmax * width, ymax * height)
+        self.blit_overlay()
 
     @handle_exceptions
     def draw_polygon(self):
-        self.canvas.axes.fill(self.polygon_x, self.polygon_y, c='cyan', alpha=0.5)
-        self.canvas.draw()
-        region = self.get_points_inside(self.polygon_x, self.polygon_y)
+        self.overlay.close_polygon()
+        self.blit_overlay()
+        vertices = [list(vertex) for vertex in zip(self.polygon_x, self.polygon_y)]
         self.polygon_x = []
         self.polygon_y = []
-        return region
+        return vertices
 
-                   
     def reset_polygon(self):
-        for a in self.polygon:
-            a.remove()
-        self.polygon = []
+        self.overlay.clear_vertices()
         self.polygon_x = []
         self.polygon_y = []
-        self.canvas.draw()
+        self.blit_overlay()
 
-
-    @handle_exceptions
-    def get_points_inside(self, xs, ys):
-        poly = list(zip(xs, ys))
-        grid = np.zeros((self.data_array.shape[1], self.data_array.shape[0]), dtype=np.int8)
-        mahotas.polygon.fill_polygon(poly, grid)
-        indices = np.where(grid > 0)
-        indices = list(zip(indices[0].tolist(), indices[1].tolist()))
-        return indices
\ No newline at end of file
@@ -0,0 +1,90 @@
+import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.lines import Line2D
+
+
+def offsets(points):
+    return np.array(points, dtype=float).reshape(-1, 2)
+
+
+# Annotations drawn over the image with blitting. There is one animated artist per kind of
+# annotation and only its data changes, so a click costs a redraw of the overlay on the cached
+# background whatever the size of the image. A full canvas draw leaves the artists out.
+class Overlay:
+
+    def __init__(self, axes):
+        self.axes = axes
+        self.boxes = PolyCollection([], facecolors='g', alpha=0.5, animated=True)
+        self.polygons = PolyCollection([], facecolors='cyan', alpha=0.5, animated=True)
+        axes.add_collection(self.boxes, autolim=False)
+        axes.add_collection(self.polygons, autolim=False)
+        self.points = axes.scatter([], [], c='lawngreen', s=8, animated=True)
+        self.pending = axes.scatter([], [], c='red', s=8, animated=True)
+        self.vertices = axes.scatter([], [], c='cyan', s=5, animated=True)
+        # the outline of the polygon being drawn, closed through the cursor
+        self.rubber_band = Line2D([], [], color='cyan', linewidth=1, linestyle='--', animated=True)
+        axes.add_line(self.rubber_band)
+        self.artists = [self.boxes, self.polygons, self.rubber_band, self.points, self.vertices, self.pending]
+        self.point_list = []
+        self.box_list = []
+        self.polygon_list = []
+        self.vertex_list = []
+        self.cursor = None
+
+    def draw(self):
+        for artist in self.artists:
+            self.axes.draw_artist(artist)
+
+    def set_pending(self, x, y):
+        self.pending.set_offsets(offsets([] if x is None else [(x, y)]))
+
+    def add_point(self, x, y):
+        self.set_pending(None, None)
+        if x is None or y is None:
+            return
+        self.point_list.append((x, y))
+        self.points.set_offsets(offsets(self.point_list))
+
+    def add_box(self, x0, y0, x1, y1):
+        self.box_list.append([(x0, y0), (x1, y0), (x1, y1), (x0, y1)])
+        self.boxes.set_verts(self.box_list)
+
+    def add_vertex(self, x, y):
+        self.vertex_list.append((x, y))
+        self.vertices.set_offsets(offsets(self.vertex_list))
+        self.update_rubber_band()
+
+    def move_cursor(self, x, y):
+        self.cursor = None if x is None or y is None else (x, y)
+        self.update_rubber_band()
+
+    def update_rubber_band(self):
+        outline = list(self.vertex_list)
+        if outline and self.cursor is not None:
+            outline.append(self.cursor)
+        if len(outline) > 2:
+            outline.append(outline[0])
+        xy = offsets(outline)
+        self.rubber_band.set_data(xy[:, 0], xy[:, 1])
+
+    def close_polygon(self):
+        if len(self.vertex_list) > 2:
+            self.polygon_list.append(list(self.vertex_list))
+            self.polygons.set_verts(self.polygon_list)
+        self.clear_vertices()
+
+    def clear_vertices(self):
+        self.vertex_list = []
+        self.cursor = None
+        self.vertices.set_offsets(offsets([]))
+        self.update_rubber_band()
+
+    def clear(self):
+        self.point_list = []
+        self.box_list = []
+        self.polygon_list = []
+        self.points.set_offsets(offsets([]))
+        self.boxes.set_verts([])
+        self.polygons.set_verts([])
+        self.set_pending(None, None)
+        self.clear_vertices()
@@ -0,0 +1,72 @@
+import os
+import struct
+import numpy as np
+
+# transfer syntaxes whose pixel data is stored as is: implicit VR little endian, explicit VR
+# little endian and explicit VR big endian
+NATIVE = {'1.2.840.10008.1.2': '<', '1.2.840.10008.1.2.1': '<', '1.2.840.10008.1.2.2': '>'}
+
+LONG_VRS = {b'OB', b'OW', b'OD', b'OF', b'OL', b'OV', b'UN'}
+
+PIXEL_DATA = (0x7FE0, 0x0010)
+
+
+def pixel_offset(fp, transfer_syntax):
+    # file offset of the pixel data value, for a file read with stop_before_pixels=True and
+    # left positioned at the PixelData element. None for encapsulated or unusual files.
+    byte_order = NATIVE.get(transfer_syntax)
+    if byte_order is None:
+        return None
+    position = fp.tell()
+    head = fp.read(12)
+    if len(head) < 8 or struct.unpack(byte_order + 'HH', head[:4]) != PIXEL_DATA:
+        return None
+    if transfer_syntax == '1.2.840.10008.1.2':
+        length, start = struct.unpack('<I', head[4:8])[0], position + 8
+    elif head[4:6] in LONG_VRS:
+        length, start = struct.unpack(byte_order + 'I', head[8:12])[0], position + 12
+    else:
+        length, start = struct.unpack(byte_order + 'H', head[6:8])[0], position + 8
+    if length == 0xFFFFFFFF:
+        return None
+    return start
+
+
+def pixel_dtype(header):
+    byte_order = NATIVE.get(header['transfer_syntax'])
+    bits = header.get('bits_allocated')
+    if byte_order is None or bits not in (8, 16, 32):
+        return None
+    signed = header.get('pixel_representation') == 1
+    if signed and header.get('bits_stored') != bits:
+        # pydicom sign-extends these, raw values would differ
+        return None
+    return np.dtype('{}{}{}'.format(byte_order, 'i' if signed else 'u', bits // 8))
+
+
+# Read-only view of the pixel data of an uncompressed single sample image, straight from the
+# file: (rows, columns), or (frames, rows, columns) for a volume, or just one frame of it.
+# None when the header index row does not describe a file that can be mapped.
+def map_pixels(header, frame=None):
+    if header is None or header.get('pixel_offset') is None or header.get('samples_per_pixel', 1) != 1:
+        return None
+    try:
+        stat = os.stat(header['path'])
+    except OSError:
+        return None
+    if (stat.st_mtime, stat.st_size) != (header['mtime'], header['size']):
+        # changed since it was indexed
+        return None
+    dtype = pixel_dtype(header)
+    if dtype is None or not header.get('rows') or not header.get('columns'):
+        return None
+    frames = int(header.get('frames') or 1)
+    shape = (frames, int(header['rows']), int(header['columns']))
+    try:
+        data = np.memmap(header['path'], dtype=dtype, mode='r', offset=header['pixel_offset'], shape=shape)
+    except (OSError, ValueError):
+        return None
+    data = data[frame] if frame is not None else data[0] if frames == 1 else data
+    if not dtype.isnative:
+        data = data.astype(dtype.newbyteorder('='))
+    return data
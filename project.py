@@ -0,0 +1,150 @@
+import json
+import numpy as np
+from itertools import chain
+from collections import Counter
+from os.path import join, exists, isfile
+from concurrent.futures import ProcessPoolExecutor
+from settings import Settings
+from dataset_scan import DatasetScanner
+from header_index import HeaderIndex
+from result_store import result_paths, read_entries, merged_entries, write_csv
+from export import export
+from lease_store import LeaseStore, worker_id
+from filters import project_predicate, matches
+from regions import region_path
+from timing import summarize
+
+
+def check_result(entry, project_folder, object_detection_mode, shared=False):
+    problems = []
+    if not entry['path'] or not isfile(entry['path']):
+        problems.append('image not found: {}'.format(entry['path'] or entry['row'].split(',')[0]))
+    if object_detection_mode >= 3 and entry['path']:
+        path = region_path(project_folder, object_detection_mode, entry['img_idx'], entry['path'], shared)
+        if not isfile(path):
+            problems.append('region file missing: {}'.format(path))
+        elif object_detection_mode == 3:
+            try:
+                with open(path, 'r') as f:
+                    regions = json.load(f)['regions']
+            except (ValueError, KeyError) as e:
+                problems.append('unreadable region file {}: {}'.format(path, e))
+            else:
+                for i, region in enumerate(regions):
+                    if 'vertices' in region and len(region['vertices']) < 3:
+                        problems.append('region {} of {} has less than 3 vertices'.format(i, path))
+    return problems
+
+
+def check_results(args):
+    entries, project_folder, object_detection_mode, shared = args
+    return [(entry['id'], problem) for entry in entries
+            for problem in check_result(entry, project_folder, object_detection_mode, shared)]
+
+
+# Project folder access without the GUI: image list, header index, filter, results and export.
+# Nothing here imports PyQt5 or matplotlib so it runs on headless machines.
+class Project:
+
+    def __init__(self, project_folder):
+        path = join(project_folder, 'settings.json')
+        if not exists(path):
+            raise FileNotFoundError('No settings.json in {}'.format(project_folder))
+        self.settings = Settings()
+        self.settings.load(path)
+        self.settings.project_folder = project_folder
+        self.folder = project_folder
+        self.image_list = None
+        self.header_index = None
+
+    def images(self, rescan=False):
+        if self.image_list is None or rescan:
+            scanner = DatasetScanner(self.settings.data_folder, self.settings.file_extension, self.folder)
+            self.image_list = scanner.load(legacy_order=self.settings.img_idx > 0)
+            if rescan:
+                self.image_list.extend(scanner.rescan() or [])
+        return self.image_list
+
+    def index(self):
+        if self.header_index is None:
+            self.header_index = HeaderIndex(join(self.folder, 'header_index.sqlite'))
+        return self.header_index
+
+    def update_index(self, workers=None):
+        return self.index().update(self.images(), workers)
+
+    def filtered(self):
+        images = self.images()
+        predicate = project_predicate(self.settings)
+        if predicate is None or self.settings.file_extension != 'dcm':
+            return list(range(len(images)))
+        index = self.index()
+        headers = [header if header is not None else index.get(path)
+                   for header, path in zip(index.get_many(images), images)]
+        return np.flatnonzero(matches(predicate, headers)).tolist()
+
+    def validate(self, workers=None, batch_size=512):
+        problems = []
+        entries = self.entries()
+        counts = Counter(entry['path'] for entry in entries)
+        for path, count in counts.items():
+            if path is not None and count > 1:
+                problems.append((None, 'labeled {} times: {}'.format(count, path)))
+        batches = []
+        batch = []
+        for entry in entries:
+            batch.append(entry)
+            if len(batch) >= batch_size:
+                batches.append((batch, self.folder, self.settings.object_detection_mode, self.settings.shared))
+                batch = []
+        batches.append((batch, self.folder, self.settings.object_detection_mode, self.settings.shared))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for batch_problems in executor.map(check_results, batches):
+                problems.extend(batch_problems)
+        return problems
+
+    def export_csv(self, path=None):
+        if path is None:
+            path = join(self.folder, self.settings.project_name + '.csv')
+        write_csv(path, self.entries())
+        return path
+
+    def export(self, fmt, output=None, workers=None):
+        if output is None:
+            output = join(self.folder, 'export', fmt)
+        # the last result of every image, a jump back and a second label replace the first one
+        entries = chain.from_iterable(read_entries(path, latest=True) for path in result_paths(self.folder))
+        return output, export(entries, fmt, output, self.settings, self.image_size, workers)
+
+    def image_size(self, entry):
+        # from the header index, the image is only read when the index has no row for it yet
+        if self.settings.file_extension == 'dcm' and isfile(entry['path']):
+            header = self.index().get(entry['path'])
+            if header['rows'] and header['columns']:
+                return int(header['rows']), int(header['columns'])
+        size = entry['data'].get('size')
+        return tuple(size) if size else None
+
+    def entries(self):
+        # results of all workstations of a shared project, stores and journals are only read
+        return merged_entries(result_paths(self.folder))
+
+    def leases(self):
+        path = join(self.folder, 'leases.sqlite')
+        if not isfile(path):
+            return None
+        store = LeaseStore(path, worker_id())
+        try:
+            return store.counts()
+        finally:
+            store.close()
+
+    def report(self):
+        path = join(self.folder, 'spans.jsonl')
+        if not isfile(path):
+            return None
+        return summarize(path)
+
+    def close(self):
+        if self.header_index is not None:
+            self.header_index.close()
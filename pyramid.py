@@ -0,0 +1,83 @@
+import math
+import numpy as np
+
+
+def downsample(data_array):
+    height = data_array.shape[0] // 2 * 2
+    width = data_array.shape[1] // 2 * 2
+    data_array = data_array[:height, :width]
+    acc_type = np.int32 if data_array.dtype.kind in 'iub' else np.float32
+    acc = data_array[0::2, 0::2].astype(acc_type)
+    acc += data_array[1::2, 0::2]
+    acc += data_array[0::2, 1::2]
+    acc += data_array[1::2, 1::2]
+    if acc_type is np.int32:
+        acc //= 4
+    else:
+        acc /= 4
+    return acc.astype(data_array.dtype)
+
+
+def downsample_times(data_array, times):
+    for _ in range(times):
+        data_array = downsample(data_array)
+    return data_array
+
+
+# Level n is the image reduced 2^n times by 2x2 averaging, level 0 is the image itself. Only the
+# coarsest level, the one a whole large image is shown with, is kept next to the image. The levels
+# in between are reduced from the visible part of the image when zoomed in.
+class Pyramid:
+
+    def __init__(self, data_array, min_size=512):
+        self.image = data_array
+        count = 1
+        while min(data_array.shape[0] >> (count - 1), data_array.shape[1] >> (count - 1)) // 2 >= min_size:
+            count += 1
+        self.count = count
+        self.coarsest = downsample_times(data_array, count - 1)
+        self.nbytes = data_array.nbytes + (self.coarsest.nbytes if count > 1 else 0)
+
+    def __len__(self):
+        return self.count
+
+    def shape(self, level):
+        return self.image.shape[0] >> level, self.image.shape[1] >> level
+
+    def crop(self, level, r0, r1, c0, c1):
+        if level == 0:
+            return self.image[r0:r1, c0:c1]
+        if level == self.count - 1:
+            return self.coarsest[r0:r1, c0:c1]
+        factor = 2 ** level
+        return downsample_times(self.image[r0 * factor:r1 * factor, c0 * factor:c1 * factor], level)
+
+
+def build_pyramid(data_array, min_size=512):
+    return Pyramid(data_array, min_size)
+
+
+def select_level(n_levels, pixels_per_screen_pixel):
+    if pixels_per_screen_pixel <= 1:
+        return 0
+    return min(int(math.log2(pixels_per_screen_pixel)), n_levels - 1)
+
+
+# part of a level covering the full resolution view (x0, x1, y0, y1) together with its extent in
+# full resolution coordinates, pixel centers are at integer coordinates as in imshow
+def crop_level(levels, level, x0, x1, y0, y1):
+    height, width = levels.shape(level)
+    factor = 2 ** level
+    c0 = max(int((x0 + 0.5) // factor), 0)
+    c1 = min(int(math.ceil((x1 + 0.5) / factor)), width)
+    r0 = max(int((y0 + 0.5) // factor), 0)
+    r1 = min(int(math.ceil((y1 + 0.5) / factor)), height)
+    extent = (c0 * factor - 0.5, c1 * factor - 0.5, r1 * factor - 0.5, r0 * factor - 0.5)
+    return levels.crop(level, r0, r1, c0, c1), extent
+
+
+def zoom_limits(lo, hi, center, factor, lo_bound, hi_bound):
+    span = min((hi - lo) * factor, hi_bound - lo_bound)
+    lo = center - (center - lo) * span / (hi - lo)
+    lo = min(max(lo, lo_bound), hi_bound - span)
+    return lo, lo + span
@@ -0,0 +1,105 @@
+import numpy as np
+
+# Polygon scan conversion that only works inside the bounding box of every polygon. Vertices are
+# (x, y) = (column, row) pixel coordinates with pixel centres on whole numbers, as they are
+# clicked on the screen. Masks are indexed [row, column] like the image data, a pixel is inside
+# when its centre is inside the polygon or on its outline.
+
+
+class Raster:
+
+    def __init__(self, mask, row, column):
+        # mask of the bounding box whose top left pixel is (row, column) in the image
+        self.mask = mask
+        self.row = row
+        self.column = column
+        self.area = int(np.count_nonzero(mask))
+        if self.area:
+            rows, columns = np.nonzero(mask)
+            self.centroid = (float(rows.mean()) + row, float(columns.mean()) + column)
+        else:
+            self.centroid = None
+
+    def paste(self, image, value=True):
+        # sets the pixels of the polygon in an image of the full size
+        height, width = self.mask.shape
+        image[self.row:self.row + height, self.column:self.column + width][self.mask] = value
+        return image
+
+    def full_mask(self, shape):
+        return self.paste(np.zeros(shape[:2], dtype=bool))
+
+
+def bounding_box(vertices, shape):
+    # (first row, first column, height, width) of the vertices within the image
+    rows, columns = shape[:2]
+    row0 = min(max(int(np.floor(vertices[:, 1].min())), 0), rows)
+    row1 = min(max(int(np.ceil(vertices[:, 1].max())) + 1, row0), rows)
+    column0 = min(max(int(np.floor(vertices[:, 0].min())), 0), columns)
+    column1 = min(max(int(np.ceil(vertices[:, 0].max())) + 1, column0), columns)
+    return row0, column0, row1 - row0, column1 - column0
+
+
+def ranges(starts, counts):
+    # concatenated aranges: starts[i], starts[i] + 1, ... counts[i] values each
+    group_starts = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + np.arange(counts.sum()) - group_starts
+
+
+# Rasterizes all polygons of an image in one go and returns a Raster per polygon. Polygons with
+# less than 3 vertices or outside the image give empty rasters.
+def rasterize(polygons, shape):
+    boxes = []
+    edges = []
+    for i, vertices in enumerate(polygons):
+        vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+        if len(vertices) < 3:
+            boxes.append((0, 0, 0, 0))
+            continue
+        boxes.append(bounding_box(vertices, shape))
+        start = vertices
+        end = np.roll(vertices, -1, axis=0)
+        edges.append(np.column_stack((np.full(len(vertices), i), start, end)))
+    if not boxes:
+        return []
+    boxes = np.array(boxes, dtype=np.int64).reshape(-1, 4)
+    row0, column0, heights, widths = boxes.T
+    # every box is laid out in one flat buffer, rows one column wider for toggles past the right edge
+    strides = widths + 1
+    sizes = heights * strides
+    bases = np.cumsum(sizes) - sizes
+    buffer_size = int(sizes.sum())
+    if not edges or not buffer_size:
+        return [Raster(np.zeros((h, w), dtype=bool), r, c) for r, c, h, w in boxes]
+    edges = np.concatenate(edges)
+    polygon = edges[:, 0].astype(np.int64)
+    x0, y0, x1, y1 = edges[:, 1], edges[:, 2], edges[:, 3], edges[:, 4]
+
+    # interior: every edge toggles the inside state at the rows it crosses (half open in y, so
+    # vertices are counted once), the running parity along each row fills the inside
+    first = np.maximum(np.ceil(np.minimum(y0, y1)).astype(np.int64), row0[polygon])
+    last = np.minimum(np.ceil(np.maximum(y0, y1)).astype(np.int64), row0[polygon] + heights[polygon])
+    counts = np.maximum(last - first, 0)
+    crossing = np.repeat(np.arange(len(edges)), counts)
+    rows = ranges(first, counts)
+    p = polygon[crossing]
+    x = x0[crossing] + (rows - y0[crossing]) * (x1[crossing] - x0[crossing]) / (y1[crossing] - y0[crossing])
+    columns = np.clip(np.ceil(x).astype(np.int64) - column0[p], 0, widths[p])
+    toggles = np.bincount(bases[p] + (rows - row0[p]) * strides[p] + columns, minlength=buffer_size)
+    inside = (np.cumsum(toggles) & 1).astype(bool)
+
+    # outline: pixels along every edge
+    steps = np.maximum(np.abs(x1 - x0), np.abs(y1 - y0)).astype(np.int64) + 1
+    sample = np.repeat(np.arange(len(edges)), steps)
+    t = ranges(np.zeros(len(edges), dtype=np.int64), steps) / np.repeat(np.maximum(steps - 1, 1), steps)
+    p = polygon[sample]
+    rows = np.rint(y0[sample] + t * (y1[sample] - y0[sample])).astype(np.int64) - row0[p]
+    columns = np.rint(x0[sample] + t * (x1[sample] - x0[sample])).astype(np.int64) - column0[p]
+    keep = (rows >= 0) & (rows < heights[p]) & (columns >= 0) & (columns < widths[p])
+    inside[bases[p[keep]] + rows[keep] * strides[p[keep]] + columns[keep]] = True
+
+    rasters = []
+    for base, r, c, h, w, stride in zip(bases, row0, column0, heights, widths, strides):
+        mask = inside[base:base + h * stride].reshape(h, stride)[:, :w]
+        rasters.append(Raster(mask, int(r), int(c)))
+    return rasters
@@ -0,0 +1,110 @@
+import json
+import hashlib
+from os.path import join, basename
+import numpy as np
+from settings import atomic_open
+from rasterize import rasterize
+
+UNCLASSIFIED = 255
+
+
+# the same for an image on every workstation, unlike its index in the manifest of one of them
+def path_key(path):
+    return hashlib.sha1(path.encode('utf-8')).hexdigest()[:12]
+
+
+# region JSON (polygon_json mode) or label mask PNG (polygon_img mode) of a result, keyed by
+# path in a shared project
+def region_path(project_folder, object_detection_mode, img_idx, image_path, shared=False):
+    if object_detection_mode == 3:
+        key = path_key(image_path) if shared else img_idx
+        return join(project_folder, f'region_{key}.json')
+    filename = basename(image_path)
+    filename = '.'.join(filename.split('.')[0:-1])
+    if shared:
+        filename += '_' + path_key(image_path)
+    return join(project_folder, filename) + '.png'
+
+
+def encode_raster_rle(raster, shape):
+    # COCO style run-length encoding of the full size mask: column-major runs, the first run counts
+    # zeros. Only the pixels of the polygon's bounding box are visited.
+    height, width = shape[:2]
+    columns, rows = np.nonzero(raster.mask.T)
+    flat = (columns + raster.column) * height + rows + raster.row
+    if not flat.size:
+        return {'size': [height, width], 'counts': [height * width]}
+    breaks = np.flatnonzero(np.diff(flat) != 1) + 1
+    starts = flat[np.concatenate(([0], breaks))]
+    ends = flat[np.concatenate((breaks - 1, [flat.size - 1]))] + 1
+    counts = np.column_stack((starts - np.concatenate(([0], ends[:-1])), ends - starts)).ravel()
+    if ends[-1] < height * width:
+        counts = np.append(counts, height * width - ends[-1])
+    return {'size': [height, width], 'counts': counts.tolist()}
+
+
+def decode_rle(rle):
+    counts = np.asarray(rle['counts'], dtype=np.int64)
+    values = np.arange(len(counts)) % 2 == 1
+    return np.repeat(values, counts).reshape(rle['size'], order='F')
+
+
+def encode_region(region, shape, mask_encoding='rle', raster=None):
+    vertices = region['vertices']
+    encoded = {'class': region.get('class', ''), 'vertices': vertices}
+    if 'frame' in region:
+        encoded['frame'] = region['frame']
+    if len(vertices):
+        xs, ys = zip(*vertices)
+        encoded['bbox'] = [min(xs), min(ys), max(xs), max(ys)]
+    if mask_encoding == 'rle':
+        if raster is None:
+            raster = rasterize([vertices], shape)[0]
+        encoded['mask'] = encode_raster_rle(raster, shape)
+    return encoded
+
+
+def save_regions(path, file_name, regions, shape, mask_encoding='rle'):
+    rasters = rasterize([region['vertices'] for region in regions], shape) if mask_encoding == 'rle' \
+        else [None] * len(regions)
+    region_dict = {
+        'file': file_name,
+        'size': list(shape[:2]),
+        'regions': [encode_region(region, shape, mask_encoding, raster) for region, raster in zip(regions, rasters)]
+    }
+    with atomic_open(path) as f:
+        json.dump(region_dict, f)
+
+
+# single channel mask holding class + 1 for every polygon, 0 for background and 255 for objects
+# without a class
+def label_mask(regions, shape):
+    labels = np.zeros(shape[:2], dtype=np.uint8)
+    for region, raster in zip(regions, rasterize([region['vertices'] for region in regions], shape)):
+        value = region.get('class')
+        raster.paste(labels, value + 1 if isinstance(value, int) else UNCLASSIFIED)
+    return labels
+
+
+def save_label_mask(path, regions, shape):
+    from PIL import Image
+    with atomic_open(path, 'wb') as f:
+        Image.fromarray(label_mask(regions, shape)).save(f, format='PNG')
+
+
+def load_regions(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+# expands a region of a file written by save_regions into a boolean (height, width) mask
+def region_mask(region, shape):
+    if 'mask' in region:
+        return decode_rle(region['mask'])
+    if 'points' in region:
+        # region files written before vertices were stored list every pixel as (x, y)
+        mask = np.zeros(shape[:2], dtype=bool)
+        points = np.asarray(region['points'], dtype=np.int64).reshape(-1, 2)
+        mask[points[:, 1], points[:, 0]] = True
+        return mask
+    return rasterize([region['vertices']], shape)[0].full_mask(shape)
@@ -0,0 +1,202 @@
+import os
+import json
+import uuid
+import sqlite3
+import threading
+from glob import glob
+from urllib.request import pathname2url
+from os.path import basename, join
+from settings import atomic_open
+
+
+# result stores of a project folder: results.sqlite, and one per workstation of a shared project
+def result_paths(folder):
+    paths = sorted(glob(join(folder, 'results_*.sqlite')))
+    if os.path.isfile(join(folder, 'results.sqlite')):
+        paths.insert(0, join(folder, 'results.sqlite'))
+    return paths
+
+
+def journal_path(store_path):
+    # journal.jsonl of results.sqlite, journal_<worker>.jsonl of results_<worker>.sqlite
+    folder, name = os.path.split(store_path)
+    return join(folder, 'journal' + name[len('results'):-len('.sqlite')] + '.jsonl')
+
+
+def read_journal(path):
+    # results a running or crashed session has not committed to its store yet
+    try:
+        with open(path, 'r') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+    entries = []
+    for line in lines:
+        try:
+            result = json.loads(line)
+        except ValueError:
+            continue
+        entries.append(dict(result, id=None, undone=0, data=result.get('data') or {}))
+    return entries
+
+
+def read_entries(path, latest=False):
+    # read only, with its own connection so a long export does not hold the lock of a store. The
+    # journal is merged in memory and left alone, the session that owns it may still be running.
+    # With latest only the last result of every image is read, the journal holds the newest ones.
+    journal = read_journal(journal_path(path))
+    if latest:
+        journal = list({entry['path']: entry for entry in journal}.values())
+    newer = {entry['path']: entry.get('op') for entry in journal} if latest else {}
+    query = 'SELECT * FROM results WHERE undone = 0 ORDER BY id'
+    if latest:
+        query = 'SELECT * FROM results WHERE id IN (SELECT MAX(id) FROM results WHERE undone = 0 GROUP BY path) ' \
+                'ORDER BY id'
+    conn = sqlite3.connect('file:{}?mode=ro'.format(pathname2url(os.path.abspath(path))), uri=True)
+    conn.row_factory = sqlite3.Row
+    ops = set()
+    try:
+        for row in conn.execute(query):
+            ops.add(row['op'])
+            if newer.get(row['path'], row['op']) == row['op']:
+                yield ResultStore.entry(row)
+    finally:
+        conn.close()
+    for entry in journal:
+        if entry.get('op') not in ops:
+            yield entry
+
+
+def merged_entries(paths):
+    entries = [entry for path in paths for entry in read_entries(path)]
+    if len(paths) > 1:
+        entries.sort(key=lambda entry: (entry['img_idx'] is None, entry['img_idx'] or 0))
+    return entries
+
+
+def write_csv(path, entries):
+    with atomic_open(path) as f:
+        for entry in entries:
+            f.write(entry['row'] + '\n')
+
+
+# Results of a project, one row per labeled image in the order they were saved. Undone rows are
+# only flagged so they can be redone, they are dropped as soon as a new result is added.
+class ResultStore:
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.conn:
+            self.conn.execute('CREATE TABLE IF NOT EXISTS results ('
+                              'id INTEGER PRIMARY KEY, '
+                              'img_idx INTEGER, '
+                              'path TEXT, '
+                              'row TEXT, '
+                              'data TEXT, '
+                              'undone INTEGER DEFAULT 0)')
+            columns = [row[1] for row in self.conn.execute('PRAGMA table_info(results)')]
+            if 'op' not in columns:
+                self.conn.execute('ALTER TABLE results ADD COLUMN op TEXT')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS results_path ON results (path)')
+            self.conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS results_op ON results (op)')
+
+    @staticmethod
+    def entry(row):
+        if row is None:
+            return None
+        entry = dict(row)
+        entry['data'] = json.loads(entry['data']) if entry['data'] else {}
+        return entry
+
+    @staticmethod
+    def new_result(img_idx, path, row, data=None):
+        # op identifies the result so a journal replay never adds it twice
+        return {'img_idx': img_idx, 'path': path, 'row': row, 'data': data, 'op': uuid.uuid4().hex}
+
+    def add(self, img_idx, path, row, data=None, op=None, commit=True):
+        with self.lock:
+            self.conn.execute('DELETE FROM results WHERE undone = 1')
+            cursor = self.conn.execute('INSERT OR IGNORE INTO results (img_idx, path, row, data, op) '
+                                       'VALUES (?, ?, ?, ?, ?)',
+                                       (img_idx, path, row, json.dumps(data) if data else None, op))
+            if commit:
+                self.conn.commit()
+            return cursor.lastrowid
+
+    def commit(self):
+        with self.lock:
+            self.conn.commit()
+
+    def replay(self, journal_path):
+        if not os.path.isfile(journal_path):
+            return 0
+        with open(journal_path, 'r') as f:
+            lines = f.read().splitlines()
+        count = 0
+        for line in lines:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                # last line cut short by the crash
+                continue
+            self.add(commit=False, **result)
+            count += 1
+        self.commit()
+        open(journal_path, 'w').close()
+        return count
+
+    def last(self):
+        with self.lock:
+            row = self.conn.execute('SELECT * FROM results WHERE undone = 0 ORDER BY id DESC LIMIT 1').fetchone()
+        return self.entry(row)
+
+    def undo(self):
+        with self.lock, self.conn:
+            row = self.conn.execute('SELECT * FROM results WHERE undone = 0 ORDER BY id DESC LIMIT 1').fetchone()
+            if row is not None:
+                self.conn.execute('UPDATE results SET undone = 1 WHERE id = ?', (row['id'],))
+        return self.entry(row)
+
+    def redo(self):
+        with self.lock, self.conn:
+            row = self.conn.execute('SELECT * FROM results WHERE undone = 1 ORDER BY id LIMIT 1').fetchone()
+            if row is not None:
+                self.conn.execute('UPDATE results SET undone = 0 WHERE id = ?', (row['id'],))
+        return self.entry(row)
+
+    def is_labeled(self, path):
+        with self.lock:
+            row = self.conn.execute('SELECT 1 FROM results WHERE path = ? AND undone = 0 LIMIT 1',
+                                    (path,)).fetchone()
+        return row is not None
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute('SELECT COUNT(*) FROM results WHERE undone = 0').fetchone()[0]
+
+    def entries(self):
+        return read_entries(self.path)
+
+    def export_csv(self, path):
+        write_csv(path, self.entries())
+
+    def import_csv(self, path, image_list):
+        # results of projects started before the store existed
+        indices = {}
+        for idx, image_path in enumerate(image_list):
+            indices.setdefault(basename(image_path), idx)
+        with open(path, 'r') as f:
+            lines = [line.rstrip('\n') for line in f if line.strip()]
+        with self.lock, self.conn:
+            for line in lines:
+                idx = indices.get(line.split(',')[0])
+                image_path = image_list[idx] if idx is not None else None
+                self.conn.execute('INSERT INTO results (img_idx, path, row) VALUES (?, ?, ?)',
+                                  (idx, image_path, line))
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
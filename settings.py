@@ -1,6 +1,10 @@
+import os
 import json
+import socket
 import functools
+import contextlib
 from os.path import join, exists
+from error_log import errors
 
 
 def handle_exceptions(func):
@@ -9,13 +13,25 @@ def handle_exceptions(func):
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            with open('errors.log', 'a+') as f:
-                f.write('Exception in {}: {}\n'.format(func.__name__, e))
+            errors.report(func, e)
             return None
 
     return func_wrapper
 
 
+# writes to a temporary file next to path and moves it over path once complete, so readers
+# and crashes never see a partially written file
+@contextlib.contextmanager
+def atomic_open(path, mode='w'):
+    # named per process, workstations of a shared project may write the same file
+    tmp_path = '{}.{}-{}.tmp'.format(path, socket.gethostname(), os.getpid())
+    with open(tmp_path, mode) as f:
+        yield f
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
 class Settings:
 
     @handle_exceptions
@@ -31,33 +47,68 @@ class Settings:
         self.object_names = []
         self.img_idx = 0
         self.eval_cc = self.eval_mlo = self.eval_mammo = self.eval_tomo = True
+        self.filters = []  # header index predicates, e.g. "manufacturer == 'SIEMENS'", images must match all
         self.copy_files = False
+        self.copy_mode = 'copy'  # how images are put into class folders: copy, hardlink, reflink or symlink
+        self.copy_workers = 4
         self.file_extension = 'dcm'
         self.decode = False
+        self.decode_cache_size = 10240  # MB of decompressed files kept in the project folder
+        self.fsync_interval = 1.0  # seconds results may wait in the journal before they are committed
+        self.cache_size = 2048  # MB of decoded images kept in memory
+        self.prefetch_ahead = 4
+        self.prefetch_behind = 2
+        self.watch_data = False
+        self.scan_interval = 10  # seconds between rescans of the data folder in watch mode
+        self.mask_encoding = 'rle'  # mask stored next to polygon vertices: 'rle' or '' for vertices only
+        self.shared = False  # several workstations label the project at the same time
+        self.lease_size = 20  # images leased to a workstation at a time in a shared project
+        self.lease_timeout = 1800  # seconds until the images of an unresponsive workstation are reclaimed
+        self.study_mode = False  # images are labeled study by study, the views of a study shown together
+
+    @handle_exceptions
+    def to_dict(self):
+        return {'project_name': self.project_name,
+                'author': self.author,
+                'institution': self.institution,
+                'data_folder': self.data_folder,
+                'project_folder': self.project_folder,
+                'class_labels': self.class_labels,
+                'classification_mode': self.classification_mode,
+                'object_detection': self.object_detection_mode,
+                'object_names': self.object_names,
+                'last_image': self.img_idx,
+                'copy_images': self.copy_files,
+                'eval_cc': self.eval_cc,
+                'eval_mlo': self.eval_mlo,
+                'eval_mammo': self.eval_mammo,
+                'eval_tomo': self.eval_tomo,
+                'filters': self.filters,
+                'file_extension': self.file_extension,
+                'decode': self.decode,
+                'copy_files': self.copy_files,
+                'cache_size': self.cache_size,
+                'prefetch_ahead': self.prefetch_ahead,
+                'prefetch_behind': self.prefetch_behind,
+                'watch_data': self.watch_data,
+                'scan_interval': self.scan_interval,
+                'mask_encoding': self.mask_encoding,
+                'decode_cache_size': self.decode_cache_size,
+                'fsync_interval': self.fsync_interval,
+                'copy_mode': self.copy_mode,
+                'copy_workers': self.copy_workers,
+                'shared': self.shared,
+                'lease_size': self.lease_size,
+                'lease_timeout': self.lease_timeout,
+                'study_mode': self.study_mode}
 
     @handle_exceptions
-    def save(self):
-        settings_dict = {'project_name': self.project_name,
-                         'author': self.author,
-                         'institution': self.institution,
-                         'data_folder': self.data_folder,
-                         'project_folder': self.project_folder,
-                         'class_labels': self.class_labels,
-                         'classification_mode': self.classification_mode,
-                         'object_detection': self.object_detection_mode,
-                         'object_names': self.object_names,
-                         'last_image': self.img_idx,
-                         'copy_images': self.copy_files,
-                         'eval_cc': self.eval_cc,
-                         'eval_mlo': self.eval_mlo,
-                         'eval_mammo': self.eval_mammo,
-                         'eval_tomo': self.eval_tomo,
-                         'file_extension': self.file_extension,
-                         'decode': self.decode,
-                         'copy_files': self.copy_files}
+    def save(self, settings_dict=None):
+        if settings_dict is None:
+            settings_dict = self.to_dict()
         path = join(self.project_folder, 'settings.json')
 
-        with open(path, 'w') as json_file:
+        with atomic_open(path) as json_file:
             json.dump(settings_dict, json_file)
 
     @handle_exceptions
@@ -80,6 +131,21 @@ class Settings:
             self.eval_mlo = settings_dict['eval_mlo']
             self.eval_mammo = settings_dict['eval_mammo']
             self.eval_tomo = settings_dict['eval_tomo']
+            self.filters = settings_dict.get('filters', self.filters)
             self.project_folder = settings_dict['project_folder']
             self.file_extension = settings_dict['file_extension']
             self.decode = settings_dict['decode']
+            self.cache_size = settings_dict.get('cache_size', self.cache_size)
+            self.prefetch_ahead = settings_dict.get('prefetch_ahead', self.prefetch_ahead)
+            self.prefetch_behind = settings_dict.get('prefetch_behind', self.prefetch_behind)
+            self.watch_data = settings_dict.get('watch_data', self.watch_data)
+            self.scan_interval = settings_dict.get('scan_interval', self.scan_interval)
+            self.mask_encoding = settings_dict.get('mask_encoding', self.mask_encoding)
+            self.decode_cache_size = settings_dict.get('decode_cache_size', self.decode_cache_size)
+            self.fsync_interval = settings_dict.get('fsync_interval', self.fsync_interval)
+            self.copy_mode = settings_dict.get('copy_mode', self.copy_mode)
+            self.copy_workers = settings_dict.get('copy_workers', self.copy_workers)
+            self.shared = settings_dict.get('shared', self.shared)
+            self.lease_size = settings_dict.get('lease_size', self.lease_size)
+            self.lease_timeout = settings_dict.get('lease_timeout', self.lease_timeout)
+            self.study_mode = settings_dict.get('study_mode', self.study_mode)
@@ -11,7 +11,8 @@ a = Analysis(['../main_window.py'],
 			('/home/mrv6/labeling_tool/mplwidget.py', '.'),
 			('/home/mrv6/labeling_tool/main_window.ui', '.')
 			 ],
-             hiddenimports=["matplotlib"],
+             hiddenimports=["matplotlib",
+                            "ui_main_window", "ui_msg", "ui_start_dialog", "ui_step_1", "ui_step_2", "ui_step_3_4"],
              hookspath=[],
              runtime_hooks=[],
              excludes=[],
@@ -0,0 +1,29 @@
+# (laterality, view) of the screening views: the order they are labeled in, one breast after
+# the other, and their (row, column) on screen, right breast on the left as it is hung
+VIEWS = [('R', 'CC'), ('R', 'MLO'), ('L', 'CC'), ('L', 'MLO')]
+HANGING_PROTOCOL = {('R', 'CC'): (0, 0), ('L', 'CC'): (0, 1), ('R', 'MLO'): (1, 0), ('L', 'MLO'): (1, 1)}
+
+
+def view_label(header):
+    if header is None:
+        return '', ''
+    laterality = (header.get('laterality') or '').upper()[:1]
+    projection = (header.get('view_position') or '').upper()
+    view = 'MLO' if 'MLO' in projection else 'CC' if 'CC' in projection else projection
+    return laterality, view
+
+
+def view_slot(header):
+    label = view_label(header)
+    return VIEWS.index(label) if label in VIEWS else len(VIEWS)
+
+
+# Image indices grouped by StudyInstanceUID from the header index rows, both breasts in one study
+# so all four views are shown together, sorted by laterality and view within it. Studies are in
+# the order their first image appears, images without a study UID are studies of their own.
+def group_studies(headers):
+    studies = {}
+    for idx, header in enumerate(headers):
+        uid = header.get('study_uid') if header else None
+        studies.setdefault(uid if uid else ('image', idx), []).append(idx)
+    return [sorted(indices, key=lambda idx: (view_slot(headers[idx]), idx)) for indices in studies.values()]
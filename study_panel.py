@@ -0,0 +1,77 @@
+from PyQt5.QtWidgets import QWidget, QGridLayout, QToolButton
+from PyQt5.QtGui import QImage, QPixmap, QIcon
+from PyQt5.QtCore import Qt, QSize, pyqtSignal
+import numpy as np
+from settings import handle_exceptions
+from windowing import WindowLUT, supports_lut
+from studies import HANGING_PROTOCOL, view_label
+
+THUMBNAIL_SIZE = 120
+
+
+# The views of the current study laid out as hung, each a button showing a thumbnail of the
+# image once it is decoded. Clicking a view emits its image index.
+class StudyPanel(QWidget):
+    view_selected = pyqtSignal(int)
+
+    @handle_exceptions
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setLayout(QGridLayout())
+        self.lut = WindowLUT()
+        self.buttons = {}
+
+    @handle_exceptions
+    def show_study(self, views, current):
+        # views: (image index, header index row, decoded image or None) of every image of the study
+        layout = self.layout()
+        for button in self.buttons.values():
+            layout.removeWidget(button)
+            button.deleteLater()
+        self.buttons = {}
+        extra = 0
+        for idx, header, image in views:
+            button = QToolButton(self)
+            button.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
+            button.setIconSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+            button.setCheckable(True)
+            button.setChecked(idx == current)
+            label = view_label(header)
+            button.setText(' '.join(label).strip() or str(idx + 1))
+            button.clicked.connect(lambda checked, idx=idx: self.view_selected.emit(idx))
+            if label in HANGING_PROTOCOL and label not in [view_label(h) for i, h, _ in views if i < idx]:
+                row, column = HANGING_PROTOCOL[label]
+            else:
+                # views beyond the protocol go below it
+                row, column = 2 + extra // 2, extra % 2
+                extra += 1
+            layout.addWidget(button, row, column)
+            self.buttons[idx] = button
+            self.set_thumbnail(idx, image)
+
+    @handle_exceptions
+    def set_thumbnail(self, idx, image):
+        button = self.buttons.get(idx)
+        if button is None or image is None:
+            return
+        data = image.levels.coarsest
+        val_min = image.val_min if image.val_min is not None else image.data_min
+        val_max = image.val_max if image.val_max is not None else image.data_max
+        if supports_lut(data):
+            data = self.lut.apply(data, val_min, val_max)
+        else:
+            scale = 255 / max(val_max - val_min, 1e-6)
+            data = np.clip((data.astype(np.float32) - val_min) * scale, 0, 255).astype(np.uint8)
+        data = np.ascontiguousarray(data)
+        height, width = data.shape[:2]
+        qimage = QImage(data.data, width, height, data.strides[0], QImage.Format_Grayscale8)
+        pixmap = QPixmap.fromImage(qimage).scaled(THUMBNAIL_SIZE, THUMBNAIL_SIZE, Qt.KeepAspectRatio,
+                                                  Qt.SmoothTransformation)
+        button.setIcon(QIcon(pixmap))
+
+    def missing(self):
+        return [idx for idx, button in self.buttons.items() if button.icon().isNull()]
+
+    @handle_exceptions
+    def clear(self):
+        self.show_study([], None)
@@ -0,0 +1,5 @@
+import sys
+from os.path import dirname, abspath
+
+# the modules of the application live in the repository root
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
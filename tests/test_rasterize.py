@@ -0,0 +1,150 @@
+import numpy as np
+import pytest
+from matplotlib.path import Path
+
+from rasterize import rasterize
+from regions import encode_raster_rle, decode_rle
+
+SHAPE = (60, 80)
+
+
+def random_polygon(rng, shape, vertices=12):
+    # star shaped, whole pixel vertices as clicked on the screen, possibly past the image edge
+    rows, columns = shape
+    angles = np.sort(rng.uniform(0, 2 * np.pi, vertices))
+    radii = rng.uniform(3, min(rows, columns) / 2, vertices)
+    center = rng.uniform(-5, [columns + 5, rows + 5])
+    xs = np.rint(center[0] + radii * np.cos(angles)).astype(int)
+    ys = np.rint(center[1] + radii * np.sin(angles)).astype(int)
+    return [[int(x), int(y)] for x, y in zip(xs, ys)]
+
+
+def centres(shape):
+    rows, columns = np.mgrid[0:shape[0], 0:shape[1]]
+    return np.column_stack((columns.ravel(), rows.ravel())).astype(float)
+
+
+def outline_distance(vertices, points):
+    # distance of every point to the closest edge of the polygon
+    start = np.asarray(vertices, dtype=float)
+    end = np.roll(start, -1, axis=0)
+    edge = end - start
+    length = np.maximum((edge ** 2).sum(axis=1), 1e-12)
+    t = np.clip(((points[:, None, :] - start) * edge).sum(axis=2) / length, 0, 1)
+    closest = start + t[:, :, None] * edge
+    return np.sqrt(((points[:, None, :] - closest) ** 2).sum(axis=2)).min(axis=1)
+
+
+def check_against_path(vertices, mask):
+    # pixels well inside are all set, set pixels are inside or at most half a pixel from the outline
+    points = centres(mask.shape)
+    inside = Path(vertices).contains_points(points)
+    distance = outline_distance(vertices, points)
+    flat = mask.ravel()
+    assert flat[inside & (distance > 1)].all()
+    assert (inside | (distance <= np.sqrt(0.5) + 1e-9))[flat].all()
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_polygons_match_path(seed):
+    rng = np.random.default_rng(seed)
+    polygons = [random_polygon(rng, SHAPE) for _ in range(5)]
+    for vertices, raster in zip(polygons, rasterize(polygons, SHAPE)):
+        check_against_path(vertices, raster.full_mask(SHAPE))
+
+
+def test_orientation_does_not_matter():
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        vertices = random_polygon(rng, SHAPE)
+        clockwise, counter_clockwise = rasterize([vertices, vertices[::-1]], SHAPE)
+        assert np.array_equal(clockwise.full_mask(SHAPE), counter_clockwise.full_mask(SHAPE))
+
+
+def test_rectangle():
+    raster = rasterize([[[2, 3], [9, 3], [9, 7], [2, 7]]], SHAPE)[0]
+    expected = np.zeros(SHAPE, dtype=bool)
+    expected[3:8, 2:10] = True
+    assert np.array_equal(raster.full_mask(SHAPE), expected)
+    assert raster.area == 40
+    assert raster.centroid == (5.0, 5.5)
+
+
+def test_concave_polygon():
+    # a U, the notch between the arms stays empty
+    vertices = [[0, 0], [10, 0], [10, 10], [7, 10], [7, 3], [3, 3], [3, 10], [0, 10]]
+    mask = rasterize([vertices], SHAPE)[0].full_mask(SHAPE)
+    check_against_path(vertices, mask)
+    assert not mask[5:10, 4:7].any()
+    assert mask[5:11, 0:4].all() and mask[5:11, 7:11].all()
+
+
+@pytest.mark.parametrize('vertices', [[], [[4, 5]], [[4, 5], [10, 12]]])
+def test_too_few_vertices(vertices):
+    raster = rasterize([vertices], SHAPE)[0]
+    assert raster.area == 0
+    assert raster.centroid is None
+    assert not raster.full_mask(SHAPE).any()
+
+
+def test_collinear_and_repeated_vertices():
+    # no interior, only the pixels of the line
+    line = rasterize([[[2, 2], [6, 2], [10, 2]]], SHAPE)[0].full_mask(SHAPE)
+    assert np.array_equal(np.argwhere(line), [[2, x] for x in range(2, 11)])
+    point = rasterize([[[4, 4], [4, 4], [4, 4]]], SHAPE)[0]
+    assert point.area == 1 and point.centroid == (4.0, 4.0)
+    # a repeated vertex does not change the polygon
+    square = [[2, 2], [8, 2], [8, 8], [2, 8]]
+    repeated = [[2, 2], [8, 2], [8, 2], [8, 8], [2, 8], [2, 2]]
+    first, second = rasterize([square, repeated], SHAPE)
+    assert np.array_equal(first.full_mask(SHAPE), second.full_mask(SHAPE))
+
+
+def test_outside_the_image():
+    raster = rasterize([[[-20, -20], [-5, -20], [-5, -5]], [[100, 100], [120, 100], [120, 130]]], SHAPE)
+    assert all(r.area == 0 and r.centroid is None and not r.full_mask(SHAPE).any() for r in raster)
+
+
+def test_cut_by_the_image_edge():
+    # the same as the part of the polygon rasterized inside a larger image
+    rng = np.random.default_rng(2)
+    margin = 40
+    large = (SHAPE[0] + 2 * margin, SHAPE[1] + 2 * margin)
+    for _ in range(30):
+        vertices = random_polygon(rng, SHAPE)
+        shifted = [[x + margin, y + margin] for x, y in vertices]
+        cut = rasterize([vertices], SHAPE)[0].full_mask(SHAPE)
+        whole = rasterize([shifted], large)[0].full_mask(large)
+        assert np.array_equal(cut, whole[margin:margin + SHAPE[0], margin:margin + SHAPE[1]])
+
+
+def test_area_and_centroid():
+    rng = np.random.default_rng(3)
+    for raster in rasterize([random_polygon(rng, SHAPE) for _ in range(30)], SHAPE):
+        mask = raster.full_mask(SHAPE)
+        assert raster.area == np.count_nonzero(mask)
+        if raster.area:
+            rows, columns = np.nonzero(mask)
+            assert raster.centroid == pytest.approx((rows.mean(), columns.mean()))
+        else:
+            assert raster.centroid is None
+
+
+def test_paste_keeps_other_pixels():
+    labels = np.full(SHAPE, 7, dtype=np.uint8)
+    raster = rasterize([[[2, 2], [8, 2], [8, 8], [2, 8]]], SHAPE)[0]
+    raster.paste(labels, 3)
+    assert (labels[2:9, 2:9] == 3).all()
+    assert np.count_nonzero(labels == 7) == SHAPE[0] * SHAPE[1] - 49
+
+
+def test_rle_round_trip():
+    rng = np.random.default_rng(4)
+    polygons = [random_polygon(rng, SHAPE) for _ in range(30)]
+    # the first and last pixel set, the first run of zeros is empty
+    polygons += [[[0, 0], [5, 0], [0, 5]], [[79, 59], [70, 59], [79, 50]], [[0, 0], [79, 0], [79, 59], [0, 59]]]
+    for raster in rasterize(polygons + [[]], SHAPE):
+        rle = encode_raster_rle(raster, SHAPE)
+        assert rle['size'] == list(SHAPE)
+        assert sum(rle['counts']) == SHAPE[0] * SHAPE[1]
+        assert np.array_equal(decode_rle(rle), raster.full_mask(SHAPE))
@@ -0,0 +1,128 @@
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+# seconds from the first import of this module, main_window imports it before anything else
+STARTUP_BUDGET = {'first_window': 1.5, 'first_image': 2.0}
+# longer stays on one image are breaks, not work, and are left out of the throughput
+IDLE_LIMIT = 300
+
+
+class StartupTimer:
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = []
+        self.marks = {}
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.marks[phase] = now - self.start
+        self.last = now
+
+    def project_started(self):
+        # time spent in the start dialog and the project wizard is the user's, not ours
+        now = time.perf_counter()
+        self.marks['project_start'] = now - self.start
+        self.last = now
+
+    def report(self):
+        lines = ['{:<20}{:8.3f} s'.format(phase, duration) for phase, duration in self.phases]
+        for phase, budget in STARTUP_BUDGET.items():
+            if phase in self.marks:
+                duration = self.marks[phase] if phase == 'first_window' else self.since_project(phase)
+                status = 'ok' if duration <= budget else 'OVER BUDGET'
+                lines.append('{:<20}{:8.3f} s  (budget {:.1f} s, {})'.format('time to ' + phase, duration,
+                                                                               budget, status))
+        return '\n'.join(lines)
+
+    def since_project(self, phase):
+        return self.marks[phase] - self.marks.get('project_start', 0)
+
+
+startup = StartupTimer()
+
+
+# Stage timings and per-image dwell times of a labeling session, buffered on the UI thread
+# and appended to a JSONL file in the project folder by flush().
+class SpanLog:
+
+    def __init__(self, path, user=''):
+        self.path = path
+        self.user = user
+        self.records = []
+        self.lock = threading.Lock()
+        self.shown = None
+
+    @contextmanager
+    def span(self, stage, image=None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, image, time.perf_counter() - start)
+
+    def add(self, stage, image, seconds):
+        record = {'time': time.time(), 'user': self.user, 'stage': stage, 'image': image,
+                  'ms': round(seconds * 1000, 3)}
+        with self.lock:
+            self.records.append(record)
+
+    def image_shown(self, image):
+        if self.shown is None or self.shown[0] != image:
+            self.shown = (image, time.perf_counter())
+
+    def image_done(self, image):
+        if self.shown is not None and self.shown[0] == image:
+            self.add('dwell', image, time.perf_counter() - self.shown[1])
+            self.shown = None
+
+    def flush(self):
+        with self.lock:
+            records, self.records = self.records, []
+        if records:
+            with open(self.path, 'a') as f:
+                f.write(''.join(json.dumps(record) + '\n' for record in records))
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q / 100 * len(values)))]
+
+
+def summarize(path):
+    stages = {}
+    dwell = {}
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # a line cut short by a crash
+                continue
+            stages.setdefault(record['stage'], []).append(record['ms'])
+            if record['stage'] == 'dwell':
+                dwell.setdefault(record.get('user', ''), []).append(record['ms'] / 1000)
+    summary = {'stages': {stage: {'count': len(values),
+                                  'p50_ms': percentile(values, 50),
+                                  'p95_ms': percentile(values, 95)} for stage, values in stages.items()},
+               'users': {}}
+    for user, seconds in dwell.items():
+        active = [s for s in seconds if s <= IDLE_LIMIT]
+        summary['users'][user] = {'images': len(seconds),
+                                  'images_per_hour': 3600 * len(active) / sum(active) if sum(active) else 0}
+    return summary
+
+
+def format_summary(summary):
+    lines = ['{:<14}{:>8}{:>12}{:>12}'.format('stage', 'count', 'p50 ms', 'p95 ms')]
+    for stage, values in sorted(summary['stages'].items()):
+        lines.append('{:<14}{:8d}{:12.1f}{:12.1f}'.format(stage, values['count'], values['p50_ms'],
+                                                         values['p95_ms']))
+    for user, values in sorted(summary['users'].items()):
+        lines.append('{}: {} images, {:.0f} images per hour'.format(user or 'unknown', values['images'],
+                                                                    values['images_per_hour']))
+    return '\n'.join(lines)
@@ -0,0 +1,30 @@
+# Multi-frame volumes (tomosynthesis reconstructions) are addressed one frame at a time: image
+# cache keys are (path, frame) and only that frame is read from the file and decoded.
+
+
+def frame_count(header):
+    # header index row of an image, 1 for single frame images and unindexed files
+    if header is None or not header.get('frames'):
+        return 1
+    return int(header['frames'])
+
+
+def first_frame(frames):
+    # volumes open at the middle slice
+    return frames // 2
+
+
+def read_frame(path, frame, decoder=None):
+    # returns the frame and the dataset without its pixel data
+    from pydicom import Dataset
+    from pydicom.pixels import pixel_array
+    header = Dataset()
+    try:
+        return pixel_array(path, index=frame, ds_out=header), header
+    except Exception:
+        # no decoder for this transfer syntax, read the frame from the decompressed copy
+        if decoder is None:
+            raise
+        decoder.read(path)
+        header = Dataset()
+        return pixel_array(decoder.cache_path(path), index=frame, ds_out=header), header
@@ -1,11 +1,11 @@
 from PyQt5.QtWidgets import QFileDialog, QTableWidgetItem
-from PyQt5.uic import loadUi
 from PyQt5.QtCore import Qt
-from glob import glob
-from os.path import join, abspath
+from os.path import abspath
 from PyQt5.QtCore import pyqtSlot
 import sys
 from settings import Settings, handle_exceptions
+from dataset_scan import has_files
+from forms import load_form
 
 
 class Tutorial:
@@ -19,7 +19,7 @@ class Tutorial:
 
     @handle_exceptions
     def step_1(self):
-        self.project_creator_dialog = loadUi(join(self.folder, 'step_1.ui'))
+        self.project_creator_dialog = load_form('step_1')
         self.project_creator_dialog.setWindowFlags(
             self.project_creator_dialog.windowFlags() | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
             | Qt.X11BypassWindowManagerHint)
@@ -79,19 +79,15 @@ class Tutorial:
 
     @handle_exceptions
     def eval_step_1(self):
-        pattern = join('**', '*.' + self.settings.file_extension)
-        path = join(self.settings.data_folder, pattern)
-        image_list = glob(path, recursive=True)
-
         is_ready = bool(self.settings.project_folder)
-        is_ready = is_ready and len(image_list)
+        is_ready = is_ready and has_files(self.settings.data_folder, self.settings.file_extension)
 
         self.project_creator_dialog.button_next.setEnabled(is_ready)
 
     @pyqtSlot()
     @handle_exceptions
     def step_2(self):
-        self.project_creator_dialog = loadUi(join(self.folder, 'step_2.ui'))
+        self.project_creator_dialog = load_form('step_2')
         self.project_creator_dialog.setWindowFlags(
             self.project_creator_dialog.windowFlags() | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
             | Qt.X11BypassWindowManagerHint)
@@ -163,7 +159,7 @@ class Tutorial:
 
     @handle_exceptions
     def step_3(self):
-        self.project_creator_dialog = loadUi(join(self.folder, 'step_3_4.ui'))
+        self.project_creator_dialog = load_form('step_3_4')
         self.project_creator_dialog.setWindowFlags(self.project_creator_dialog.windowFlags() | Qt.FramelessWindowHint
                                                    | Qt.WindowStaysOnTopHint | Qt.X11BypassWindowManagerHint)
         self.project_creator_dialog.show()
@@ -191,7 +187,7 @@ class Tutorial:
 
     @handle_exceptions
     def step_4(self):
-        self.project_creator_dialog = loadUi(join(self.folder, 'step_3_4.ui'))
+        self.project_creator_dialog = load_form('step_3_4')
         self.project_creator_dialog.setWindowFlags(
             self.project_creator_dialog.windowFlags() | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
             | Qt.X11BypassWindowManagerHint)
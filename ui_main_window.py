@@ -0,0 +1,474 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'main_window.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1458, 1176)
+        MainWindow.setStyleSheet("background: #272727;")
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.gridLayout_2 = QtWidgets.QGridLayout(self.centralwidget)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.frame_4 = QtWidgets.QFrame(self.centralwidget)
+        self.frame_4.setMinimumSize(QtCore.QSize(0, 70))
+        self.frame_4.setMaximumSize(QtCore.QSize(16777215, 70))
+        self.frame_4.setStyleSheet("border:none")
+        self.frame_4.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_4.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_4.setObjectName("frame_4")
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout(self.frame_4)
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.label_logo = QtWidgets.QLabel(self.frame_4)
+        self.label_logo.setMinimumSize(QtCore.QSize(193, 50))
+        self.label_logo.setMaximumSize(QtCore.QSize(193, 50))
+        self.label_logo.setText("")
+        self.label_logo.setPixmap(QtGui.QPixmap("../GUI Labeling/C:/Users/alexa/Pictures/logo_b_rayZ.png"))
+        self.label_logo.setScaledContents(True)
+        self.label_logo.setObjectName("label_logo")
+        self.horizontalLayout_5.addWidget(self.label_logo)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_5.addItem(spacerItem)
+        self.hint_label = QtWidgets.QLabel(self.frame_4)
+        self.hint_label.setMinimumSize(QtCore.QSize(350, 0))
+        self.hint_label.setMaximumSize(QtCore.QSize(350, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.hint_label.setFont(font)
+        self.hint_label.setStyleSheet("color: #e6e6e6")
+        self.hint_label.setText("")
+        self.hint_label.setObjectName("hint_label")
+        self.horizontalLayout_5.addWidget(self.hint_label)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_5.addItem(spacerItem1)
+        self.line_image_idx = QtWidgets.QLineEdit(self.frame_4)
+        self.line_image_idx.setMinimumSize(QtCore.QSize(100, 50))
+        self.line_image_idx.setMaximumSize(QtCore.QSize(100, 50))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(14)
+        self.line_image_idx.setFont(font)
+        self.line_image_idx.setFocusPolicy(QtCore.Qt.ClickFocus)
+        self.line_image_idx.setStyleSheet("color:white;\n"
+"background: #272727;")
+        self.line_image_idx.setText("")
+        self.line_image_idx.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.line_image_idx.setObjectName("line_image_idx")
+        self.horizontalLayout_5.addWidget(self.line_image_idx)
+        self.label_total_images = QtWidgets.QLabel(self.frame_4)
+        self.label_total_images.setMinimumSize(QtCore.QSize(100, 50))
+        self.label_total_images.setMaximumSize(QtCore.QSize(100, 50))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(14)
+        self.label_total_images.setFont(font)
+        self.label_total_images.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.label_total_images.setStyleSheet("color:white;\n"
+"background: #272727;\n"
+"")
+        self.label_total_images.setText("")
+        self.label_total_images.setObjectName("label_total_images")
+        self.horizontalLayout_5.addWidget(self.label_total_images)
+        self.button_jump = QtWidgets.QPushButton(self.frame_4)
+        self.button_jump.setMinimumSize(QtCore.QSize(50, 50))
+        self.button_jump.setMaximumSize(QtCore.QSize(50, 50))
+        self.button_jump.setStyleSheet("color:white;\n"
+"background: #272727;")
+        self.button_jump.setObjectName("button_jump")
+        self.horizontalLayout_5.addWidget(self.button_jump)
+        self.verticalLayout.addWidget(self.frame_4)
+        self.screen = MplWidget(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.screen.sizePolicy().hasHeightForWidth())
+        self.screen.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(15)
+        self.screen.setFont(font)
+        self.screen.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.screen.setAutoFillBackground(False)
+        self.screen.setStyleSheet("background: #272727;\n"
+"border:1px solid  #ff655a;")
+        self.screen.setObjectName("screen")
+        self.verticalLayout.addWidget(self.screen)
+        self.buttons_layout = QtWidgets.QHBoxLayout()
+        self.buttons_layout.setContentsMargins(9, -1, -1, -1)
+        self.buttons_layout.setObjectName("buttons_layout")
+        self.verticalLayout.addLayout(self.buttons_layout)
+        self.horizontalLayout_3.addLayout(self.verticalLayout)
+        self.frame_3 = QtWidgets.QFrame(self.centralwidget)
+        self.frame_3.setMinimumSize(QtCore.QSize(280, 0))
+        self.frame_3.setMaximumSize(QtCore.QSize(280, 16777215))
+        self.frame_3.setStyleSheet("border: 1px solid  #ff655a;")
+        self.frame_3.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_3.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_3.setObjectName("frame_3")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.frame_3)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.table = QtWidgets.QTableWidget(self.frame_3)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.table.sizePolicy().hasHeightForWidth())
+        self.table.setSizePolicy(sizePolicy)
+        self.table.setMinimumSize(QtCore.QSize(254, 500))
+        self.table.setMaximumSize(QtCore.QSize(254, 16777215))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.table.setFont(font)
+        self.table.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.table.setAutoFillBackground(False)
+        self.table.setStyleSheet("\n"
+"QHeaderView::section { \n"
+"background-color:#272727;\n"
+"padding:8px;\n"
+"border-style: none;\n"
+"color:white;\n"
+"}\n"
+"\n"
+"QTableWidget::item {\n"
+"    color: white;\n"
+"}\n"
+"\n"
+"\n"
+"\n"
+"")
+        self.table.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.table.setGridStyle(QtCore.Qt.SolidLine)
+        self.table.setColumnCount(1)
+        self.table.setObjectName("table")
+        self.table.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        item.setFont(font)
+        self.table.setHorizontalHeaderItem(0, item)
+        self.table.horizontalHeader().setDefaultSectionSize(166)
+        self.table.horizontalHeader().setHighlightSections(True)
+        self.table.horizontalHeader().setMinimumSectionSize(140)
+        self.table.verticalHeader().setDefaultSectionSize(50)
+        self.table.verticalHeader().setMinimumSectionSize(50)
+        self.verticalLayout_2.addWidget(self.table)
+        spacerItem2 = QtWidgets.QSpacerItem(20, 192, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem2)
+        self.label_2 = QtWidgets.QLabel(self.frame_3)
+        self.label_2.setEnabled(False)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(14)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_2.setFont(font)
+        self.label_2.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_2.addWidget(self.label_2)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.checkbox_implants = QtWidgets.QCheckBox(self.frame_3)
+        self.checkbox_implants.setMinimumSize(QtCore.QSize(0, 40))
+        self.checkbox_implants.setMaximumSize(QtCore.QSize(16777215, 11111))
+        self.checkbox_implants.setStyleSheet("color: white;")
+        self.checkbox_implants.setObjectName("checkbox_implants")
+        self.horizontalLayout.addWidget(self.checkbox_implants)
+        self.checkbox_reduction = QtWidgets.QCheckBox(self.frame_3)
+        self.checkbox_reduction.setMinimumSize(QtCore.QSize(0, 40))
+        self.checkbox_reduction.setMaximumSize(QtCore.QSize(16777215, 11111))
+        self.checkbox_reduction.setStyleSheet("color: white;")
+        self.checkbox_reduction.setObjectName("checkbox_reduction")
+        self.horizontalLayout.addWidget(self.checkbox_reduction)
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.checkbox_surgery = QtWidgets.QCheckBox(self.frame_3)
+        self.checkbox_surgery.setMinimumSize(QtCore.QSize(0, 40))
+        self.checkbox_surgery.setMaximumSize(QtCore.QSize(16777215, 11111))
+        self.checkbox_surgery.setStyleSheet("color: white;")
+        self.checkbox_surgery.setObjectName("checkbox_surgery")
+        self.horizontalLayout_2.addWidget(self.checkbox_surgery)
+        self.checkbox_other = QtWidgets.QCheckBox(self.frame_3)
+        self.checkbox_other.setMinimumSize(QtCore.QSize(0, 40))
+        self.checkbox_other.setMaximumSize(QtCore.QSize(16777215, 11111))
+        self.checkbox_other.setStyleSheet("color: white;")
+        self.checkbox_other.setObjectName("checkbox_other")
+        self.horizontalLayout_2.addWidget(self.checkbox_other)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_2)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 192, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem3)
+        self.label = QtWidgets.QLabel(self.frame_3)
+        self.label.setEnabled(False)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(14)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label.setFont(font)
+        self.label.setAlignment(QtCore.Qt.AlignCenter)
+        self.label.setObjectName("label")
+        self.verticalLayout_2.addWidget(self.label)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.button_save_roi = QtWidgets.QPushButton(self.frame_3)
+        self.button_save_roi.setEnabled(False)
+        self.button_save_roi.setMinimumSize(QtCore.QSize(126, 0))
+        self.button_save_roi.setMaximumSize(QtCore.QSize(126, 16777215))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.button_save_roi.setFont(font)
+        self.button_save_roi.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.button_save_roi.setAutoFillBackground(False)
+        self.button_save_roi.setStyleSheet("  background: #ff655a;\n"
+"\n"
+"  font:inherit;\n"
+"  border: 1px solid grey;\n"
+"  border-radius: 6px;\n"
+"  padding: 0.25rem 1rem;\n"
+"  margin-right: 1rem;\n"
+"  color:white;\n"
+"height:40px;\n"
+"")
+        self.button_save_roi.setObjectName("button_save_roi")
+        self.horizontalLayout_4.addWidget(self.button_save_roi)
+        self.button_finish_location = QtWidgets.QPushButton(self.frame_3)
+        self.button_finish_location.setEnabled(False)
+        self.button_finish_location.setMinimumSize(QtCore.QSize(126, 0))
+        self.button_finish_location.setMaximumSize(QtCore.QSize(126, 16777215))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.button_finish_location.setFont(font)
+        self.button_finish_location.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.button_finish_location.setAutoFillBackground(False)
+        self.button_finish_location.setStyleSheet("  background: #ff655a;\n"
+"\n"
+"  font:inherit;\n"
+"  border: 1px solid grey;\n"
+"  border-radius: 6px;\n"
+"  padding: 0.25rem 1rem;\n"
+"  margin-right: 1rem;\n"
+"  color:white;\n"
+"height:40px;\n"
+"")
+        self.button_finish_location.setObjectName("button_finish_location")
+        self.horizontalLayout_4.addWidget(self.button_finish_location)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_4)
+        spacerItem4 = QtWidgets.QSpacerItem(20, 192, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem4)
+        self.button_skip_step = QtWidgets.QPushButton(self.frame_3)
+        self.button_skip_step.setMinimumSize(QtCore.QSize(254, 0))
+        self.button_skip_step.setMaximumSize(QtCore.QSize(254, 16777215))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.button_skip_step.setFont(font)
+        self.button_skip_step.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.button_skip_step.setStyleSheet("  background: #ff655a;\n"
+"\n"
+"  font:inherit;\n"
+"  border: 1px solid grey;\n"
+"  border-radius: 6px;\n"
+"  padding: 0.25rem 1rem;\n"
+"  margin-right: 1rem;\n"
+"  color:white;\n"
+"height:40px;\n"
+"")
+        self.button_skip_step.setObjectName("button_skip_step")
+        self.verticalLayout_2.addWidget(self.button_skip_step)
+        spacerItem5 = QtWidgets.QSpacerItem(20, 192, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem5)
+        self.button_skip = QtWidgets.QPushButton(self.frame_3)
+        self.button_skip.setMinimumSize(QtCore.QSize(254, 0))
+        self.button_skip.setMaximumSize(QtCore.QSize(254, 16777215))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.button_skip.setFont(font)
+        self.button_skip.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.button_skip.setStyleSheet("  background: #ff655a;\n"
+"\n"
+"  font:inherit;\n"
+"  border: 1px solid grey;\n"
+"  border-radius: 6px;\n"
+"  padding: 0.25rem 1rem;\n"
+"  margin-right: 1rem;\n"
+"  color:white;\n"
+"height:40px;\n"
+"")
+        self.button_skip.setObjectName("button_skip")
+        self.verticalLayout_2.addWidget(self.button_skip)
+        self.button_back = QtWidgets.QPushButton(self.frame_3)
+        self.button_back.setMinimumSize(QtCore.QSize(254, 0))
+        self.button_back.setMaximumSize(QtCore.QSize(254, 16777215))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.button_back.setFont(font)
+        self.button_back.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.button_back.setStyleSheet("  background: #ff655a;\n"
+"\n"
+"  font:inherit;\n"
+"  border: 1px solid grey;\n"
+"  border-radius: 6px;\n"
+"  padding: 0.25rem 1rem;\n"
+"  margin-right: 1rem;\n"
+"  color:white;\n"
+"height:40px;\n"
+"")
+        self.button_back.setObjectName("button_back")
+        self.verticalLayout_2.addWidget(self.button_back)
+        self.horizontalLayout_3.addWidget(self.frame_3)
+        self.gridLayout_2.addLayout(self.horizontalLayout_3, 1, 0, 1, 1)
+        self.label_filename = QtWidgets.QLabel(self.centralwidget)
+        self.label_filename.setStyleSheet("color:white;")
+        self.label_filename.setText("")
+        self.label_filename.setObjectName("label_filename")
+        self.gridLayout_2.addWidget(self.label_filename, 0, 0, 1, 1)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1458, 30))
+        self.menubar.setMinimumSize(QtCore.QSize(0, 0))
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        font.setBold(False)
+        font.setItalic(False)
+        font.setWeight(50)
+        self.menubar.setFont(font)
+        self.menubar.setAutoFillBackground(False)
+        self.menubar.setStyleSheet("color:white;")
+        self.menubar.setObjectName("menubar")
+        self.menuTools = QtWidgets.QMenu(self.menubar)
+        self.menuTools.setObjectName("menuTools")
+        self.menuFile_Type = QtWidgets.QMenu(self.menuTools)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        self.menuFile_Type.setFont(font)
+        self.menuFile_Type.setObjectName("menuFile_Type")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.menu_new = QtWidgets.QAction(MainWindow)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.menu_new.setFont(font)
+        self.menu_new.setObjectName("menu_new")
+        self.menu_continue = QtWidgets.QAction(MainWindow)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.menu_continue.setFont(font)
+        self.menu_continue.setObjectName("menu_continue")
+        self.actionCategorical = QtWidgets.QAction(MainWindow)
+        self.actionCategorical.setObjectName("actionCategorical")
+        self.actionPoint = QtWidgets.QAction(MainWindow)
+        self.actionPoint.setObjectName("actionPoint")
+        self.actionBox = QtWidgets.QAction(MainWindow)
+        self.actionBox.setObjectName("actionBox")
+        self.action_copy = QtWidgets.QAction(MainWindow)
+        self.action_copy.setCheckable(True)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.action_copy.setFont(font)
+        self.action_copy.setObjectName("action_copy")
+        self.actionDICOM = QtWidgets.QAction(MainWindow)
+        self.actionDICOM.setCheckable(True)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.actionDICOM.setFont(font)
+        self.actionDICOM.setObjectName("actionDICOM")
+        self.actionPNG = QtWidgets.QAction(MainWindow)
+        self.actionPNG.setCheckable(True)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        self.actionPNG.setFont(font)
+        self.actionPNG.setObjectName("actionPNG")
+        self.actionJPG = QtWidgets.QAction(MainWindow)
+        self.actionJPG.setObjectName("actionJPG")
+        self.actionPNG_2 = QtWidgets.QAction(MainWindow)
+        self.actionPNG_2.setCheckable(True)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        self.actionPNG_2.setFont(font)
+        self.actionPNG_2.setObjectName("actionPNG_2")
+        self.actionDICOM_2 = QtWidgets.QAction(MainWindow)
+        self.actionDICOM_2.setCheckable(True)
+        self.actionDICOM_2.setChecked(True)
+        self.actionDICOM_2.setObjectName("actionDICOM_2")
+        self.actionCC = QtWidgets.QAction(MainWindow)
+        self.actionCC.setObjectName("actionCC")
+        self.action_threshold = QtWidgets.QAction(MainWindow)
+        self.action_threshold.setCheckable(True)
+        self.action_threshold.setObjectName("action_threshold")
+        self.menuFile_Type.addAction(self.actionPNG)
+        self.menuFile_Type.addAction(self.actionDICOM)
+        self.menuTools.addAction(self.action_copy)
+        self.menuTools.addAction(self.menuFile_Type.menuAction())
+        self.menuTools.addAction(self.action_threshold)
+        self.menubar.addAction(self.menuTools.menuAction())
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.button_jump.setText(_translate("MainWindow", "Jump"))
+        item = self.table.horizontalHeaderItem(0)
+        item.setText(_translate("MainWindow", "Category Name"))
+        self.label_2.setText(_translate("MainWindow", "Operations"))
+        self.checkbox_implants.setText(_translate("MainWindow", "Implants"))
+        self.checkbox_reduction.setText(_translate("MainWindow", "Reduction"))
+        self.checkbox_surgery.setText(_translate("MainWindow", "Surgery"))
+        self.checkbox_other.setText(_translate("MainWindow", "Other"))
+        self.label.setText(_translate("MainWindow", "Object Detection"))
+        self.button_save_roi.setText(_translate("MainWindow", "Save Location"))
+        self.button_finish_location.setText(_translate("MainWindow", "Finish Location"))
+        self.button_skip_step.setText(_translate("MainWindow", "Skip Step"))
+        self.button_skip.setText(_translate("MainWindow", "Skip Image"))
+        self.button_back.setText(_translate("MainWindow", "Back"))
+        self.menuTools.setTitle(_translate("MainWindow", "Settings"))
+        self.menuFile_Type.setTitle(_translate("MainWindow", "File Type"))
+        self.menu_new.setText(_translate("MainWindow", "New Project"))
+        self.menu_continue.setText(_translate("MainWindow", "Continue Project"))
+        self.actionCategorical.setText(_translate("MainWindow", "Categorical"))
+        self.actionPoint.setText(_translate("MainWindow", "Point"))
+        self.actionBox.setText(_translate("MainWindow", "Box"))
+        self.action_copy.setText(_translate("MainWindow", "copy DICOMs"))
+        self.actionDICOM.setText(_translate("MainWindow", "DICOM"))
+        self.actionPNG.setText(_translate("MainWindow", "PNG"))
+        self.actionJPG.setText(_translate("MainWindow", "JPG"))
+        self.actionPNG_2.setText(_translate("MainWindow", "PNG"))
+        self.actionDICOM_2.setText(_translate("MainWindow", "DICOM"))
+        self.actionCC.setText(_translate("MainWindow", "CC"))
+        self.action_threshold.setText(_translate("MainWindow", "Thresholding"))
+from mplwidget import MplWidget
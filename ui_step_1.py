@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'step_1.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(583, 542)
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem)
+        self.label = QtWidgets.QLabel(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        self.label.setMinimumSize(QtCore.QSize(0, 40))
+        self.label.setMaximumSize(QtCore.QSize(16777215, 40))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label.setFont(font)
+        self.label.setAlignment(QtCore.Qt.AlignCenter)
+        self.label.setObjectName("label")
+        self.horizontalLayout.addWidget(self.label)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem1)
+        self.verticalLayout_3.addLayout(self.horizontalLayout)
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.label_7 = QtWidgets.QLabel(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_7.sizePolicy().hasHeightForWidth())
+        self.label_7.setSizePolicy(sizePolicy)
+        self.label_7.setMinimumSize(QtCore.QSize(150, 40))
+        self.label_7.setMaximumSize(QtCore.QSize(100, 40))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_7.setFont(font)
+        self.label_7.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_7.setObjectName("label_7")
+        self.horizontalLayout_8.addWidget(self.label_7)
+        self.line_proj_name = QtWidgets.QLineEdit(Dialog)
+        self.line_proj_name.setMinimumSize(QtCore.QSize(0, 40))
+        self.line_proj_name.setMaximumSize(QtCore.QSize(99999, 40))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.line_proj_name.setFont(font)
+        self.line_proj_name.setObjectName("line_proj_name")
+        self.horizontalLayout_8.addWidget(self.line_proj_name)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_8)
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.label_8 = QtWidgets.QLabel(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_8.sizePolicy().hasHeightForWidth())
+        self.label_8.setSizePolicy(sizePolicy)
+        self.label_8.setMinimumSize(QtCore.QSize(150, 40))
+        self.label_8.setMaximumSize(QtCore.QSize(100, 40))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_8.setFont(font)
+        self.label_8.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_8.setObjectName("label_8")
+        self.horizontalLayout_5.addWidget(self.label_8)
+        self.line_proj_folder = QtWidgets.QLineEdit(Dialog)
+        self.line_proj_folder.setMinimumSize(QtCore.QSize(0, 40))
+        self.line_proj_folder.setMaximumSize(QtCore.QSize(99999, 40))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.line_proj_folder.setFont(font)
+        self.line_proj_folder.setObjectName("line_proj_folder")
+        self.horizontalLayout_5.addWidget(self.line_proj_folder)
+        self.button_browse_project = QtWidgets.QPushButton(Dialog)
+        self.button_browse_project.setMinimumSize(QtCore.QSize(80, 40))
+        self.button_browse_project.setMaximumSize(QtCore.QSize(80, 40))
+        self.button_browse_project.setObjectName("button_browse_project")
+        self.horizontalLayout_5.addWidget(self.button_browse_project)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_5)
+        spacerItem2 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_3.addItem(spacerItem2)
+        self.horizontalLayout_7 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
+        self.label_6 = QtWidgets.QLabel(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_6.sizePolicy().hasHeightForWidth())
+        self.label_6.setSizePolicy(sizePolicy)
+        self.label_6.setMinimumSize(QtCore.QSize(150, 40))
+        self.label_6.setMaximumSize(QtCore.QSize(100, 40))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_6.setFont(font)
+        self.label_6.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_6.setObjectName("label_6")
+        self.horizontalLayout_7.addWidget(self.label_6)
+        self.line_auth_name = QtWidgets.QLineEdit(Dialog)
+        self.line_auth_name.setMinimumSize(QtCore.QSize(0, 40))
+        self.line_auth_name.setMaximumSize(QtCore.QSize(99999, 40))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.line_auth_name.setFont(font)
+        self.line_auth_name.setObjectName("line_auth_name")
+        self.horizontalLayout_7.addWidget(self.line_auth_name)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_7)
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.label_4 = QtWidgets.QLabel(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_4.sizePolicy().hasHeightForWidth())
+        self.label_4.setSizePolicy(sizePolicy)
+        self.label_4.setMinimumSize(QtCore.QSize(150, 40))
+        self.label_4.setMaximumSize(QtCore.QSize(100, 40))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_4.setFont(font)
+        self.label_4.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_4.setObjectName("label_4")
+        self.horizontalLayout_6.addWidget(self.label_4)
+        self.line_institution = QtWidgets.QLineEdit(Dialog)
+        self.line_institution.setMinimumSize(QtCore.QSize(0, 40))
+        self.line_institution.setMaximumSize(QtCore.QSize(99999, 40))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.line_institution.setFont(font)
+        self.line_institution.setObjectName("line_institution")
+        self.horizontalLayout_6.addWidget(self.line_institution)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_6)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_3.addItem(spacerItem3)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.label_9 = QtWidgets.QLabel(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_9.sizePolicy().hasHeightForWidth())
+        self.label_9.setSizePolicy(sizePolicy)
+        self.label_9.setMinimumSize(QtCore.QSize(150, 40))
+        self.label_9.setMaximumSize(QtCore.QSize(100, 40))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_9.setFont(font)
+        self.label_9.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_9.setObjectName("label_9")
+        self.horizontalLayout_2.addWidget(self.label_9)
+        self.radio_dicom = QtWidgets.QRadioButton(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        self.radio_dicom.setFont(font)
+        self.radio_dicom.setChecked(True)
+        self.radio_dicom.setObjectName("radio_dicom")
+        self.horizontalLayout_2.addWidget(self.radio_dicom)
+        self.radio_jpg = QtWidgets.QRadioButton(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        self.radio_jpg.setFont(font)
+        self.radio_jpg.setObjectName("radio_jpg")
+        self.horizontalLayout_2.addWidget(self.radio_jpg)
+        self.radio_png = QtWidgets.QRadioButton(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        self.radio_png.setFont(font)
+        self.radio_png.setObjectName("radio_png")
+        self.horizontalLayout_2.addWidget(self.radio_png)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.label_5 = QtWidgets.QLabel(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_5.sizePolicy().hasHeightForWidth())
+        self.label_5.setSizePolicy(sizePolicy)
+        self.label_5.setMinimumSize(QtCore.QSize(150, 40))
+        self.label_5.setMaximumSize(QtCore.QSize(100, 40))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_5.setFont(font)
+        self.label_5.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_5.setObjectName("label_5")
+        self.horizontalLayout_4.addWidget(self.label_5)
+        self.line_data_folder = QtWidgets.QLineEdit(Dialog)
+        self.line_data_folder.setMinimumSize(QtCore.QSize(0, 40))
+        self.line_data_folder.setMaximumSize(QtCore.QSize(99999, 40))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.line_data_folder.setFont(font)
+        self.line_data_folder.setObjectName("line_data_folder")
+        self.horizontalLayout_4.addWidget(self.line_data_folder)
+        self.button_browse_data = QtWidgets.QPushButton(Dialog)
+        self.button_browse_data.setMinimumSize(QtCore.QSize(80, 40))
+        self.button_browse_data.setMaximumSize(QtCore.QSize(80, 40))
+        self.button_browse_data.setObjectName("button_browse_data")
+        self.horizontalLayout_4.addWidget(self.button_browse_data)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_4)
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.label_10 = QtWidgets.QLabel(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_10.sizePolicy().hasHeightForWidth())
+        self.label_10.setSizePolicy(sizePolicy)
+        self.label_10.setMinimumSize(QtCore.QSize(150, 40))
+        self.label_10.setMaximumSize(QtCore.QSize(100, 40))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_10.setFont(font)
+        self.label_10.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_10.setObjectName("label_10")
+        self.horizontalLayout_9.addWidget(self.label_10)
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.checkbox_cc = QtWidgets.QCheckBox(Dialog)
+        self.checkbox_cc.setMinimumSize(QtCore.QSize(0, 30))
+        self.checkbox_cc.setMaximumSize(QtCore.QSize(16777215, 30))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(14)
+        self.checkbox_cc.setFont(font)
+        self.checkbox_cc.setChecked(True)
+        self.checkbox_cc.setObjectName("checkbox_cc")
+        self.verticalLayout.addWidget(self.checkbox_cc)
+        self.checkbox_mlo = QtWidgets.QCheckBox(Dialog)
+        self.checkbox_mlo.setMinimumSize(QtCore.QSize(0, 30))
+        self.checkbox_mlo.setMaximumSize(QtCore.QSize(16777215, 30))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(14)
+        self.checkbox_mlo.setFont(font)
+        self.checkbox_mlo.setChecked(True)
+        self.checkbox_mlo.setObjectName("checkbox_mlo")
+        self.verticalLayout.addWidget(self.checkbox_mlo)
+        self.horizontalLayout_9.addLayout(self.verticalLayout)
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_9.addItem(spacerItem4)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.checkbox_tomo = QtWidgets.QCheckBox(Dialog)
+        self.checkbox_tomo.setMinimumSize(QtCore.QSize(0, 30))
+        self.checkbox_tomo.setMaximumSize(QtCore.QSize(16777215, 30))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(14)
+        self.checkbox_tomo.setFont(font)
+        self.checkbox_tomo.setChecked(True)
+        self.checkbox_tomo.setObjectName("checkbox_tomo")
+        self.verticalLayout_2.addWidget(self.checkbox_tomo)
+        self.checkbox_mammo = QtWidgets.QCheckBox(Dialog)
+        self.checkbox_mammo.setMinimumSize(QtCore.QSize(0, 30))
+        self.checkbox_mammo.setMaximumSize(QtCore.QSize(16777215, 30))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(14)
+        self.checkbox_mammo.setFont(font)
+        self.checkbox_mammo.setChecked(True)
+        self.checkbox_mammo.setObjectName("checkbox_mammo")
+        self.verticalLayout_2.addWidget(self.checkbox_mammo)
+        self.horizontalLayout_9.addLayout(self.verticalLayout_2)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_9)
+        self.checkbox_decode = QtWidgets.QCheckBox(Dialog)
+        self.checkbox_decode.setMinimumSize(QtCore.QSize(0, 30))
+        self.checkbox_decode.setMaximumSize(QtCore.QSize(16777215, 30))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(14)
+        self.checkbox_decode.setFont(font)
+        self.checkbox_decode.setChecked(False)
+        self.checkbox_decode.setObjectName("checkbox_decode")
+        self.verticalLayout_3.addWidget(self.checkbox_decode)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        spacerItem5 = QtWidgets.QSpacerItem(78, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem5)
+        self.button_cancel = QtWidgets.QPushButton(Dialog)
+        self.button_cancel.setMinimumSize(QtCore.QSize(80, 40))
+        self.button_cancel.setMaximumSize(QtCore.QSize(80, 40))
+        self.button_cancel.setObjectName("button_cancel")
+        self.horizontalLayout_3.addWidget(self.button_cancel)
+        self.button_next = QtWidgets.QPushButton(Dialog)
+        self.button_next.setEnabled(False)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.button_next.sizePolicy().hasHeightForWidth())
+        self.button_next.setSizePolicy(sizePolicy)
+        self.button_next.setMinimumSize(QtCore.QSize(80, 40))
+        self.button_next.setMaximumSize(QtCore.QSize(80, 40))
+        self.button_next.setObjectName("button_next")
+        self.horizontalLayout_3.addWidget(self.button_next)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_3)
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
+        self.label.setText(_translate("Dialog", "New Project"))
+        self.label_7.setText(_translate("Dialog", "Project Name:"))
+        self.label_8.setText(_translate("Dialog", "Project Folder:"))
+        self.button_browse_project.setText(_translate("Dialog", "Browse"))
+        self.label_6.setText(_translate("Dialog", "Author Name:"))
+        self.label_4.setText(_translate("Dialog", "Institution:"))
+        self.label_9.setText(_translate("Dialog", "File Extension:"))
+        self.radio_dicom.setText(_translate("Dialog", "DICOM"))
+        self.radio_jpg.setText(_translate("Dialog", "JPEG"))
+        self.radio_png.setText(_translate("Dialog", "PNG"))
+        self.label_5.setText(_translate("Dialog", "Data Folder:"))
+        self.button_browse_data.setText(_translate("Dialog", "Browse"))
+        self.label_10.setText(_translate("Dialog", "File Filter:"))
+        self.checkbox_cc.setText(_translate("Dialog", "CC"))
+        self.checkbox_mlo.setText(_translate("Dialog", "MLO"))
+        self.checkbox_tomo.setText(_translate("Dialog", "Tomosynthesis"))
+        self.checkbox_mammo.setText(_translate("Dialog", "Mammography"))
+        self.checkbox_decode.setText(_translate("Dialog", "Decode DICOM"))
+        self.button_cancel.setText(_translate("Dialog", "Cancel"))
+        self.button_next.setText(_translate("Dialog", "Next"))
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'step_2.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(432, 479)
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem)
+        self.label = QtWidgets.QLabel(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        self.label.setMinimumSize(QtCore.QSize(0, 40))
+        self.label.setMaximumSize(QtCore.QSize(16777215, 40))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(16)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label.setFont(font)
+        self.label.setAlignment(QtCore.Qt.AlignCenter)
+        self.label.setObjectName("label")
+        self.horizontalLayout.addWidget(self.label)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem1)
+        self.verticalLayout_3.addLayout(self.horizontalLayout)
+        self.check_class = QtWidgets.QCheckBox(Dialog)
+        self.check_class.setMinimumSize(QtCore.QSize(0, 30))
+        self.check_class.setMaximumSize(QtCore.QSize(16777215, 30))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(14)
+        self.check_class.setFont(font)
+        self.check_class.setObjectName("check_class")
+        self.verticalLayout_3.addWidget(self.check_class)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.label_classes = QtWidgets.QLabel(Dialog)
+        self.label_classes.setEnabled(False)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(14)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_classes.setFont(font)
+        self.label_classes.setObjectName("label_classes")
+        self.horizontalLayout_2.addWidget(self.label_classes)
+        self.comboBox = QtWidgets.QComboBox(Dialog)
+        self.comboBox.setEnabled(False)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.comboBox.setFont(font)
+        self.comboBox.setObjectName("comboBox")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.horizontalLayout_2.addWidget(self.comboBox)
+        spacerItem2 = QtWidgets.QSpacerItem(37, 37, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem2)
+        self.checkbox_copy = QtWidgets.QCheckBox(Dialog)
+        self.checkbox_copy.setEnabled(False)
+        self.checkbox_copy.setObjectName("checkbox_copy")
+        self.horizontalLayout_2.addWidget(self.checkbox_copy)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.radio_image = QtWidgets.QRadioButton(Dialog)
+        self.radio_image.setEnabled(False)
+        self.radio_image.setChecked(True)
+        self.radio_image.setObjectName("radio_image")
+        self.buttonGroup_2 = QtWidgets.QButtonGroup(Dialog)
+        self.buttonGroup_2.setObjectName("buttonGroup_2")
+        self.buttonGroup_2.addButton(self.radio_image)
+        self.horizontalLayout_6.addWidget(self.radio_image)
+        self.radio_location = QtWidgets.QRadioButton(Dialog)
+        self.radio_location.setEnabled(False)
+        self.radio_location.setObjectName("radio_location")
+        self.buttonGroup_2.addButton(self.radio_location)
+        self.horizontalLayout_6.addWidget(self.radio_location)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_6)
+        self.line = QtWidgets.QFrame(Dialog)
+        self.line.setMinimumSize(QtCore.QSize(0, 2))
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout_3.addWidget(self.line)
+        self.checkbox_object = QtWidgets.QCheckBox(Dialog)
+        self.checkbox_object.setMinimumSize(QtCore.QSize(0, 30))
+        self.checkbox_object.setMaximumSize(QtCore.QSize(16777215, 30))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(14)
+        self.checkbox_object.setFont(font)
+        self.checkbox_object.setObjectName("checkbox_object")
+        self.verticalLayout_3.addWidget(self.checkbox_object)
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_5.addItem(spacerItem3)
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.radio_point = QtWidgets.QRadioButton(Dialog)
+        self.radio_point.setEnabled(False)
+        self.radio_point.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.radio_point.setFont(font)
+        self.radio_point.setChecked(True)
+        self.radio_point.setObjectName("radio_point")
+        self.buttonGroup = QtWidgets.QButtonGroup(Dialog)
+        self.buttonGroup.setObjectName("buttonGroup")
+        self.buttonGroup.addButton(self.radio_point)
+        self.verticalLayout.addWidget(self.radio_point)
+        self.radio_square = QtWidgets.QRadioButton(Dialog)
+        self.radio_square.setEnabled(False)
+        self.radio_square.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.radio_square.setFont(font)
+        self.radio_square.setChecked(False)
+        self.radio_square.setObjectName("radio_square")
+        self.buttonGroup.addButton(self.radio_square)
+        self.verticalLayout.addWidget(self.radio_square)
+        self.radio_polygon_json = QtWidgets.QRadioButton(Dialog)
+        self.radio_polygon_json.setEnabled(False)
+        self.radio_polygon_json.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.radio_polygon_json.setFont(font)
+        self.radio_polygon_json.setChecked(False)
+        self.radio_polygon_json.setObjectName("radio_polygon_json")
+        self.verticalLayout.addWidget(self.radio_polygon_json)
+        self.radio_polygon_img = QtWidgets.QRadioButton(Dialog)
+        self.radio_polygon_img.setEnabled(False)
+        self.radio_polygon_img.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.radio_polygon_img.setFont(font)
+        self.radio_polygon_img.setChecked(False)
+        self.radio_polygon_img.setObjectName("radio_polygon_img")
+        self.buttonGroup.addButton(self.radio_polygon_img)
+        self.verticalLayout.addWidget(self.radio_polygon_img)
+        self.horizontalLayout_5.addLayout(self.verticalLayout)
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_5.addItem(spacerItem4)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.label_2 = QtWidgets.QLabel(Dialog)
+        self.label_2.setEnabled(False)
+        self.label_2.setMaximumSize(QtCore.QSize(140, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        self.label_2.setFont(font)
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_2.addWidget(self.label_2)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.combo_obj_num = QtWidgets.QComboBox(Dialog)
+        self.combo_obj_num.setEnabled(False)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.combo_obj_num.setFont(font)
+        self.combo_obj_num.setObjectName("combo_obj_num")
+        self.combo_obj_num.addItem("")
+        self.combo_obj_num.addItem("")
+        self.combo_obj_num.addItem("")
+        self.combo_obj_num.addItem("")
+        self.combo_obj_num.addItem("")
+        self.combo_obj_num.addItem("")
+        self.combo_obj_num.addItem("")
+        self.combo_obj_num.addItem("")
+        self.horizontalLayout_4.addWidget(self.combo_obj_num)
+        self.check_unlimited = QtWidgets.QCheckBox(Dialog)
+        self.check_unlimited.setEnabled(False)
+        self.check_unlimited.setMinimumSize(QtCore.QSize(0, 30))
+        self.check_unlimited.setMaximumSize(QtCore.QSize(16777215, 30))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(14)
+        self.check_unlimited.setFont(font)
+        self.check_unlimited.setObjectName("check_unlimited")
+        self.horizontalLayout_4.addWidget(self.check_unlimited)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_4)
+        self.horizontalLayout_5.addLayout(self.verticalLayout_2)
+        spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_5.addItem(spacerItem5)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_5)
+        self.line_2 = QtWidgets.QFrame(Dialog)
+        self.line_2.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.verticalLayout_3.addWidget(self.line_2)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        spacerItem6 = QtWidgets.QSpacerItem(78, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem6)
+        self.button_cancel = QtWidgets.QPushButton(Dialog)
+        self.button_cancel.setMinimumSize(QtCore.QSize(80, 40))
+        self.button_cancel.setMaximumSize(QtCore.QSize(80, 40))
+        self.button_cancel.setObjectName("button_cancel")
+        self.horizontalLayout_3.addWidget(self.button_cancel)
+        self.button_next = QtWidgets.QPushButton(Dialog)
+        self.button_next.setEnabled(True)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.button_next.sizePolicy().hasHeightForWidth())
+        self.button_next.setSizePolicy(sizePolicy)
+        self.button_next.setMinimumSize(QtCore.QSize(80, 40))
+        self.button_next.setMaximumSize(QtCore.QSize(80, 40))
+        self.button_next.setObjectName("button_next")
+        self.horizontalLayout_3.addWidget(self.button_next)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_3)
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
+        self.label.setText(_translate("Dialog", "Select Annotation Type "))
+        self.check_class.setText(_translate("Dialog", "Classification"))
+        self.label_classes.setText(_translate("Dialog", "Number of classes:"))
+        self.comboBox.setItemText(0, _translate("Dialog", "2"))
+        self.comboBox.setItemText(1, _translate("Dialog", "3"))
+        self.comboBox.setItemText(2, _translate("Dialog", "4"))
+        self.comboBox.setItemText(3, _translate("Dialog", "5"))
+        self.comboBox.setItemText(4, _translate("Dialog", "6"))
+        self.comboBox.setItemText(5, _translate("Dialog", "7"))
+        self.comboBox.setItemText(6, _translate("Dialog", "8"))
+        self.checkbox_copy.setText(_translate("Dialog", "Copy Files"))
+        self.radio_image.setText(_translate("Dialog", "classify image"))
+        self.radio_location.setText(_translate("Dialog", "classify each location"))
+        self.checkbox_object.setText(_translate("Dialog", "Object Detection"))
+        self.radio_point.setText(_translate("Dialog", "point"))
+        self.radio_square.setText(_translate("Dialog", "rectangle"))
+        self.radio_polygon_json.setText(_translate("Dialog", "polygon json"))
+        self.radio_polygon_img.setText(_translate("Dialog", "polygon img"))
+        self.label_2.setText(_translate("Dialog", "Number of Objects:"))
+        self.combo_obj_num.setItemText(0, _translate("Dialog", "1"))
+        self.combo_obj_num.setItemText(1, _translate("Dialog", "2"))
+        self.combo_obj_num.setItemText(2, _translate("Dialog", "3"))
+        self.combo_obj_num.setItemText(3, _translate("Dialog", "4"))
+        self.combo_obj_num.setItemText(4, _translate("Dialog", "5"))
+        self.combo_obj_num.setItemText(5, _translate("Dialog", "6"))
+        self.combo_obj_num.setItemText(6, _translate("Dialog", "7"))
+        self.combo_obj_num.setItemText(7, _translate("Dialog", "8"))
+        self.check_unlimited.setText(_translate("Dialog", "unlimited"))
+        self.button_cancel.setText(_translate("Dialog", "Cancel"))
+        self.button_next.setText(_translate("Dialog", "Next"))
@@ -0,0 +1,33 @@
+import numpy as np
+
+
+def intensity_range(data_array):
+    return data_array.min().item(), data_array.max().item()
+
+
+def supports_lut(data_array):
+    return data_array.ndim == 2 and data_array.dtype.kind in 'iu' and data_array.dtype.itemsize <= 2
+
+
+# 8-bit lookup table over every value of the (at most 16-bit) input type, indexed by the raw bit
+# pattern so signed images need no offset pass
+class WindowLUT:
+
+    def __init__(self):
+        self.key = None
+        self.lut = None
+
+    def get(self, dtype, val_min, val_max):
+        key = (dtype.str, val_min, val_max)
+        if key != self.key:
+            unsigned = np.dtype(dtype.str.replace('i', 'u'))
+            values = np.arange(2 ** (8 * dtype.itemsize), dtype=unsigned).view(dtype).astype(np.float32)
+            scale = 255.0 / max(val_max - val_min, 1e-6)
+            self.lut = np.clip((values - val_min) * scale, 0, 255).astype(np.uint8)
+            self.key = key
+        return self.lut
+
+    def apply(self, data_array, val_min, val_max):
+        lut = self.get(data_array.dtype, val_min, val_max)
+        unsigned = data_array.view(data_array.dtype.str.replace('i', 'u'))
+        return np.take(lut, unsigned)
@@ -0,0 +1,85 @@
+import os
+import json
+import time
+import queue
+import threading
+from settings import handle_exceptions
+
+
+# Runs file writes in submission order on one background thread so saving never blocks the GUI.
+# Results are appended to a journal right away and committed to the result store in batches,
+# at most fsync_interval seconds later. A journal left behind by a crash is replayed by
+# ResultStore.replay on the next start.
+class BackgroundWriter:
+
+    def __init__(self, results=None, journal_path=None, fsync_interval=1.0):
+        self.results = results
+        self.fsync_interval = fsync_interval
+        self.journal = open(journal_path, 'a') if journal_path else None
+        self.next_sync = None
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self.run)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def submit(self, func, *args):
+        self.queue.put(('call', func, args))
+
+    def add_result(self, result):
+        self.queue.put(('result', result, None))
+
+    def run(self):
+        while True:
+            timeout = None if self.next_sync is None else max(self.next_sync - time.monotonic(), 0)
+            try:
+                kind, target, args = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                self.sync()
+                continue
+            if kind == 'call':
+                handle_exceptions(target)(*args)
+            elif kind == 'result':
+                self.write_result(target)
+            elif kind == 'flush':
+                self.sync()
+                target.set()
+            elif kind == 'stop':
+                self.sync()
+                break
+            if self.next_sync is not None and time.monotonic() >= self.next_sync:
+                self.sync()
+
+    @handle_exceptions
+    def write_result(self, result):
+        if self.journal is not None:
+            self.journal.write(json.dumps(result) + '\n')
+            self.journal.flush()
+        self.results.add(commit=False, **result)
+        if self.next_sync is None:
+            self.next_sync = time.monotonic() + self.fsync_interval
+
+    @handle_exceptions
+    def sync(self):
+        self.next_sync = None
+        if self.journal is not None:
+            # the journal is on disk before the results are committed, a crash in between
+            # leaves both and the replay skips what is already in the store
+            self.journal.flush()
+            os.fsync(self.journal.fileno())
+        if self.results is not None:
+            self.results.commit()
+        if self.journal is not None:
+            self.journal.seek(0)
+            self.journal.truncate()
+            os.fsync(self.journal.fileno())
+
+    def flush(self):
+        done = threading.Event()
+        self.queue.put(('flush', done, None))
+        done.wait()
+
+    def close(self):
+        self.queue.put(('stop', None, None))
+        self.thread.join()
+        if self.journal is not None:
+            self.journal.close()